@@ -0,0 +1,65 @@
+#!/usr/bin/env python3
+"""
+Import-time budget check
+
+Measures the cost of `import coindcx` and of constructing a Client in a
+fresh interpreter, and fails if either exceeds its budget or if the HTTP
+stack (requests, aiohttp) is loaded before the first request.
+
+Usage:
+    python benchmarks/import_time.py [--runs=5]
+"""
+
+import os
+import subprocess
+import sys
+
+
+# Budgets in milliseconds (best of several runs)
+IMPORT_BUDGET_MS = 15.0
+CLIENT_BUDGET_MS = 40.0
+
+PROBE = """
+import sys, time
+start = time.perf_counter()
+import coindcx
+imported = time.perf_counter()
+coindcx.Client()
+constructed = time.perf_counter()
+heavy = [name for name in ('requests', 'aiohttp') if name in sys.modules]
+print('%f|%f|%s' % ((imported - start) * 1000, (constructed - start) * 1000, ','.join(heavy)))
+"""
+
+
+def measure():
+    """Run the probe in a fresh interpreter"""
+    root = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+    env = dict(os.environ, PYTHONPATH=root + os.pathsep + os.environ.get('PYTHONPATH', ''))
+    output = subprocess.check_output([sys.executable, '-c', PROBE], env=env, text=True)
+    import_ms, client_ms, heavy = output.strip().split('|')
+    return float(import_ms), float(client_ms), [name for name in heavy.split(',') if name]
+
+
+def main():
+    runs = 5
+    for arg in sys.argv[1:]:
+        if arg.startswith('--runs='):
+            runs = int(arg.split('=', 1)[1])
+
+    results = [measure() for _ in range(runs)]
+    import_ms = min(result[0] for result in results)
+    client_ms = min(result[1] for result in results)
+    heavy = sorted({name for result in results for name in result[2]})
+
+    print(f"import coindcx:        {import_ms:6.1f} ms (budget {IMPORT_BUDGET_MS:.0f} ms)")
+    print(f"import + Client():     {client_ms:6.1f} ms (budget {CLIENT_BUDGET_MS:.0f} ms)")
+    print(f"HTTP stack loaded:     {', '.join(heavy) if heavy else 'no'}")
+
+    if import_ms > IMPORT_BUDGET_MS or client_ms > CLIENT_BUDGET_MS or heavy:
+        print("FAIL: import-time budget exceeded")
+        sys.exit(1)
+    print("OK")
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,74 @@
+#!/usr/bin/env python3
+"""
+Microbenchmark for request signing
+
+Compares the per-request overhead of the original signing path (derive the
+key and encode the payload on every call) with the precomputed Signer.
+
+Usage:
+    python benchmarks/signing.py [--number=200000]
+"""
+
+import hashlib
+import hmac
+import json
+import os
+import sys
+import timeit
+
+# Run from a source checkout without installing the package
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from coindcx import Signer  # noqa: E402
+
+
+SECRET = 'a' * 64
+PAYLOAD = json.dumps(
+    {
+        'side': 'buy',
+        'order_type': 'limit_order',
+        'market': 'BTCUSDT',
+        'price_per_unit': 50000.5,
+        'total_quantity': 0.001,
+        'timestamp': 1700000000000,
+        'client_order_id': '2022.02.14-btcinr_1',
+    },
+    separators=(',', ':'),
+)
+PAYLOAD_BYTES = PAYLOAD.encode()
+
+
+def legacy_sign(secret: str, payload: str) -> str:
+    """Signing path used before Signer: key and encode on every call"""
+    secret_bytes = bytes(secret, encoding='utf-8')
+    return hmac.new(secret_bytes, payload.encode(), hashlib.sha256).hexdigest()
+
+
+def main():
+    number = 200000
+    for arg in sys.argv[1:]:
+        if arg.startswith('--number='):
+            number = int(arg.split('=', 1)[1])
+
+    signer = Signer(SECRET)
+    assert signer.sign(PAYLOAD_BYTES) == legacy_sign(SECRET, PAYLOAD)
+
+    batch = [PAYLOAD_BYTES] * 100
+    cases = [
+        ('legacy hmac.new per request', lambda: legacy_sign(SECRET, PAYLOAD)),
+        ('Signer.sign (bytes)', lambda: signer.sign(PAYLOAD_BYTES)),
+        ('Signer.sign_many (per payload)', lambda: signer.sign_many(batch)),
+    ]
+
+    print(f"{'case':<34} {'ns/op':>10}")
+    print('-' * 45)
+    for name, func in cases:
+        runs = number // 100 if 'sign_many' in name else number
+        per_call = min(timeit.repeat(func, number=runs, repeat=5)) / runs
+        if 'sign_many' in name:
+            per_call /= len(batch)
+        print(f"{name:<34} {per_call * 1e9:>10.0f}")
+
+
+if __name__ == '__main__':
+    main()
@@ -110,13 +110,33 @@ def get_client_methods():
         # Skip private methods and special methods
         if name.startswith('_'):
             continue
-        # Skip context manager methods
-        if name in ('close', '__enter__', '__exit__'):
+        # Skip context manager and connection management methods
+        if name in ('close', 'warmup', 'batch', 'batch_stream', '__enter__', '__exit__'):
             continue
         methods[name] = method
     return methods
 
 
+def get_client_method(name):
+    """
+    Look up a single public Client method by name
+
+    Avoids inspecting every Client method when only one is needed.
+
+    Args:
+        name: Method name
+
+    Returns:
+        Method object, or None if it is not a CLI-callable method
+    """
+    if name.startswith('_') or name in ('close', 'warmup', 'batch', 'batch_stream'):
+        return None
+    method = getattr(Client, name, None)
+    if not inspect.isfunction(method):
+        return None
+    return method
+
+
 def get_method_info(method):
     """
     Extract information about a method including parameters and types
@@ -253,21 +273,19 @@ def main():
         print_help()
         sys.exit(1)
 
-    # Get available methods
-    methods = get_client_methods()
-
     # Parse arguments
     method_name, method_args, client_options = parse_args(sys.argv[1:])
 
     # Check if method exists
-    if method_name not in methods:
+    method = get_client_method(method_name)
+    if method is None:
+        methods = get_client_methods()
         print(f"Error: Unknown method '{method_name}'")
         print(f"\nAvailable methods: {', '.join(sorted(methods.keys()))}")
         print("\nRun 'python cli.py --help' for more information")
         sys.exit(1)
 
     # Get method info
-    method = methods[method_name]
     method_info = get_method_info(method)
 
     # Convert and validate arguments
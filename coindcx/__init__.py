@@ -20,12 +20,19 @@ Example:
     # Authenticated endpoints
     client = Client(api_key='your_key', api_secret='your_secret')
     balances = client.get_balances()
+
+    # Asyncio (requires aiohttp)
+    from coindcx import AsyncClient
+
+    async with AsyncClient() as client:
+        ticker = await client.get_ticker()
 """
 
 __version__ = '0.1.1'
 __author__ = 'Sanjay Vamja'
 
-from .client import Client
+import importlib
+
 from .exceptions import (
     CoinDCXException,
     CoinDCXAPIException,
@@ -50,11 +57,127 @@ from .enums import (
     FuturesResolution,
     PositionMarginType,
     NotificationType,
+    StreamEvent,
 )
 
+# Names resolved on first access, so `import coindcx` stays cheap and the
+# HTTP stack is only loaded by code that actually uses a client
+_LAZY_IMPORTS = {
+    'Client': '.client',
+    'AsyncClient': '.async_client',
+    'RateLimiter': '.ratelimit',
+    'TokenBucket': '.ratelimit',
+    'DEFAULT_RATE_LIMITS': '.ratelimit',
+    'GENERAL_RATE_LIMITS': '.ratelimit',
+    'RetryPolicy': '.retry',
+    'TTLCache': '.cache',
+    'DEFAULT_CACHE_TTLS': '.cache',
+    'SingleFlight': '.singleflight',
+    'JSONCodec': '.codec',
+    'OrjsonCodec': '.codec',
+    'get_codec': '.codec',
+    'Signer': '.signing',
+    'RequestInfo': '.metrics',
+    'RequestMetrics': '.metrics',
+    'LatencyHistogram': '.metrics',
+    'CANDLE_INTERVAL_MS': '.candles',
+    'FUTURES_RESOLUTION_SECONDS': '.candles',
+    'interval_ms': '.candles',
+    'resolution_seconds': '.candles',
+    'split_range': '.candles',
+    'merge_candles': '.candles',
+    'find_gaps': '.candles',
+    'CANDLE_FIELDS': '.candles',
+    'candle_dtype': '.candles',
+    'candles_to_arrays': '.candles',
+    'CandleStore': '.store',
+    'resample_candles': '.resample',
+    'CandleResampler': '.resample',
+    'TickerTracker': '.ticker',
+    'OrderBook': '.orderbook',
+    'LocalOrderBook': '.depth',
+    'TradeTape': '.trades',
+    'MarketRules': '.markets',
+    'MarketIndex': '.markets',
+    'Stream': '.stream',
+    'AsyncStream': '.stream',
+    'Subscription': '.stream',
+    'LatestSubscription': '.stream',
+    'FuturesAccount': '.account',
+    'EventQueue': '.backpressure',
+    'AsyncEventQueue': '.backpressure',
+}
+
+
+def __getattr__(name):
+    module_name = _LAZY_IMPORTS.get(name)
+    if module_name is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+    value = getattr(importlib.import_module(module_name, __name__), name)
+    globals()[name] = value
+    return value
+
+
+def __dir__():
+    return sorted(set(globals()) | set(_LAZY_IMPORTS))
+
+
 __all__ = [
     # Client
     'Client',
+    'AsyncClient',
+    # Rate limiting
+    'RateLimiter',
+    'TokenBucket',
+    'DEFAULT_RATE_LIMITS',
+    'GENERAL_RATE_LIMITS',
+    # Retries
+    'RetryPolicy',
+    # Caching
+    'TTLCache',
+    'DEFAULT_CACHE_TTLS',
+    'SingleFlight',
+    # JSON codecs
+    'JSONCodec',
+    'OrjsonCodec',
+    'get_codec',
+    # Signing
+    'Signer',
+    # Metrics
+    'RequestInfo',
+    'RequestMetrics',
+    'LatencyHistogram',
+    # Candles
+    'CANDLE_INTERVAL_MS',
+    'FUTURES_RESOLUTION_SECONDS',
+    'interval_ms',
+    'resolution_seconds',
+    'split_range',
+    'merge_candles',
+    'find_gaps',
+    'CANDLE_FIELDS',
+    'candle_dtype',
+    'candles_to_arrays',
+    'CandleStore',
+    'resample_candles',
+    'CandleResampler',
+    # Market data
+    'TickerTracker',
+    'OrderBook',
+    'LocalOrderBook',
+    'TradeTape',
+    # Market rules
+    'MarketRules',
+    'MarketIndex',
+    # Streams
+    'Stream',
+    'AsyncStream',
+    'Subscription',
+    'LatestSubscription',
+    'FuturesAccount',
+    'EventQueue',
+    'AsyncEventQueue',
     # Exceptions
     'CoinDCXException',
     'CoinDCXAPIException',
@@ -78,4 +201,5 @@ __all__ = [
     'FuturesResolution',
     'PositionMarginType',
     'NotificationType',
+    'StreamEvent',
 ]
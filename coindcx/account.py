@@ -0,0 +1,331 @@
+"""
+CoinDCX Futures Account State
+
+Positions, open orders and balances kept current from the private
+df-position-update, df-order-update and balance-update stream events,
+starting from a REST snapshot.
+"""
+
+import time
+from collections import OrderedDict
+from typing import Any, Callable, Dict, List, Optional
+
+from .depth import decode_event
+from .endpoints.utils import then
+from .enums import StreamEvent
+
+
+# Private channel carrying account events; joining it requires a signature
+PRIVATE_CHANNEL = 'coindcx'
+
+ACCOUNT_EVENTS = (
+    StreamEvent.DF_POSITION_UPDATE.value,
+    StreamEvent.DF_ORDER_UPDATE.value,
+    StreamEvent.BALANCE_UPDATE.value,
+)
+
+# Live order states loaded by the snapshot
+_OPEN_ORDER_STATUSES = 'open,partially_filled,untriggered'
+
+# Orders in these states are finished and dropped from the open orders
+_CLOSED_ORDER_STATUSES = frozenset(('filled', 'cancelled', 'rejected', 'partially_cancelled'))
+
+# Closed order IDs remembered, so a stale snapshot cannot reopen them
+_CLOSED_ORDERS_KEPT = 1000
+
+# Most pages of positions or orders loaded by one snapshot
+_MAX_SNAPSHOT_PAGES = 50
+
+
+def parse_account_event(event: str, payload: Any, loads: Optional[Callable[[Any], Any]] = None) -> List[Dict[str, Any]]:
+    """
+    Turn a private account event into REST response records
+
+    Position and order events carry the same records as list_positions()
+    and list_futures_orders(). Balance events carry futures wallet balances
+    as in get_futures_wallets(), with 'currency_short_name' also copied to
+    'currency'.
+
+    Args:
+        event: 'df-position-update', 'df-order-update' or 'balance-update'
+        payload: Event payload as received from the stream, or its decoded
+            message
+        loads (optional): JSON decoder for string payloads
+
+    Returns:
+        List of position, order or balance dicts
+    """
+    records = decode_event(payload, loads)
+    if records is None:
+        return []
+    if isinstance(records, dict):
+        records = [records]
+    if event == StreamEvent.BALANCE_UPDATE.value:
+        for record in records:
+            if 'currency' not in record and 'currency_short_name' in record:
+                record['currency'] = record['currency_short_name']
+    return records
+
+
+def _newer(record: Dict[str, Any], stored: Optional[Dict[str, Any]]) -> bool:
+    """Whether record is at least as recent as the stored version"""
+    if stored is None:
+        return True
+    updated, previous = record.get('updated_at'), stored.get('updated_at')
+    return updated is None or previous is None or updated >= previous
+
+
+class FuturesAccount:
+    """
+    Futures positions, open orders and balances from the private stream
+
+    Load a snapshot with sync() (list_positions, list_futures_orders and
+    get_futures_wallets through the client) and feed every account event to
+    handle(). Position and order events older than the stored record (by
+    updated_at) are ignored, and a snapshot keeps any record that an event
+    updated more recently - including records created by events while the
+    snapshot was in flight - so a slow snapshot does not roll state back.
+    Positions and orders are paged through size records at a time, up to
+    50 pages each.
+    Filled, cancelled and rejected orders leave open_orders once their
+    final update arrives.
+
+    Usually created by Stream.futures_account(), which also resyncs it
+    after every reconnect.
+
+    Args:
+        client (Client, optional): Authenticated client used by sync()
+        margin_currencies (list, optional): Margin currencies to load.
+            Default: ['USDT']
+        size (int, optional): Records per REST page in sync(); further
+            pages are requested while pages come back full. Default: 100
+        on_change (callable, optional): Called as on_change(event, records)
+            after each applied event
+
+    Example:
+        >>> stream = Stream(client=Client(api_key='...', api_secret='...'))
+        >>> account = stream.futures_account()
+        >>> stream.connect()
+        >>> account.position('B-BTC_USDT')['active_pos']
+        >>> account.open_orders
+    """
+
+    channel = PRIVATE_CHANNEL
+
+    def __init__(
+        self,
+        client: Optional[Any] = None,
+        margin_currencies: Optional[List[str]] = None,
+        size: int = 100,
+        on_change: Optional[Callable[[str, List[Dict[str, Any]]], Any]] = None,
+    ):
+        self.client = client
+        self.margin_currencies = list(margin_currencies or ['USDT'])
+        self.size = size
+        self.on_change = on_change
+
+        self.positions: Dict[str, Dict[str, Any]] = {}
+        self.orders: Dict[str, Dict[str, Any]] = {}
+        self.balances: Dict[str, Dict[str, Any]] = {}
+        self._closed: 'OrderedDict[str, Any]' = OrderedDict()
+        # When the last snapshot was requested, in ms like updated_at
+        self._sync_started: Optional[float] = None
+        self.synced = False
+        self.updates = 0
+        self.resyncs = 0
+
+    def sync(self) -> Any:
+        """
+        Load positions, live orders and futures wallet balances from the REST API
+
+        Returns:
+            None (an awaitable with an AsyncClient)
+
+        Raises:
+            ValueError: If the account has no client
+        """
+        if self.client is None:
+            raise ValueError("FuturesAccount has no client to load a snapshot with")
+
+        self._sync_started = time.time() * 1000
+        lists = [
+            ('list_positions', ()),
+            ('list_futures_orders', ('buy', _OPEN_ORDER_STATUSES)),
+            ('list_futures_orders', ('sell', _OPEN_ORDER_STATUSES)),
+        ]
+        calls = [(name, args, self._page_options(1)) for name, args in lists]
+        calls.append(('get_futures_wallets', (), {}))
+
+        def first_page(results: List[Any]) -> Any:
+            collected = [[], [], [], results[-1]]
+            return self._on_page(lists, 1, [0, 1, 2], results[:-1], collected)
+
+        return then(self.client.batch(calls, len(calls), False), first_page)
+
+    def _page_options(self, page: int) -> Dict[str, Any]:
+        """Keyword arguments of list_positions/list_futures_orders for one page"""
+        return {'page': page, 'size': self.size, 'margin_currency_short_name': self.margin_currencies}
+
+    def _on_page(
+        self,
+        lists: List[Any],
+        page: int,
+        pending: List[int],
+        results: List[Any],
+        collected: List[Any],
+    ) -> Any:
+        """Collect one page of each pending list, then fetch the next page of the full ones"""
+        full = []
+        for index, records in zip(pending, results):
+            records = list(records or ())
+            collected[index].extend(records)
+            if len(records) >= self.size:
+                full.append(index)
+        if not full or page >= _MAX_SNAPSHOT_PAGES:
+            return self._on_snapshot(collected)
+
+        calls = [(lists[index][0], lists[index][1], self._page_options(page + 1)) for index in full]
+        return then(
+            self.client.batch(calls, len(calls), False),
+            lambda more: self._on_page(lists, page + 1, full, more, collected),
+        )
+
+    def _updated_since_sync(self, record: Dict[str, Any]) -> bool:
+        """Whether an event updated record after the running snapshot was requested"""
+        updated = record.get('updated_at')
+        return updated is not None and self._sync_started is not None and updated >= self._sync_started
+
+    def _on_snapshot(self, results: List[Any]):
+        """Replace the state with a snapshot, keeping records updated since"""
+        positions, buys, sells, balances = results
+        previous_positions, previous_orders = self.positions, self.orders
+        self.positions, self.orders, self.balances = {}, {}, {}
+
+        for record in positions or ():
+            key = record.get('id') or record.get('pair')
+            stored = previous_positions.get(key)
+            self.positions[key] = record if _newer(record, stored) else stored
+        for record in list(buys or ()) + list(sells or ()):
+            stored = previous_orders.get(record.get('id'))
+            if stored is not None and not _newer(record, stored):
+                record = stored
+            self._apply_order(record)
+        for record in balances or ():
+            self._apply_balance(record)
+
+        # Records that events created or changed while the snapshot was in flight
+        for key, stored in previous_positions.items():
+            if key not in self.positions and self._updated_since_sync(stored):
+                self.positions[key] = stored
+        for key, stored in previous_orders.items():
+            if key not in self.orders and self._updated_since_sync(stored):
+                self._apply_order(stored)
+        self.synced = True
+
+    def resync(self) -> Any:
+        """
+        Reload the snapshot after events may have been missed
+
+        Returns:
+            None (an awaitable with an AsyncClient)
+        """
+        self.synced = False
+        self.resyncs += 1
+        if self.client is None:
+            return None
+        return self.sync()
+
+    def _apply_position(self, record: Dict[str, Any]):
+        """Store a position unless the stored one is newer"""
+        key = record.get('id') or record.get('pair')
+        if _newer(record, self.positions.get(key)):
+            self.positions[key] = record
+
+    def _apply_order(self, record: Dict[str, Any]):
+        """
+        Store an open order, or move a finished one to the closed tombstones
+
+        Closed order IDs are remembered (up to _CLOSED_ORDERS_KEPT), so an
+        older open record - from a stale snapshot or a late event - cannot
+        bring a filled or cancelled order back into open_orders.
+        """
+        key = record.get('id')
+        stored = self.orders.get(key)
+        if not _newer(record, stored):
+            return
+        if key in self._closed and not _newer(record, self._closed[key]):
+            return
+        if record.get('status') in _CLOSED_ORDER_STATUSES:
+            self.orders.pop(key, None)
+            self._closed[key] = record
+            if len(self._closed) > _CLOSED_ORDERS_KEPT:
+                self._closed.popitem(last=False)
+        else:
+            self.orders[key] = record
+
+    def _apply_balance(self, record: Dict[str, Any]):
+        """Store a futures wallet balance by currency"""
+        currency = record.get('currency') or record.get('currency_short_name')
+        self.balances[currency] = record
+
+    def handle(self, event: str, payload: Any) -> List[Dict[str, Any]]:
+        """
+        Apply an account stream event
+
+        Args:
+            event: 'df-position-update', 'df-order-update' or
+                'balance-update'; others are ignored
+            payload: Event payload or its parsed records
+
+        Returns:
+            The event's records, as returned by parse_account_event
+        """
+        event = getattr(event, 'value', event)
+        if event not in ACCOUNT_EVENTS:
+            return []
+        records = parse_account_event(event, payload)
+
+        if event == StreamEvent.DF_POSITION_UPDATE.value:
+            apply = self._apply_position
+        elif event == StreamEvent.DF_ORDER_UPDATE.value:
+            apply = self._apply_order
+        else:
+            apply = self._apply_balance
+        for record in records:
+            apply(record)
+        self.updates += 1
+
+        if self.on_change is not None:
+            self.on_change(event, records)
+        return records
+
+    def position(self, pair: str) -> Optional[Dict[str, Any]]:
+        """
+        Get the position of a pair
+
+        Args:
+            pair: Futures pair (e.g., 'B-BTC_USDT')
+
+        Returns:
+            Position dict as in list_positions(), or None
+        """
+        for position in self.positions.values():
+            if position.get('pair') == pair:
+                return position
+        return None
+
+    @property
+    def open_orders(self) -> List[Dict[str, Any]]:
+        """Open orders as in list_futures_orders(), oldest first"""
+        return sorted(self.orders.values(), key=lambda order: order.get('created_at') or 0)
+
+    def balance(self, currency: str) -> Optional[Dict[str, Any]]:
+        """Get the futures wallet balance of a currency (e.g., 'USDT'), or None"""
+        return self.balances.get(currency)
+
+    def __repr__(self):
+        state = 'synced' if self.synced else 'stale'
+        return (
+            f"FuturesAccount({state} positions={len(self.positions)} "
+            f"open_orders={len(self.orders)} balances={len(self.balances)})"
+        )
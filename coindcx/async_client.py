@@ -0,0 +1,417 @@
+"""
+CoinDCX Async API Client
+
+An asyncio variant of Client built on aiohttp. Every endpoint method has the
+same name and arguments as on Client, but returns an awaitable.
+"""
+
+import asyncio
+import time
+from enum import Enum
+from typing import Any, AsyncIterator, Dict, Iterable, List, Optional, Sequence, Tuple
+
+from .cache import request_key
+from .client import Client
+from .exceptions import CoinDCXException, CoinDCXRequestException
+from .metrics import RequestInfo
+
+
+class AsyncClient(Client):
+    """
+    CoinDCX asyncio API Client
+
+    Mirrors Client method for method, reusing the same endpoint classes with
+    async request handlers. One event loop can keep many requests in flight
+    over a single pooled aiohttp session.
+
+    Requires the optional aiohttp dependency: pip install coindcx[async]
+
+    Args:
+        connection_limit (int, optional): Maximum number of simultaneous
+            connections in the aiohttp pool. Default: 100
+        connection_limit_per_host (int, optional): Maximum simultaneous
+            connections per host. Default: 0 (no per-host cap)
+        **kwargs: Same arguments as Client (api_key, api_secret, base_url,
+            public_url, timeout, rate_limiter, retry_policy, cache, single_flight,
+            json_codec, metrics, pre_request_hooks, post_request_hooks,
+            keep_alive).
+            The requests-specific pool_connections, pool_maxsize and
+            pool_block options are ignored.
+
+    Example:
+        import asyncio
+        from coindcx import AsyncClient
+
+        async def main():
+            async with AsyncClient() as client:
+                books = await asyncio.gather(*[
+                    client.get_orderbook(pair)
+                    for pair in ('B-BTC_USDT', 'B-ETH_USDT')
+                ])
+
+        asyncio.run(main())
+    """
+
+    def __init__(
+        self,
+        *args,
+        connection_limit: int = 100,
+        connection_limit_per_host: int = 0,
+        **kwargs
+    ):
+        self.connection_limit = connection_limit
+        self.connection_limit_per_host = connection_limit_per_host
+        super().__init__(*args, **kwargs)
+
+    def _create_session(self) -> Any:
+        """
+        Create the aiohttp session used for all requests
+
+        aiohttp sessions must be created inside a running event loop; the
+        session property defers this call until the first request.
+
+        Returns:
+            aiohttp ClientSession object
+        """
+        try:
+            import aiohttp
+        except ImportError:
+            raise ImportError(
+                "AsyncClient requires aiohttp. Install it with: pip install coindcx[async]"
+            )
+
+        return aiohttp.ClientSession(
+            connector=aiohttp.TCPConnector(
+                limit=self.connection_limit,
+                limit_per_host=self.connection_limit_per_host,
+                force_close=not self.keep_alive,
+            ),
+            timeout=aiohttp.ClientTimeout(total=self.timeout),
+        )
+
+    def _get_session(self) -> Any:
+        """
+        Get the aiohttp session, recreating it if it was closed
+
+        Returns:
+            aiohttp ClientSession object
+        """
+        if self._session is not None and self._session.closed:
+            self._session = None
+        return self.session
+
+    async def warmup(self, connections: int = 1):
+        """
+        Open connections to the API and public hosts ahead of the first request
+
+        Args:
+            connections: Number of connections to open per host (default: 1)
+
+        Raises:
+            CoinDCXRequestException: If a host cannot be reached
+        """
+        import aiohttp
+
+        session = self._get_session()
+
+        async def _head(url):
+            try:
+                async with session.head(url):
+                    pass
+            except (aiohttp.ClientError, asyncio.TimeoutError) as e:
+                raise CoinDCXRequestException(f"Warmup failed for {url}: {str(e)}")
+
+        await asyncio.gather(*[
+            _head(url)
+            for url in self._warmup_hosts()
+            for _ in range(max(1, connections))
+        ])
+
+    @staticmethod
+    def _encode_params(params: Optional[Dict[str, Any]]) -> Optional[Dict[str, Any]]:
+        """
+        Convert query parameters to types accepted by aiohttp
+
+        Args:
+            params: URL parameters
+
+        Returns:
+            Parameters with enums replaced by their values and booleans lowercased
+        """
+        if params is None:
+            return None
+
+        encoded = {}
+        for key, value in params.items():
+            if isinstance(value, Enum):
+                value = value.value
+            elif isinstance(value, bool):
+                value = 'true' if value else 'false'
+            encoded[key] = value
+
+        return encoded
+
+    async def _request(
+        self,
+        method: str,
+        endpoint: str,
+        authenticated: bool = False,
+        params: Optional[Dict[str, Any]] = None,
+        data: Optional[Dict[str, Any]] = None,
+        use_public_url: bool = False,
+    ) -> Any:
+        """
+        Internal coroutine to make HTTP requests
+
+        Mirrors Client._request: cacheable GETs are served from the cache,
+        identical public GETs are coalesced when single_flight is enabled,
+        and transient failures are retried per retry_policy.
+
+        Args:
+            method: HTTP method (GET, POST, etc.)
+            endpoint: API endpoint path
+            authenticated: Whether this is an authenticated request
+            params: URL parameters for GET requests
+            data: Request body for POST requests
+            use_public_url: Use public URL instead of main API URL
+
+        Returns:
+            JSON response from the API
+
+        Raises:
+            CoinDCXAuthenticationException: If authentication is required but credentials not provided
+            CoinDCXRateLimitException: If rate limit is exceeded
+            CoinDCXAPIException: For API errors
+            CoinDCXRequestException: For network/request errors
+        """
+        cache_key, ttl = self._cache_lookup_key(method, endpoint, params, use_public_url)
+        if cache_key is not None:
+            found, cached = self.cache.get(cache_key)
+            if found:
+                return cached
+
+        if self.single_flight is not None and method == 'GET' and not authenticated:
+            base = self.public_url if use_public_url else self.base_url
+            result = await self.single_flight.do_async(
+                request_key(base, endpoint, params),
+                lambda: self._request_with_retries(
+                    method, endpoint, authenticated, params, data, use_public_url
+                ),
+            )
+        else:
+            result = await self._request_with_retries(
+                method, endpoint, authenticated, params, data, use_public_url
+            )
+
+        if cache_key is not None:
+            self.cache.set(cache_key, result, ttl)
+
+        return result
+
+    async def _request_with_retries(
+        self,
+        method: str,
+        endpoint: str,
+        authenticated: bool = False,
+        params: Optional[Dict[str, Any]] = None,
+        data: Optional[Dict[str, Any]] = None,
+        use_public_url: bool = False,
+    ) -> Any:
+        """
+        Send a request, retrying transient failures per retry_policy
+
+        Args:
+            method: HTTP method (GET, POST, etc.)
+            endpoint: API endpoint path
+            authenticated: Whether this is an authenticated request
+            params: URL parameters for GET requests
+            data: Request body for POST requests
+            use_public_url: Use public URL instead of main API URL
+
+        Returns:
+            JSON response from the API
+        """
+        attempt = 0
+        while True:
+            attempt_data = dict(data) if data is not None else None
+            try:
+                return await self._send_request(
+                    method, endpoint, authenticated, params, attempt_data, use_public_url
+                )
+            except CoinDCXException as e:
+                if self.retry_policy is None:
+                    raise
+                delay = self.retry_policy.get_delay(e, attempt, method, endpoint, data)
+                if delay is None:
+                    raise
+
+            await asyncio.sleep(delay)
+            attempt += 1
+
+    async def _send_request(
+        self,
+        method: str,
+        endpoint: str,
+        authenticated: bool = False,
+        params: Optional[Dict[str, Any]] = None,
+        data: Optional[Dict[str, Any]] = None,
+        use_public_url: bool = False,
+    ) -> Any:
+        """
+        Send a single HTTP request, without retries
+
+        Args:
+            method: HTTP method (GET, POST, etc.)
+            endpoint: API endpoint path
+            authenticated: Whether this is an authenticated request
+            params: URL parameters for GET requests
+            data: Request body for POST requests
+            use_public_url: Use public URL instead of main API URL
+
+        Returns:
+            JSON response from the API
+        """
+        import aiohttp
+
+        if self.rate_limiter is not None:
+            await self.rate_limiter.acquire_async(endpoint)
+
+        info = RequestInfo(method, endpoint, authenticated, params)
+        started = time.perf_counter()
+
+        url, headers, json_body = self._prepare_request(
+            endpoint, authenticated=authenticated, data=data, use_public_url=use_public_url
+        )
+        session = self._get_session()
+
+        sent = time.perf_counter()
+        info.url = url
+        info.sign_time = sent - started
+        info.bytes_out = len(json_body) if json_body else 0
+        for hook in self.pre_request_hooks:
+            hook(info)
+
+        try:
+            if authenticated:
+                request = session.request(method, url, headers=headers, data=json_body)
+            else:
+                request = session.request(
+                    method, url, headers=headers, params=self._encode_params(params)
+                )
+
+            async with request as response:
+                status_code = response.status
+                response_headers = response.headers
+                content = await response.read()
+        except (aiohttp.ClientError, asyncio.TimeoutError) as e:
+            info.network_time = time.perf_counter() - sent
+            info.error = CoinDCXRequestException(f"Request failed: {str(e)}")
+            self._finish_request(info)
+            raise info.error
+
+        received = time.perf_counter()
+        info.network_time = received - sent
+        info.status_code = status_code
+        info.bytes_in = len(content)
+
+        try:
+            return self._parse_response(status_code, content, response_headers)
+        except CoinDCXException as e:
+            info.error = e
+            raise
+        finally:
+            info.decode_time = time.perf_counter() - received
+            self._finish_request(info)
+
+    async def batch(
+        self,
+        calls: Iterable[Sequence],
+        max_concurrency: int = 32,
+        return_exceptions: bool = True,
+    ) -> List[Any]:
+        """
+        Run many client calls concurrently on the event loop
+
+        Args:
+            calls: Call descriptions, each (method_name, kwargs),
+                (method_name, args, kwargs) or just method_name
+            max_concurrency: Maximum calls in flight at once (default: 32)
+            return_exceptions: Put exceptions in the result list instead of
+                raising (default: True)
+
+        Returns:
+            List of results (or exceptions) in input order
+
+        Raises:
+            ValueError: If a call description is invalid
+            CoinDCXException: The first failure, if return_exceptions is False
+        """
+        resolved = [self._resolve_call(call) for call in calls]
+        semaphore = asyncio.Semaphore(max(1, max_concurrency))
+
+        async def _run(method, args, kwargs):
+            async with semaphore:
+                return await method(*args, **kwargs)
+
+        return await asyncio.gather(
+            *[_run(method, args, kwargs) for method, args, kwargs in resolved],
+            return_exceptions=return_exceptions,
+        )
+
+    async def batch_stream(
+        self,
+        calls: Iterable[Sequence],
+        max_concurrency: int = 32,
+    ) -> AsyncIterator[Tuple[int, Any]]:
+        """
+        Run many client calls concurrently, yielding results as they finish
+
+        Args:
+            calls: Call descriptions, as for batch()
+            max_concurrency: Maximum calls in flight at once (default: 32)
+
+        Yields:
+            Tuples of (input index, result or exception) in completion order
+        """
+        resolved = [self._resolve_call(call) for call in calls]
+        semaphore = asyncio.Semaphore(max(1, max_concurrency))
+
+        async def _run(index, method, args, kwargs):
+            async with semaphore:
+                try:
+                    return index, await method(*args, **kwargs)
+                except Exception as e:
+                    return index, e
+
+        tasks = [
+            asyncio.ensure_future(_run(index, method, args, kwargs))
+            for index, (method, args, kwargs) in enumerate(resolved)
+        ]
+        try:
+            for next_done in asyncio.as_completed(tasks):
+                yield await next_done
+        finally:
+            for task in tasks:
+                task.cancel()
+
+    async def close(self):
+        """Close the client session"""
+        if self._session is not None:
+            await self._session.close()
+            self._session = None
+
+    def __enter__(self):
+        """Reject the sync context manager; use 'async with' instead"""
+        raise TypeError("Use 'async with AsyncClient()' instead of 'with'")
+
+    def __exit__(self, exc_type, exc_val, exc_tb):
+        """Sync context manager exit (never reached)"""
+        pass
+
+    async def __aenter__(self):
+        """Async context manager entry"""
+        return self
+
+    async def __aexit__(self, exc_type, exc_val, exc_tb):
+        """Async context manager exit"""
+        await self.close()
@@ -0,0 +1,321 @@
+"""
+CoinDCX Stream Backpressure
+
+Bounded event queues with an overflow policy, used to decouple each stream
+subscriber from the shared connection, plus queue depth and lag metrics.
+"""
+
+import asyncio
+import itertools
+import queue
+import threading
+import time
+from collections import OrderedDict
+from typing import Any, Callable, Dict, Hashable, Optional, Tuple
+
+from .metrics import LatencyHistogram
+
+
+BLOCK = 'block'
+DROP_OLDEST = 'drop_oldest'
+CONFLATE = 'conflate'
+
+POLICIES = (BLOCK, DROP_OLDEST, CONFLATE)
+
+DEFAULT_QUEUE_SIZE = 10000
+
+
+def event_key(item: Tuple[str, Any]) -> Hashable:
+    """
+    Default conflate key of an (event, message) stream item
+
+    Messages of one event name are conflated per symbol ('s') and candle
+    interval ('i') when they carry them, otherwise per event name.
+    """
+    event, message = item
+    if isinstance(message, dict):
+        return (event, message.get('s'), message.get('i'))
+    return (event, None, None)
+
+
+class _QueueCore:
+    """
+    Policy logic shared by the thread and asyncio queues
+
+    Items live in an OrderedDict: under the conflate policy keyed by the
+    item's key, so a newer item replaces the pending one in place;
+    otherwise keyed by a counter, which makes it a plain FIFO.
+    """
+
+    def __init__(
+        self,
+        maxsize: int = DEFAULT_QUEUE_SIZE,
+        policy: str = DROP_OLDEST,
+        key: Optional[Callable[[Any], Hashable]] = None,
+    ):
+        if policy not in POLICIES:
+            raise ValueError(f"policy must be one of {POLICIES}, got {policy!r}")
+        if maxsize <= 0:
+            raise ValueError("maxsize must be positive")
+        if policy == CONFLATE and key is None:
+            raise ValueError("the conflate policy needs a key function")
+
+        self.maxsize = maxsize
+        self.policy = policy
+        self.key = key
+        self.closed = False
+
+        self._items: 'OrderedDict[Hashable, Tuple[float, Any]]' = OrderedDict()
+        self._counter = itertools.count()
+
+        self.received = 0
+        self.delivered = 0
+        self.dropped = 0
+        self.conflated = 0
+        self.max_depth = 0
+        self.blocked = 0.0
+        self.lag = LatencyHistogram()
+
+    @property
+    def depth(self) -> int:
+        """Items waiting to be read"""
+        return len(self._items)
+
+    @property
+    def full(self) -> bool:
+        """Whether the queue holds maxsize items"""
+        return len(self._items) >= self.maxsize
+
+    def _offer(self, item: Any) -> bool:
+        """
+        Add an item without waiting
+
+        Returns:
+            False only under the block policy when the queue is full
+        """
+        items = self._items
+        if self.policy == CONFLATE:
+            slot = self.key(item)
+            pending = items.get(slot)
+            if pending is not None:
+                # Keep the slot's position and first enqueue time, so lag
+                # reflects how long the consumer has been behind
+                items[slot] = (pending[0], item)
+                self.received += 1
+                self.conflated += 1
+                return True
+        else:
+            slot = next(self._counter)
+
+        if len(items) >= self.maxsize:
+            if self.policy == BLOCK:
+                return False
+            items.popitem(last=False)
+            self.dropped += 1
+
+        items[slot] = (time.monotonic(), item)
+        self.received += 1
+        if len(items) > self.max_depth:
+            self.max_depth = len(items)
+        return True
+
+    def _take(self) -> Any:
+        """Remove the oldest item and record its time in the queue"""
+        enqueued, item = self._items.popitem(last=False)[1]
+        self.lag.record(time.monotonic() - enqueued)
+        self.delivered += 1
+        return item
+
+    def oldest_age(self) -> float:
+        """Seconds the oldest waiting item has been queued"""
+        if not self._items:
+            return 0.0
+        return time.monotonic() - next(iter(self._items.values()))[0]
+
+    def stats(self) -> Dict[str, Any]:
+        """
+        Get queue depth, counters and lag
+
+        Returns:
+            Dictionary with policy, maxsize, depth, max_depth, received,
+            delivered, dropped, conflated, blocked (seconds producers spent
+            waiting), oldest_age (seconds) and lag (time from enqueue to
+            read, as a LatencyHistogram summary)
+        """
+        return {
+            'policy': self.policy,
+            'maxsize': self.maxsize,
+            'depth': len(self._items),
+            'max_depth': self.max_depth,
+            'received': self.received,
+            'delivered': self.delivered,
+            'dropped': self.dropped,
+            'conflated': self.conflated,
+            'blocked': self.blocked,
+            'oldest_age': self.oldest_age(),
+            'lag': self.lag.summary(),
+        }
+
+
+class EventQueue(_QueueCore):
+    """
+    Thread-safe bounded queue with an overflow policy
+
+    - 'block': put() waits for space, pushing back on the producer
+    - 'drop_oldest': put() discards the oldest waiting item
+    - 'conflate': at most one waiting item per key; a newer item replaces
+      it in place, and the oldest is discarded when the queue is full
+
+    Args:
+        maxsize (int, optional): Most items waiting. Default: 10000
+        policy (str, optional): 'block', 'drop_oldest' or 'conflate'.
+            Default: 'drop_oldest'
+        key (callable, optional): Slot of an item under 'conflate'
+
+    Raises:
+        ValueError: If the policy is unknown, maxsize is not positive, or
+            'conflate' has no key
+
+    Example:
+        >>> events = EventQueue(100, 'conflate', key=lambda item: item[0])
+        >>> events.put(('B-BTC_USDT', 1)); events.put(('B-BTC_USDT', 2))
+        >>> events.get()
+        ('B-BTC_USDT', 2)
+    """
+
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        self._cond = threading.Condition()
+
+    def put(self, item: Any, timeout: Optional[float] = None) -> bool:
+        """
+        Add an item, applying the overflow policy
+
+        Args:
+            item: Item to add
+            timeout: Under 'block', most seconds to wait for space before
+                dropping the item (default: wait as long as needed)
+
+        Returns:
+            True if the item was queued, False if it was dropped because
+            the queue is closed or the wait timed out
+        """
+        with self._cond:
+            if self.closed:
+                return False
+            if self._offer(item):
+                self._cond.notify()
+                return True
+
+            started = time.monotonic()
+            deadline = None if timeout is None else started + timeout
+            try:
+                while not self.closed:
+                    remaining = None if deadline is None else deadline - time.monotonic()
+                    if remaining is not None and remaining <= 0:
+                        self.dropped += 1
+                        return False
+                    self._cond.wait(remaining)
+                    if self._offer(item):
+                        self._cond.notify_all()
+                        return True
+                return False
+            finally:
+                self.blocked += time.monotonic() - started
+
+    def get(self, timeout: Optional[float] = None) -> Any:
+        """
+        Remove and return the oldest item
+
+        Args:
+            timeout: Seconds to wait (default: forever)
+
+        Returns:
+            Item
+
+        Raises:
+            queue.Empty: If the timeout expires, or the queue is closed and
+                empty
+        """
+        with self._cond:
+            if not self._cond.wait_for(lambda: self._items or self.closed, timeout):
+                raise queue.Empty
+            if not self._items:
+                raise queue.Empty
+            item = self._take()
+            self._cond.notify_all()
+            return item
+
+    def close(self):
+        """Wake every waiter; items already queued can still be read"""
+        with self._cond:
+            self.closed = True
+            self._cond.notify_all()
+
+    def stats(self) -> Dict[str, Any]:
+        with self._cond:
+            return super().stats()
+
+
+class AsyncEventQueue(_QueueCore):
+    """
+    asyncio variant of EventQueue
+
+    Same policies and metrics; put() and get() are coroutines. Create it
+    inside the running event loop.
+    """
+
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        self._cond = asyncio.Condition()
+
+    async def put(self, item: Any, timeout: Optional[float] = None) -> bool:
+        """Add an item, applying the overflow policy (see EventQueue.put)"""
+        async with self._cond:
+            if self.closed:
+                return False
+            if self._offer(item):
+                self._cond.notify()
+                return True
+
+            started = time.monotonic()
+            deadline = None if timeout is None else started + timeout
+            try:
+                while not self.closed:
+                    remaining = None if deadline is None else deadline - time.monotonic()
+                    try:
+                        await asyncio.wait_for(self._cond.wait(), remaining)
+                    except asyncio.TimeoutError:
+                        self.dropped += 1
+                        return False
+                    if self._offer(item):
+                        self._cond.notify_all()
+                        return True
+                return False
+            finally:
+                self.blocked += time.monotonic() - started
+
+    async def get(self) -> Any:
+        """
+        Remove and return the oldest item
+
+        Raises:
+            queue.Empty: If the queue is closed and empty
+        """
+        async with self._cond:
+            await self._cond.wait_for(lambda: self._items or self.closed)
+            if not self._items:
+                raise queue.Empty
+            item = self._take()
+            self._cond.notify_all()
+            return item
+
+    def close(self):
+        """Wake every waiter; items already queued can still be read"""
+        self.closed = True
+
+        async def _wake():
+            async with self._cond:
+                self._cond.notify_all()
+
+        asyncio.ensure_future(_wake())
@@ -0,0 +1,168 @@
+"""
+CoinDCX Response Cache
+
+In-memory TTL cache with LRU eviction for slow-changing public metadata
+such as market lists and instrument details.
+"""
+
+import threading
+import time
+from collections import OrderedDict
+from typing import Any, Dict, Hashable, Optional, Tuple
+
+
+# Default time-to-live in seconds for slow-changing GET endpoints
+DEFAULT_CACHE_TTLS: Dict[str, float] = {
+    '/exchange/v1/markets': 300,
+    '/exchange/v1/markets_details': 300,
+    '/exchange/v1/derivatives/futures/data/active_instruments': 300,
+    '/exchange/v1/derivatives/futures/data/instrument': 300,
+}
+
+
+def request_key(base_url: str, endpoint: str, params: Optional[Dict[str, Any]] = None) -> Tuple:
+    """
+    Build a hashable key identifying a GET request
+
+    Args:
+        base_url: Base URL the request is sent to
+        endpoint: API endpoint path
+        params: URL parameters
+
+    Returns:
+        Tuple of (base_url, endpoint, sorted params)
+    """
+    if not params:
+        return (base_url, endpoint, ())
+
+    items = []
+    for name, value in sorted(params.items()):
+        if not isinstance(value, Hashable):
+            value = repr(value)
+        items.append((name, value))
+    return (base_url, endpoint, tuple(items))
+
+
+class TTLCache:
+    """
+    Thread-safe TTL cache with LRU eviction
+
+    Only endpoints with a TTL are cached; every other request bypasses the
+    cache. Cached responses are shared between callers and must be treated
+    as read-only.
+
+    Args:
+        ttls (dict, optional): Endpoint path -> TTL in seconds. Default: DEFAULT_CACHE_TTLS
+        default_ttl (float, optional): TTL for endpoints not listed in ttls.
+            Default: None (not cached)
+        maxsize (int, optional): Maximum number of cached responses. Default: 256
+
+    Example:
+        >>> client = Client(cache=True)
+        >>> client.get_markets_details()  # network
+        >>> client.get_markets_details()  # cache hit
+        >>> client.cache.stats()
+        {'hits': 1, 'misses': 1, 'size': 1, 'maxsize': 256}
+        >>> client.cache.invalidate('/exchange/v1/markets_details')
+    """
+
+    def __init__(
+        self,
+        ttls: Optional[Dict[str, float]] = None,
+        default_ttl: Optional[float] = None,
+        maxsize: int = 256,
+    ):
+        self.ttls = dict(DEFAULT_CACHE_TTLS if ttls is None else ttls)
+        self.default_ttl = default_ttl
+        self.maxsize = maxsize
+        self.hits = 0
+        self.misses = 0
+        self._entries: "OrderedDict[Tuple, Tuple[float, Any]]" = OrderedDict()
+        self._lock = threading.Lock()
+
+    def ttl_for(self, endpoint: str) -> Optional[float]:
+        """
+        Get the TTL for an endpoint
+
+        Args:
+            endpoint: API endpoint path
+
+        Returns:
+            TTL in seconds, or None if the endpoint is not cached
+        """
+        return self.ttls.get(endpoint, self.default_ttl)
+
+    def get(self, key: Tuple) -> Tuple[bool, Any]:
+        """
+        Look up a cached response and count the hit or miss
+
+        Args:
+            key: Key built by request_key
+
+        Returns:
+            Tuple of (found, response). response is None when not found.
+        """
+        now = time.monotonic()
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is not None:
+                expires, value = entry
+                if expires > now:
+                    self._entries.move_to_end(key)
+                    self.hits += 1
+                    return True, value
+                del self._entries[key]
+            self.misses += 1
+            return False, None
+
+    def set(self, key: Tuple, value: Any, ttl: float):
+        """
+        Store a response, evicting the least recently used entry when full
+
+        Args:
+            key: Key built by request_key
+            value: Parsed response
+            ttl: Time to live in seconds
+        """
+        with self._lock:
+            self._entries[key] = (time.monotonic() + ttl, value)
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.maxsize:
+                self._entries.popitem(last=False)
+
+    def invalidate(self, endpoint: Optional[str] = None):
+        """
+        Drop cached responses
+
+        Args:
+            endpoint: Drop only responses for this endpoint path.
+                If not provided, clear the whole cache.
+        """
+        with self._lock:
+            if endpoint is None:
+                self._entries.clear()
+                return
+            for key in [key for key in self._entries if key[1] == endpoint]:
+                del self._entries[key]
+
+    def clear(self):
+        """Drop all cached responses and reset the counters"""
+        with self._lock:
+            self._entries.clear()
+            self.hits = 0
+            self.misses = 0
+
+    def stats(self) -> Dict[str, int]:
+        """
+        Get cache counters
+
+        Returns:
+            Dictionary with hits, misses, size and maxsize
+        """
+        with self._lock:
+            return {
+                'hits': self.hits,
+                'misses': self.misses,
+                'size': len(self._entries),
+                'maxsize': self.maxsize,
+            }
@@ -0,0 +1,283 @@
+"""
+CoinDCX Candle Helpers
+
+Interval arithmetic, range splitting and merging for fetching long candle
+histories in limit-sized windows, and conversion to columnar NumPy arrays.
+"""
+
+from operator import itemgetter
+from typing import Any, Dict, Iterable, List, Sequence, Tuple, Union
+
+from .enums import CandleInterval, FuturesResolution
+
+
+MINUTE_MS = 60 * 1000
+HOUR_MS = 60 * MINUTE_MS
+DAY_MS = 24 * HOUR_MS
+
+# Spot candle interval -> duration in milliseconds. '1M' is approximated as
+# 30 days; windows only need an upper bound on the candle count.
+CANDLE_INTERVAL_MS: Dict[str, int] = {
+    '1m': MINUTE_MS,
+    '5m': 5 * MINUTE_MS,
+    '15m': 15 * MINUTE_MS,
+    '30m': 30 * MINUTE_MS,
+    '1h': HOUR_MS,
+    '2h': 2 * HOUR_MS,
+    '4h': 4 * HOUR_MS,
+    '6h': 6 * HOUR_MS,
+    '8h': 8 * HOUR_MS,
+    '1d': DAY_MS,
+    '3d': 3 * DAY_MS,
+    '1w': 7 * DAY_MS,
+    '1M': 30 * DAY_MS,
+}
+
+# Futures candle resolution -> duration in seconds (futures requests take
+# seconds; candle times in responses are still milliseconds)
+FUTURES_RESOLUTION_SECONDS: Dict[str, int] = {
+    '1': 60,
+    '5': 5 * 60,
+    '60': 60 * 60,
+    '1D': 24 * 60 * 60,
+}
+
+# Candle fields in column order; time is int64 milliseconds, the rest float64
+CANDLE_FIELDS: Tuple[str, ...] = ('time', 'open', 'high', 'low', 'close', 'volume')
+
+# Maximum candles returned by a single spot get_candles call
+MAX_CANDLES_PER_REQUEST = 1000
+
+# Candles requested per futures window. The futures endpoint does not document
+# its cap, so windows are kept to the spot maximum.
+FUTURES_CANDLES_PER_REQUEST = 1000
+
+
+def interval_ms(interval: Union[str, CandleInterval]) -> int:
+    """
+    Get the duration of a spot candle interval
+
+    Args:
+        interval: Candle interval (e.g., '1m', '1h', CandleInterval.ONE_DAY)
+
+    Returns:
+        Interval length in milliseconds
+
+    Raises:
+        ValueError: If the interval is not supported
+    """
+    key = interval.value if isinstance(interval, CandleInterval) else interval
+    try:
+        return CANDLE_INTERVAL_MS[key]
+    except KeyError:
+        raise ValueError(f"Unsupported candle interval: {interval!r}")
+
+
+def resolution_seconds(resolution: Union[str, FuturesResolution]) -> int:
+    """
+    Get the duration of a futures candle resolution
+
+    Args:
+        resolution: Futures resolution ('1', '5', '60', '1D' or FuturesResolution)
+
+    Returns:
+        Resolution length in seconds
+
+    Raises:
+        ValueError: If the resolution is not supported
+    """
+    key = resolution.value if isinstance(resolution, FuturesResolution) else resolution
+    try:
+        return FUTURES_RESOLUTION_SECONDS[key]
+    except KeyError:
+        raise ValueError(f"Unsupported futures resolution: {resolution!r}")
+
+
+def split_range(start: int, end: int, step: int, limit: int) -> List[Tuple[int, int]]:
+    """
+    Split an inclusive time range into windows of at most `limit` candles
+
+    Consecutive windows share their boundary timestamp, so a candle on the
+    boundary is fetched twice and removed by merge_candles; this keeps the
+    result correct whether the server treats window ends as inclusive or
+    exclusive.
+
+    Args:
+        start: Range start timestamp
+        end: Range end timestamp (inclusive)
+        step: Candle duration, in the same unit as start/end
+        limit: Maximum candles per window
+
+    Returns:
+        List of (window_start, window_end) tuples covering [start, end]
+
+    Raises:
+        ValueError: If end is before start, or step/limit are not positive
+    """
+    if end < start:
+        raise ValueError("end must not be before start")
+    if step <= 0 or limit <= 0:
+        raise ValueError("step and limit must be positive")
+
+    span = max(1, limit - 1) * step
+    windows = []
+    window_start = start
+    while True:
+        window_end = min(end, window_start + span)
+        windows.append((window_start, window_end))
+        if window_end >= end:
+            return windows
+        window_start = window_end
+
+
+def merge_candles(
+    chunks: Iterable[Iterable[Dict[str, Any]]],
+    start: int = None,
+    end: int = None,
+    time_key: str = 'time',
+) -> List[Dict[str, Any]]:
+    """
+    Merge candle windows into one ascending series without duplicates
+
+    Args:
+        chunks: Lists of candle dicts, in any order
+        start: Drop candles before this timestamp (optional)
+        end: Drop candles after this timestamp (optional)
+        time_key: Key holding the candle open time (default: 'time')
+
+    Returns:
+        Candles sorted by time ascending, one per timestamp. When windows
+        overlap, the candle from the later chunk wins.
+    """
+    by_time: Dict[Any, Dict[str, Any]] = {}
+    for chunk in chunks:
+        for candle in chunk or ():
+            by_time[candle[time_key]] = candle
+
+    times = sorted(by_time)
+    if start is not None or end is not None:
+        times = [
+            t for t in times
+            if (start is None or t >= start) and (end is None or t <= end)
+        ]
+    return [by_time[t] for t in times]
+
+
+def find_gaps(
+    candles: List[Dict[str, Any]],
+    step: int,
+    start: int = None,
+    end: int = None,
+    time_key: str = 'time',
+) -> List[Tuple[int, int]]:
+    """
+    Find missing candles in an ascending series
+
+    Args:
+        candles: Candles sorted by time ascending, as returned by merge_candles
+        step: Candle duration, in the same unit as the candle times
+        start: Expected range start; candles are expected from the first
+            multiple of step at or after it (optional)
+        end: Expected range end (optional)
+        time_key: Key holding the candle open time (default: 'time')
+
+    Returns:
+        List of (first_missing, last_missing) open times, inclusive. An empty
+        series with start and end given is reported as one gap.
+    """
+    expected_first = None if start is None else -(-start // step) * step
+    expected_last = None if end is None else end // step * step
+
+    gaps = []
+    previous = None if expected_first is None else expected_first - step
+    for candle in candles:
+        current = candle[time_key]
+        if previous is not None and current - previous > step:
+            gaps.append((previous + step, current - step))
+        previous = current
+
+    if previous is not None and expected_last is not None and expected_last > previous:
+        gaps.append((previous + step, expected_last))
+    return gaps
+
+
+def _import_numpy():
+    """Import numpy, with an install hint if it is missing"""
+    try:
+        import numpy
+    except ImportError:
+        raise ImportError(
+            "Array output requires numpy. Install it with: pip install coindcx[numpy]"
+        )
+    return numpy
+
+
+def candle_dtype() -> Any:
+    """
+    Get the NumPy structured dtype for one candle
+
+    Returns:
+        numpy.dtype with an int64 'time' field and float64 open, high, low,
+        close and volume fields
+    """
+    np = _import_numpy()
+    return np.dtype([(name, np.int64 if name == 'time' else np.float64) for name in CANDLE_FIELDS])
+
+
+def candles_to_arrays(
+    candles: Union[Sequence[Dict[str, Any]], Dict[str, Any]],
+    structured: bool = False,
+) -> Any:
+    """
+    Convert candle dicts into columnar NumPy arrays
+
+    Each field is read straight into a preallocated array, without building
+    intermediate per-candle lists. Rows are ordered by time ascending,
+    whatever the order of the input (spot responses are newest first).
+
+    Args:
+        candles: List of candle dicts, or a futures candles response
+            ({'s': 'ok', 'data': [...]})
+        structured: Return one structured array instead of a dict of columns
+
+    Returns:
+        Dict mapping 'time' (int64 ms) and 'open', 'high', 'low', 'close',
+        'volume' (float64) to contiguous 1-D arrays, or a structured array
+        with those fields if structured is True
+
+    Raises:
+        ImportError: If numpy is not installed
+
+    Example:
+        >>> arrays = candles_to_arrays(client.get_candles('B-BTC_USDT', '1m'))
+        >>> returns = arrays['close'][1:] / arrays['close'][:-1] - 1
+    """
+    np = _import_numpy()
+
+    if isinstance(candles, dict):
+        candles = candles.get('data') or []
+    if len(candles) > 1 and candles[0]['time'] > candles[-1]['time']:
+        candles = candles[::-1]
+
+    count = len(candles)
+    columns = {
+        name: np.fromiter(
+            map(itemgetter(name), candles),
+            dtype=np.int64 if name == 'time' else np.float64,
+            count=count,
+        )
+        for name in CANDLE_FIELDS
+    }
+
+    times = columns['time']
+    if count > 1 and (times[1:] < times[:-1]).any():
+        order = np.argsort(times, kind='stable')
+        columns = {name: column[order] for name, column in columns.items()}
+
+    if not structured:
+        return columns
+
+    records = np.empty(count, dtype=candle_dtype())
+    for name, column in columns.items():
+        records[name] = column
+    return records
@@ -4,21 +4,38 @@ CoinDCX API Client
 A unified client for accessing both public and authenticated CoinDCX API endpoints.
 """
 
-import hmac
-import hashlib
-import json
+import threading
 import time
-from typing import Dict, Optional, Any, Union
+from email.utils import parsedate_to_datetime
+from typing import (
+    TYPE_CHECKING, Callable, Dict, Iterable, Iterator, List, Mapping, Optional, Any, Sequence,
+    Tuple, Union,
+)
 from urllib.parse import urljoin
 
-import requests
-
 from .exceptions import (
+    CoinDCXException,
     CoinDCXAPIException,
     CoinDCXRequestException,
     CoinDCXAuthenticationException,
     CoinDCXRateLimitException,
 )
+from .ratelimit import RateLimiter
+from .retry import RetryPolicy
+from .cache import TTLCache, request_key
+from .singleflight import SingleFlight
+from .codec import JSONCodec, get_codec
+from .metrics import RequestInfo, RequestMetrics
+from .candles import (
+    FUTURES_CANDLES_PER_REQUEST,
+    MAX_CANDLES_PER_REQUEST,
+    candles_to_arrays,
+    find_gaps,
+    interval_ms,
+    merge_candles,
+    resolution_seconds,
+    split_range,
+)
 from .enums import (
     API_BASE_URL,
     PUBLIC_BASE_URL,
@@ -34,6 +51,38 @@ from .endpoints.market import MarketEndpoints
 from .endpoints.spot import SpotEndpoints
 from .endpoints.margin import MarginEndpoints
 from .endpoints.futures import FuturesEndpoints
+from .endpoints.utils import then
+
+if TYPE_CHECKING:
+    from .signing import Signer
+
+
+# Client methods that must not be run through batch()
+_NON_BATCHABLE = frozenset({'batch', 'batch_stream', 'close', 'warmup'})
+
+
+def _retry_after(headers: Optional[Mapping[str, str]]) -> Optional[float]:
+    """
+    Read a Retry-After header as seconds to wait
+
+    Args:
+        headers: Response headers (case-insensitive mapping), or None
+
+    Returns:
+        Seconds, from either a delay or an HTTP date; None if the header is
+        missing or malformed
+    """
+    value = headers.get('Retry-After') if headers is not None else None
+    if not value:
+        return None
+    try:
+        return max(0.0, float(value))
+    except ValueError:
+        pass
+    try:
+        return max(0.0, parsedate_to_datetime(value).timestamp() - time.time())
+    except (TypeError, ValueError, IndexError, OverflowError):
+        return None
 
 
 class Client:
@@ -50,6 +99,35 @@ class Client:
         base_url (str, optional): Override the default API base URL
         public_url (str, optional): Override the default public API base URL
         timeout (int, optional): Request timeout in seconds. Default: 30
+        rate_limiter (RateLimiter or bool, optional): Pace requests client-side
+            before they are sent. Pass True for the published CoinDCX budgets,
+            or a RateLimiter for custom limits. Default: None (disabled)
+        retry_policy (RetryPolicy or bool, optional): Retry transient failures
+            with exponential backoff. Pass True for the default RetryPolicy.
+            Default: None (disabled)
+        cache (TTLCache or bool, optional): Cache slow-changing public GET
+            responses in memory. Pass True for the default TTLs, or a TTLCache
+            for custom ones. Default: None (disabled)
+        single_flight (bool, optional): Let concurrent identical public GET
+            requests share the one already in flight. Default: False
+        json_codec (str or JSONCodec, optional): JSON library for request
+            bodies and responses - 'auto' (orjson if installed), 'orjson',
+            'json', or a JSONCodec instance. Default: 'auto'
+        metrics (RequestMetrics or bool, optional): Record per-endpoint request
+            counts, status codes, sizes and latency histograms. Pass True for a
+            new RequestMetrics. Default: None (disabled)
+        pre_request_hooks (list, optional): Callables invoked with a
+            RequestInfo before each HTTP attempt is sent
+        post_request_hooks (list, optional): Callables invoked with a
+            RequestInfo after each HTTP attempt completes or fails
+        pool_connections (int, optional): Number of per-host connection pools
+            to cache. Default: 10
+        pool_maxsize (int, optional): Maximum connections kept open per host.
+            Default: 10
+        pool_block (bool, optional): Wait for a free pooled connection instead
+            of opening a throwaway one when the pool is exhausted. Default: False
+        keep_alive (bool, optional): Reuse connections between requests.
+            Default: True
 
     Example:
         # For public endpoints only
@@ -68,43 +146,195 @@ class Client:
         base_url: str = API_BASE_URL,
         public_url: str = PUBLIC_BASE_URL,
         timeout: int = 30,
+        rate_limiter: Optional[Union[RateLimiter, bool]] = None,
+        retry_policy: Optional[Union[RetryPolicy, bool]] = None,
+        cache: Optional[Union[TTLCache, bool]] = None,
+        single_flight: bool = False,
+        json_codec: Union[str, JSONCodec] = 'auto',
+        metrics: Optional[Union[RequestMetrics, bool]] = None,
+        pre_request_hooks: Optional[List[Callable[[RequestInfo], Any]]] = None,
+        post_request_hooks: Optional[List[Callable[[RequestInfo], Any]]] = None,
+        pool_connections: int = 10,
+        pool_maxsize: int = 10,
+        pool_block: bool = False,
+        keep_alive: bool = True,
     ):
         self.api_key = api_key
         self.api_secret = api_secret
         self.base_url = base_url
         self.public_url = public_url
         self.timeout = timeout
-        self.session = requests.Session()
+        self.rate_limiter = RateLimiter() if rate_limiter is True else (rate_limiter or None)
+        self.retry_policy = RetryPolicy() if retry_policy is True else (retry_policy or None)
+        self.cache = TTLCache() if cache is True else (cache or None)
+        self.single_flight = SingleFlight() if single_flight else None
+        self.json_codec = get_codec(json_codec)
+        self._signer: Optional['Signer'] = None
+        self.metrics = RequestMetrics() if metrics is True else (metrics or None)
+        self.pre_request_hooks = list(pre_request_hooks or [])
+        self.post_request_hooks = list(post_request_hooks or [])
+        self.pool_connections = pool_connections
+        self.pool_maxsize = pool_maxsize
+        self.pool_block = pool_block
+        self.keep_alive = keep_alive
+
+        # The HTTP session and endpoint modules are created on first use,
+        # so constructing a client does not load the transport stack
+        self._session = None
+        self._session_lock = threading.Lock()
+        self._market: Optional[MarketEndpoints] = None
+        self._spot: Optional[SpotEndpoints] = None
+        self._margin: Optional[MarginEndpoints] = None
+        self._futures: Optional[FuturesEndpoints] = None
+
+    @property
+    def session(self) -> Any:
+        """HTTP session, created on first access"""
+        if self._session is None:
+            with self._session_lock:
+                if self._session is None:
+                    self._session = self._create_session()
+        return self._session
+
+    @session.setter
+    def session(self, session: Any):
+        self._session = session
+
+    @property
+    def market(self) -> MarketEndpoints:
+        """Market data endpoints"""
+        if self._market is None:
+            self._market = MarketEndpoints(self._get)
+        return self._market
+
+    @property
+    def spot(self) -> SpotEndpoints:
+        """Spot trading endpoints"""
+        if self._spot is None:
+            self._spot = SpotEndpoints(self._post)
+        return self._spot
+
+    @property
+    def margin(self) -> MarginEndpoints:
+        """Margin trading endpoints"""
+        if self._margin is None:
+            self._margin = MarginEndpoints(self._post)
+        return self._margin
+
+    @property
+    def futures(self) -> FuturesEndpoints:
+        """Futures trading endpoints"""
+        if self._futures is None:
+            self._futures = FuturesEndpoints(self._get, self._post, self._signed_get)
+        return self._futures
+
+    def _create_session(self) -> Any:
+        """
+        Create the HTTP session used for all requests
 
-        # Initialize endpoint modules
-        self.market = MarketEndpoints(self._get)
-        self.spot = SpotEndpoints(self._post)
-        self.margin = MarginEndpoints(self._post)
-        self.futures = FuturesEndpoints(self._get, self._post)
+        Mounts an HTTPAdapter sized by pool_connections/pool_maxsize so
+        concurrent threads reuse connections to both API hosts.
 
-    def _generate_signature(self, payload: str) -> str:
+        Returns:
+            requests Session object
         """
-        Generate HMAC-SHA256 signature for authenticated requests
+        import requests
+
+        session = requests.Session()
+        adapter = requests.adapters.HTTPAdapter(
+            pool_connections=self.pool_connections,
+            pool_maxsize=self.pool_maxsize,
+            pool_block=self.pool_block,
+        )
+        session.mount('https://', adapter)
+        session.mount('http://', adapter)
+
+        if not self.keep_alive:
+            session.headers['Connection'] = 'close'
+
+        return session
+
+    def _warmup_hosts(self) -> list:
+        """Get the distinct base URLs this client talks to"""
+        hosts = [self.base_url]
+        if self.public_url != self.base_url:
+            hosts.append(self.public_url)
+        return hosts
+
+    def warmup(self, connections: int = 1):
+        """
+        Open connections to the API and public hosts ahead of the first request
+
+        Sends lightweight HEAD requests so the TCP and TLS handshakes are done
+        before latency-sensitive calls such as order placement. The response
+        status is ignored; only network failures are reported.
 
         Args:
-            payload: JSON string of the request body
+            connections: Number of connections to open per host (default: 1,
+                capped at pool_maxsize)
+
+        Raises:
+            CoinDCXRequestException: If a host cannot be reached
+
+        Example:
+            >>> client = Client(api_key='...', api_secret='...', pool_maxsize=20)
+            >>> client.warmup(connections=4)
+        """
+        import requests
+        from concurrent.futures import ThreadPoolExecutor
+
+        connections = max(1, min(connections, self.pool_maxsize))
+        urls = [url for url in self._warmup_hosts() for _ in range(connections)]
+
+        def _head(url):
+            try:
+                self.session.head(url, timeout=self.timeout)
+            except requests.exceptions.RequestException as e:
+                raise CoinDCXRequestException(f"Warmup failed for {url}: {str(e)}")
+
+        if connections == 1:
+            for url in urls:
+                _head(url)
+            return
+
+        # Concurrent requests are needed to open more than one connection per host
+        with ThreadPoolExecutor(max_workers=len(urls)) as executor:
+            for future in [executor.submit(_head, url) for url in urls]:
+                future.result()
+
+    def _get_signer(self) -> 'Signer':
+        """
+        Get the signer for the current API secret, keying it on first use
 
         Returns:
-            Hexadecimal signature string
+            Signer instance
+
+        Raises:
+            CoinDCXAuthenticationException: If API secret is not provided
         """
         if not self.api_secret:
             raise CoinDCXAuthenticationException(
                 "API secret is required for authenticated requests"
             )
 
-        secret_bytes = bytes(self.api_secret, encoding='utf-8')
-        signature = hmac.new(
-            secret_bytes,
-            payload.encode(),
-            hashlib.sha256
-        ).hexdigest()
+        signer = self._signer
+        if signer is None or signer.secret != self.api_secret:
+            from .signing import Signer
+            signer = self._signer = Signer(self.api_secret)
+
+        return signer
+
+    def _generate_signature(self, payload: Union[bytes, str]) -> str:
+        """
+        Generate HMAC-SHA256 signature for authenticated requests
 
-        return signature
+        Args:
+            payload: Request body exactly as sent (bytes), or a JSON string
+
+        Returns:
+            Hexadecimal signature string
+        """
+        return self._get_signer().sign(payload)
 
     def _get_timestamp(self) -> int:
         """
@@ -115,34 +345,31 @@ class Client:
         """
         return int(round(time.time() * 1000))
 
-    def _request(
+    def _prepare_request(
         self,
-        method: str,
         endpoint: str,
         authenticated: bool = False,
-        params: Optional[Dict[str, Any]] = None,
         data: Optional[Dict[str, Any]] = None,
         use_public_url: bool = False,
-    ) -> Any:
+    ) -> Tuple[str, Dict[str, str], Optional[bytes]]:
         """
-        Internal method to make HTTP requests
+        Build URL, headers and signed body for a request
+
+        Shared by the sync and async clients so both send identical requests.
 
         Args:
-            method: HTTP method (GET, POST, etc.)
             endpoint: API endpoint path
             authenticated: Whether this is an authenticated request
-            params: URL parameters for GET requests
             data: Request body for POST requests
             use_public_url: Use public URL instead of main API URL
 
         Returns:
-            JSON response from the API
+            Tuple of (url, headers, json_body). json_body holds the encoded
+            bytes that were signed and must be sent as-is; it is None for
+            public requests.
 
         Raises:
             CoinDCXAuthenticationException: If authentication is required but credentials not provided
-            CoinDCXRateLimitException: If rate limit is exceeded
-            CoinDCXAPIException: For API errors
-            CoinDCXRequestException: For network/request errors
         """
         # Check authentication
         if authenticated and (not self.api_key or not self.api_secret):
@@ -160,25 +387,192 @@ class Client:
             'Content-Type': 'application/json',
         }
 
-        # Handle authenticated requests
-        if authenticated:
-            # Add timestamp to data if not present
-            if data is None:
-                data = {}
+        if not authenticated:
+            return url, headers, None
+
+        # Add timestamp to data if not present
+        if data is None:
+            data = {}
+
+        if 'timestamp' not in data:
+            data['timestamp'] = self._get_timestamp()
+
+        # Generate signature
+        json_body = self.json_codec.dumps(data)
+        signature = self._generate_signature(json_body)
+
+        # Add authentication headers
+        headers['X-AUTH-APIKEY'] = self.api_key
+        headers['X-AUTH-SIGNATURE'] = signature
+
+        return url, headers, json_body
+
+    def _request(
+        self,
+        method: str,
+        endpoint: str,
+        authenticated: bool = False,
+        params: Optional[Dict[str, Any]] = None,
+        data: Optional[Dict[str, Any]] = None,
+        use_public_url: bool = False,
+    ) -> Any:
+        """
+        Internal method to make HTTP requests
+
+        GET responses for endpoints with a cache TTL are served from the
+        cache, if set. Concurrent identical public GETs share one request
+        when single_flight is enabled. Transient failures are retried
+        according to retry_policy, if set.
+
+        Args:
+            method: HTTP method (GET, POST, etc.)
+            endpoint: API endpoint path
+            authenticated: Whether this is an authenticated request
+            params: URL parameters for GET requests
+            data: Request body for POST requests
+            use_public_url: Use public URL instead of main API URL
+
+        Returns:
+            JSON response from the API
+
+        Raises:
+            CoinDCXAuthenticationException: If authentication is required but credentials not provided
+            CoinDCXRateLimitException: If rate limit is exceeded
+            CoinDCXAPIException: For API errors
+            CoinDCXRequestException: For network/request errors
+        """
+        cache_key, ttl = self._cache_lookup_key(method, endpoint, params, use_public_url)
+        if cache_key is not None:
+            found, cached = self.cache.get(cache_key)
+            if found:
+                return cached
+
+        if self.single_flight is not None and method == 'GET' and not authenticated:
+            base = self.public_url if use_public_url else self.base_url
+            result = self.single_flight.do(
+                request_key(base, endpoint, params),
+                lambda: self._request_with_retries(
+                    method, endpoint, authenticated, params, data, use_public_url
+                ),
+            )
+        else:
+            result = self._request_with_retries(
+                method, endpoint, authenticated, params, data, use_public_url
+            )
+
+        if cache_key is not None:
+            self.cache.set(cache_key, result, ttl)
 
-            if 'timestamp' not in data:
-                data['timestamp'] = self._get_timestamp()
+        return result
 
-            # Generate signature
-            json_body = json.dumps(data, separators=(',', ':'))
-            signature = self._generate_signature(json_body)
+    def _cache_lookup_key(
+        self,
+        method: str,
+        endpoint: str,
+        params: Optional[Dict[str, Any]],
+        use_public_url: bool,
+    ) -> Tuple[Optional[Tuple], Optional[float]]:
+        """
+        Get the cache key and TTL for a request
+
+        Returns:
+            Tuple of (key, ttl), or (None, None) if the request is not cacheable
+        """
+        if self.cache is None or method != 'GET':
+            return None, None
+
+        ttl = self.cache.ttl_for(endpoint)
+        if ttl is None:
+            return None, None
+
+        base = self.public_url if use_public_url else self.base_url
+        return request_key(base, endpoint, params), ttl
+
+    def _request_with_retries(
+        self,
+        method: str,
+        endpoint: str,
+        authenticated: bool = False,
+        params: Optional[Dict[str, Any]] = None,
+        data: Optional[Dict[str, Any]] = None,
+        use_public_url: bool = False,
+    ) -> Any:
+        """
+        Send a request, retrying transient failures per retry_policy
 
-            # Add authentication headers
-            headers['X-AUTH-APIKEY'] = self.api_key
-            headers['X-AUTH-SIGNATURE'] = signature
+        Args:
+            method: HTTP method (GET, POST, etc.)
+            endpoint: API endpoint path
+            authenticated: Whether this is an authenticated request
+            params: URL parameters for GET requests
+            data: Request body for POST requests
+            use_public_url: Use public URL instead of main API URL
 
-            # Make request
+        Returns:
+            JSON response from the API
+        """
+        attempt = 0
+        while True:
+            # Each attempt signs a fresh copy so retries carry a new timestamp
+            attempt_data = dict(data) if data is not None else None
             try:
+                return self._send_request(
+                    method, endpoint, authenticated, params, attempt_data, use_public_url
+                )
+            except CoinDCXException as e:
+                if self.retry_policy is None:
+                    raise
+                delay = self.retry_policy.get_delay(e, attempt, method, endpoint, data)
+                if delay is None:
+                    raise
+
+            time.sleep(delay)
+            attempt += 1
+
+    def _send_request(
+        self,
+        method: str,
+        endpoint: str,
+        authenticated: bool = False,
+        params: Optional[Dict[str, Any]] = None,
+        data: Optional[Dict[str, Any]] = None,
+        use_public_url: bool = False,
+    ) -> Any:
+        """
+        Send a single HTTP request, without retries
+
+        Args:
+            method: HTTP method (GET, POST, etc.)
+            endpoint: API endpoint path
+            authenticated: Whether this is an authenticated request
+            params: URL parameters for GET requests
+            data: Request body for POST requests
+            use_public_url: Use public URL instead of main API URL
+
+        Returns:
+            JSON response from the API
+        """
+        import requests
+
+        if self.rate_limiter is not None:
+            self.rate_limiter.acquire(endpoint)
+
+        info = RequestInfo(method, endpoint, authenticated, params)
+        started = time.perf_counter()
+
+        url, headers, json_body = self._prepare_request(
+            endpoint, authenticated=authenticated, data=data, use_public_url=use_public_url
+        )
+
+        sent = time.perf_counter()
+        info.url = url
+        info.sign_time = sent - started
+        info.bytes_out = len(json_body) if json_body else 0
+        for hook in self.pre_request_hooks:
+            hook(info)
+
+        try:
+            if authenticated:
                 response = self.session.request(
                     method=method,
                     url=url,
@@ -186,11 +580,7 @@ class Client:
                     data=json_body,
                     timeout=self.timeout,
                 )
-            except requests.exceptions.RequestException as e:
-                raise CoinDCXRequestException(f"Request failed: {str(e)}")
-        else:
-            # Public request
-            try:
+            else:
                 response = self.session.request(
                     method=method,
                     url=url,
@@ -198,13 +588,40 @@ class Client:
                     params=params,
                     timeout=self.timeout,
                 )
-            except requests.exceptions.RequestException as e:
-                raise CoinDCXRequestException(f"Request failed: {str(e)}")
+        except requests.exceptions.RequestException as e:
+            info.network_time = time.perf_counter() - sent
+            info.error = CoinDCXRequestException(f"Request failed: {str(e)}")
+            self._finish_request(info)
+            raise info.error
+
+        received = time.perf_counter()
+        info.network_time = received - sent
+        info.status_code = response.status_code
+        info.bytes_in = len(response.content)
 
         # Handle response
-        return self._handle_response(response)
+        try:
+            return self._handle_response(response)
+        except CoinDCXException as e:
+            info.error = e
+            raise
+        finally:
+            info.decode_time = time.perf_counter() - received
+            self._finish_request(info)
+
+    def _finish_request(self, info: RequestInfo):
+        """
+        Record a completed request attempt and run post-request hooks
+
+        Args:
+            info: RequestInfo for the attempt
+        """
+        if self.metrics is not None:
+            self.metrics.record(info)
+        for hook in self.post_request_hooks:
+            hook(info)
 
-    def _handle_response(self, response: requests.Response) -> Any:
+    def _handle_response(self, response: Any) -> Any:
         """
         Handle API response and raise appropriate exceptions
 
@@ -218,33 +635,64 @@ class Client:
             CoinDCXRateLimitException: If rate limit exceeded
             CoinDCXAPIException: For other API errors
         """
+        return self._parse_response(response.status_code, response.content, response.headers)
+
+    def _parse_response(
+        self,
+        status_code: int,
+        content: bytes,
+        headers: Optional[Mapping[str, str]] = None,
+    ) -> Any:
+        """
+        Parse a raw HTTP response and raise appropriate exceptions
+
+        Args:
+            status_code: HTTP status code
+            content: Raw response body
+            headers (optional): Response headers; a 429's Retry-After is
+                passed on to the exception as retry_after
+
+        Returns:
+            Parsed JSON response, or the raw text if the body is not JSON
+
+        Raises:
+            CoinDCXRateLimitException: If rate limit exceeded
+            CoinDCXAPIException: For other API errors
+        """
+        ok = status_code < 400
+
         # Check for rate limiting
-        if response.status_code == 429:
+        if status_code == 429:
             raise CoinDCXRateLimitException(
                 "Rate limit exceeded",
-                status_code=response.status_code,
-                response=response.text,
+                status_code=status_code,
+                response=content.decode('utf-8', 'replace'),
+                retry_after=_retry_after(headers),
             )
 
         # Try to parse JSON response
         try:
-            json_response = response.json()
+            json_response = self.json_codec.loads(content)
         except ValueError:
             # Not JSON response
-            if not response.ok:
+            text = content.decode('utf-8', 'replace')
+            if not ok:
                 raise CoinDCXAPIException(
-                    f"HTTP {response.status_code}: {response.text}",
-                    status_code=response.status_code,
-                    response=response.text,
+                    f"HTTP {status_code}: {text}",
+                    status_code=status_code,
+                    response=text,
                 )
-            return response.text
+            return text
 
         # Check for API errors
-        if not response.ok:
-            error_message = json_response.get('message', response.text)
+        if not ok:
+            text = content.decode('utf-8', 'replace')
+            error_message = (
+                json_response.get('message', text) if isinstance(json_response, dict) else text
+            )
             raise CoinDCXAPIException(
                 error_message,
-                status_code=response.status_code,
+                status_code=status_code,
                 response=json_response,
             )
 
@@ -258,6 +706,10 @@ class Client:
         """Make POST request (for authenticated endpoints)"""
         return self._request('POST', endpoint, authenticated=True, data=data)
 
+    def _signed_get(self, endpoint: str, data: Optional[Dict] = None) -> Any:
+        """Make signed GET request (for authenticated read-only endpoints)"""
+        return self._request('GET', endpoint, authenticated=True, data=data)
+
     # ===== Public Endpoints =====
     # Delegated to MarketEndpoints
 
@@ -288,18 +740,25 @@ class Client:
         """
         return self.market.get_markets()
 
-    def get_markets_details(self) -> list:
+    def get_markets_details(self, as_index: bool = False) -> Any:
         """
         Get detailed information about all markets
 
+        Args:
+            as_index: Return a MarketIndex keyed by symbol and pair, with
+                per-market rounding and order checks. Default: False
+
         Returns:
-            List of market details including precision, limits, etc.
+            List of market details including precision, limits, etc., or a
+            MarketIndex if as_index is True
 
         Example:
             >>> client = Client()
             >>> details = client.get_markets_details()
+            >>> markets = client.get_markets_details(as_index=True)
+            >>> markets['B-BTC_USDT'].round_price(50123.456)
         """
-        return self.market.get_markets_details()
+        return self.market.get_markets_details(as_index)
 
     def get_trades(self, pair: str, limit: int = 30) -> list:
         """
@@ -318,22 +777,24 @@ class Client:
         """
         return self.market.get_trades(pair, limit)
 
-    def get_orderbook(self, pair: str) -> dict:
+    def get_orderbook(self, pair: str, as_book: bool = False) -> Any:
         """
         Get order book for a market pair
 
         Args:
             pair: Market pair (e.g., 'KC-BTC_USDT')
+            as_book: Return a sorted OrderBook instead of the raw response.
+                Default: False
 
         Returns:
-            Order book with bids and asks
+            Order book with bids and asks, or an OrderBook if as_book is True
 
         Example:
             >>> client = Client()
             >>> orderbook = client.get_orderbook('KC-BTC_USDT')
             >>> print(orderbook['bids'])
         """
-        return self.market.get_orderbook(pair)
+        return self.market.get_orderbook(pair, as_book)
 
     def get_candles(
         self,
@@ -342,7 +803,8 @@ class Client:
         start_time: Optional[int] = None,
         end_time: Optional[int] = None,
         limit: int = 500,
-    ) -> list:
+        as_arrays: Union[bool, str] = False,
+    ) -> Any:
         """
         Get candlestick data for a market pair
 
@@ -352,15 +814,79 @@ class Client:
             start_time: Start timestamp in milliseconds (optional)
             end_time: End timestamp in milliseconds (optional)
             limit: Number of candles (default: 500, max: 1000)
+            as_arrays: Return NumPy arrays instead of dicts (requires numpy).
+                True for a dict of columns, 'structured' for a structured
+                array; rows are ordered by time ascending. Default: False
 
         Returns:
-            List of candlestick data
+            List of candlestick data (newest first), or arrays as described
+            for as_arrays
 
         Example:
             >>> client = Client()
             >>> candles = client.get_candles('KC-BTC_USDT', '1h', limit=100)
+            >>> arrays = client.get_candles('KC-BTC_USDT', '1h', limit=100, as_arrays=True)
+            >>> arrays['close'].mean()
+        """
+        return self.market.get_candles(pair, interval, start_time, end_time, limit, as_arrays)
+
+    def get_candles_range(
+        self,
+        pair: str,
+        interval: str,
+        start_time: int,
+        end_time: int,
+        limit: int = MAX_CANDLES_PER_REQUEST,
+        max_workers: int = 8,
+        as_arrays: Union[bool, str] = False,
+    ) -> Any:
+        """
+        Get candlestick data for an arbitrarily long time range
+
+        The range is split into windows of at most `limit` candles, which are
+        fetched concurrently through batch(), so a configured rate limiter
+        paces them. Candles on window boundaries are de-duplicated.
+
+        Args:
+            pair: Market pair (e.g., 'KC-BTC_USDT')
+            interval: Candlestick interval (e.g., '1m', '5m', '1h', '1d')
+            start_time: Start timestamp in milliseconds
+            end_time: End timestamp in milliseconds (inclusive)
+            limit: Candles per request (default: 1000, the API maximum)
+            max_workers: Maximum requests in flight at once (default: 8)
+            as_arrays: Return NumPy arrays instead of dicts, as for
+                get_candles. Default: False
+
+        Returns:
+            List of candlestick data sorted by time ascending (note: a single
+            get_candles call returns newest first), or arrays
+
+        Raises:
+            ValueError: If the interval is unknown or end_time < start_time
+            CoinDCXException: If any window fails
+
+        Example:
+            >>> import time
+            >>> client = Client(rate_limiter=RateLimiter(global_limits=GENERAL_RATE_LIMITS))
+            >>> end = int(time.time() * 1000)
+            >>> candles = client.get_candles_range(
+            ...     'B-BTC_USDT', '1m', end - 90 * 24 * 3600 * 1000, end
+            ... )
         """
-        return self.market.get_candles(pair, interval, start_time, end_time, limit)
+        step = interval_ms(interval)
+        calls = [
+            ('get_candles', (pair, interval, window_start, window_end, limit), {})
+            for window_start, window_end in split_range(start_time, end_time, step, limit)
+        ]
+
+        def _merge(chunks):
+            candles = merge_candles(chunks, start_time, end_time)
+            if as_arrays:
+                return candles_to_arrays(candles, structured=as_arrays == 'structured')
+            return candles
+
+        # Positional so AsyncClient.batch (max_concurrency) accepts it too
+        return then(self.batch(calls, max_workers, False), _merge)
 
     # ===== Authenticated Endpoints =====
     # Delegated to SpotEndpoints
@@ -457,7 +983,8 @@ class Client:
         from_time: int,
         to_time: int,
         resolution: str,
-    ) -> dict:
+        as_arrays: Union[bool, str] = False,
+    ) -> Any:
         """
         Get candlestick data for a futures instrument
 
@@ -467,11 +994,15 @@ class Client:
             to_time: End timestamp in seconds (EPOCH)
             resolution: Candle resolution - '1' (1min), '5' (5min), '60' (1hour), '1D' (1day)
                        Use FuturesResolution enum for type safety
+            as_arrays: Return the candles as NumPy arrays instead of the
+                response dict (requires numpy). True for a dict of columns,
+                'structured' for a structured array. Default: False
 
         Returns:
             Dictionary with candlestick data containing:
                 - s: status ("ok" if successful)
                 - data: List of candle objects with open, high, low, close, volume, time
+            or arrays as described for as_arrays
 
         Example:
             >>> from coindcx import Client, FuturesResolution
@@ -492,7 +1023,96 @@ class Client:
             - Resolution uses different format than spot: '1', '5', '60', '1D'
             - This is a public endpoint, no authentication required
         """
-        return self.futures.get_futures_candles(pair, from_time, to_time, resolution)
+        return self.futures.get_futures_candles(pair, from_time, to_time, resolution, as_arrays)
+
+    def get_futures_candles_range(
+        self,
+        pair: str,
+        from_time: int,
+        to_time: int,
+        resolution: str,
+        limit: int = FUTURES_CANDLES_PER_REQUEST,
+        max_workers: int = 8,
+        as_arrays: Union[bool, str] = False,
+    ) -> dict:
+        """
+        Get futures candlestick data for an arbitrarily long time range
+
+        The range is split into windows of at most `limit` candles for the
+        resolution (e.g. ~16.6 hours of '1' candles, ~41 days of '60'
+        candles), which are fetched concurrently through batch(). Candles on
+        window boundaries are de-duplicated.
+
+        Args:
+            pair: Futures pair (e.g., 'B-BTC_USDT')
+            from_time: Start timestamp in seconds (EPOCH)
+            to_time: End timestamp in seconds (EPOCH, inclusive)
+            resolution: Candle resolution - '1', '5', '60' or '1D'
+                (or FuturesResolution)
+            limit: Candles per request (default: 1000)
+            max_workers: Maximum requests in flight at once (default: 8)
+            as_arrays: Put NumPy arrays in 'data' instead of candle dicts, as
+                for get_futures_candles. Default: False
+
+        Returns:
+            Dictionary shaped like get_futures_candles, plus gaps:
+                - s: "ok"
+                - data: Candles sorted by time ascending (arrays if as_arrays)
+                - gaps: List of (first_missing, last_missing) candle open
+                  times in milliseconds, empty if the series is complete
+
+        Raises:
+            ValueError: If the resolution is unknown or to_time < from_time
+            CoinDCXException: If any window fails
+
+        Example:
+            >>> import time
+            >>> client = Client()
+            >>> to_time = int(time.time())
+            >>> candles = client.get_futures_candles_range(
+            ...     'B-BTC_USDT', to_time - 365 * 24 * 3600, to_time, FuturesResolution.ONE_HOUR
+            ... )
+            >>> if candles['gaps']:
+            ...     print(f"Missing {len(candles['gaps'])} stretches")
+        """
+        step = resolution_seconds(resolution)
+        calls = [
+            ('get_futures_candles', (pair, window_start, window_end, resolution), {})
+            for window_start, window_end in split_range(from_time, to_time, step, limit)
+        ]
+
+        def _merge(responses):
+            start, end = from_time * 1000, to_time * 1000
+            data = merge_candles(
+                [(response or {}).get('data') for response in responses], start, end
+            )
+            gaps = find_gaps(data, step * 1000, start, end)
+            if as_arrays:
+                data = candles_to_arrays(data, structured=as_arrays == 'structured')
+            return {'s': 'ok', 'data': data, 'gaps': gaps}
+
+        # Positional so AsyncClient.batch (max_concurrency) accepts it too
+        return then(self.batch(calls, max_workers, False), _merge)
+
+    def get_futures_orderbook(self, pair: str, depth: int = 50, as_book: bool = False) -> Any:
+        """
+        Get order book depth for a futures instrument
+
+        Args:
+            pair: Futures pair (e.g., 'B-BTC_USDT')
+            depth: Number of levels per side - 10, 20 or 50 (default: 50)
+            as_book: Return a sorted OrderBook instead of the raw response.
+                Default: False
+
+        Returns:
+            Dictionary with ts, vs, bids and asks, or an OrderBook if as_book is True
+
+        Example:
+            >>> client = Client()
+            >>> book = client.get_futures_orderbook('B-BTC_USDT', as_book=True)
+            >>> print(book.best_bid, book.best_ask)
+        """
+        return self.futures.get_orderbook(pair, depth, as_book)
 
     def get_active_instruments(self, margin_currency_short_name: Optional[list] = None) -> list:
         """
@@ -779,6 +1399,21 @@ class Client:
             margin_currency_short_name=margin_currency_short_name,
         )
 
+    def get_futures_wallets(self) -> list:
+        """
+        Get futures wallet balances
+
+        Returns:
+            List of wallet dictionaries (currency_short_name, balance,
+            locked_balance, cross_order_margin, cross_user_margin)
+
+        Example:
+            >>> client = Client(api_key='...', api_secret='...')
+            >>> usdt = next(w for w in client.get_futures_wallets() if w['currency_short_name'] == 'USDT')
+            >>> print(usdt['balance'], usdt['locked_balance'])
+        """
+        return self.futures.get_wallets()
+
     def get_positions_by_filters(
         self,
         page: int = 1,
@@ -851,9 +1486,158 @@ class Client:
         """
         return self.futures.exit_position(position_id)
 
+    # ===== Batch Execution =====
+
+    def _resolve_call(self, call: Sequence) -> Tuple[Callable, tuple, dict]:
+        """
+        Turn a batch call description into a bound method and its arguments
+
+        Args:
+            call: (method_name,), (method_name, kwargs) or (method_name, args, kwargs)
+
+        Returns:
+            Tuple of (bound method, args, kwargs)
+
+        Raises:
+            ValueError: If the description is malformed or names an unknown method
+        """
+        if isinstance(call, str):
+            call = (call,)
+
+        if not call or len(call) > 3:
+            raise ValueError(f"Invalid batch call: {call!r}")
+
+        name = call[0]
+        args: tuple = ()
+        kwargs: dict = {}
+        if len(call) == 2:
+            if isinstance(call[1], dict):
+                kwargs = call[1]
+            else:
+                args = tuple(call[1])
+        elif len(call) == 3:
+            args, kwargs = tuple(call[1]), dict(call[2])
+
+        if not isinstance(name, str) or name.startswith('_') or name in _NON_BATCHABLE:
+            raise ValueError(f"Method cannot be batched: {name!r}")
+
+        method = getattr(self, name, None)
+        if not callable(method):
+            raise ValueError(f"Unknown client method: {name!r}")
+
+        return method, args, kwargs
+
+    def batch(
+        self,
+        calls: Iterable[Sequence],
+        max_workers: int = 8,
+        return_exceptions: bool = True,
+    ) -> List[Any]:
+        """
+        Run many client calls concurrently on a thread pool
+
+        All calls share this client's session, rate limiter, retry policy and
+        cache. When a rate limiter is configured, workers wait for their
+        endpoint's budget, so the batch never exceeds per-endpoint limits.
+        Use pool_maxsize >= max_workers to avoid opening throwaway connections.
+
+        Args:
+            calls: Call descriptions, each (method_name, kwargs),
+                (method_name, args, kwargs) or just method_name
+            max_workers: Maximum calls in flight at once (default: 8)
+            return_exceptions: Put exceptions in the result list instead of
+                raising (default: True)
+
+        Returns:
+            List of results (or exceptions) in input order
+
+        Raises:
+            ValueError: If a call description is invalid
+            CoinDCXException: The first failure in input order, if
+                return_exceptions is False
+
+        Example:
+            >>> client = Client(rate_limiter=True, pool_maxsize=16)
+            >>> pairs = ['B-BTC_USDT', 'B-ETH_USDT']
+            >>> books = client.batch(
+            ...     [('get_orderbook', {'pair': pair}) for pair in pairs],
+            ...     max_workers=16,
+            ... )
+        """
+        from concurrent.futures import ThreadPoolExecutor
+
+        resolved = [self._resolve_call(call) for call in calls]
+        if not resolved:
+            return []
+
+        with ThreadPoolExecutor(max_workers=max(1, min(max_workers, len(resolved)))) as executor:
+            futures = [
+                executor.submit(method, *args, **kwargs) for method, args, kwargs in resolved
+            ]
+
+            results = []
+            for future in futures:
+                error = future.exception()
+                if error is None:
+                    results.append(future.result())
+                elif return_exceptions:
+                    results.append(error)
+                else:
+                    for pending in futures:
+                        pending.cancel()
+                    raise error
+
+        return results
+
+    def batch_stream(
+        self,
+        calls: Iterable[Sequence],
+        max_workers: int = 8,
+    ) -> Iterator[Tuple[int, Any]]:
+        """
+        Run many client calls concurrently, yielding results as they finish
+
+        Args:
+            calls: Call descriptions, as for batch()
+            max_workers: Maximum calls in flight at once (default: 8)
+
+        Yields:
+            Tuples of (input index, result or exception) in completion order
+
+        Raises:
+            ValueError: If a call description is invalid
+
+        Example:
+            >>> calls = [('get_trades', {'pair': pair}) for pair in pairs]
+            >>> for index, result in client.batch_stream(calls):
+            ...     if isinstance(result, Exception):
+            ...         print(f"{pairs[index]} failed: {result}")
+        """
+        from concurrent.futures import ThreadPoolExecutor, as_completed
+
+        resolved = [self._resolve_call(call) for call in calls]
+        if not resolved:
+            return
+
+        with ThreadPoolExecutor(max_workers=max(1, min(max_workers, len(resolved)))) as executor:
+            futures = {
+                executor.submit(method, *args, **kwargs): index
+                for index, (method, args, kwargs) in enumerate(resolved)
+            }
+            try:
+                for future in as_completed(futures):
+                    error = future.exception()
+                    yield futures[future], (future.result() if error is None else error)
+            finally:
+                # Consumer stopped early: do not start calls that are still queued
+                for future in futures:
+                    future.cancel()
+
     def close(self):
         """Close the client session"""
-        self.session.close()
+        if self._session is not None:
+            self._session.close()
+            self._session = None
 
     def __enter__(self):
         """Context manager entry"""
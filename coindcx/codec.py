@@ -0,0 +1,136 @@
+"""
+CoinDCX JSON Codecs
+
+Pluggable JSON encoding for request bodies and decoding for responses.
+The fastest available library is used by default, falling back to the
+standard library json module.
+"""
+
+import json
+from typing import Any, Union
+
+
+def _default(obj: Any) -> Any:
+    """Convert numpy scalars and other number-like values for encoding"""
+    item = getattr(obj, 'item', None)
+    if item is not None:
+        return item()
+    try:
+        return float(obj)
+    except (TypeError, ValueError):
+        raise TypeError(f"Type is not JSON serializable: {type(obj).__name__}") from None
+
+
+class JSONCodec:
+    """
+    Standard library JSON codec
+
+    Encodes compactly (no whitespace) to UTF-8 bytes. The encoded bytes are
+    both signed and sent on the wire, so the signature always matches the
+    body regardless of codec.
+    """
+
+    name = 'json'
+
+    def dumps(self, obj: Any) -> bytes:
+        """
+        Encode an object as compact JSON
+
+        Args:
+            obj: Object to encode
+
+        Returns:
+            UTF-8 encoded JSON bytes
+        """
+        return json.dumps(obj, separators=(',', ':'), default=_default).encode('utf-8')
+
+    def loads(self, data: Union[bytes, str]) -> Any:
+        """
+        Decode JSON
+
+        Args:
+            data: JSON document as bytes or str
+
+        Returns:
+            Decoded object
+
+        Raises:
+            ValueError: If data is not valid JSON
+        """
+        return json.loads(data)
+
+
+class OrjsonCodec(JSONCodec):
+    """
+    orjson-backed JSON codec
+
+    Requires the optional orjson dependency: pip install coindcx[fast]
+    """
+
+    name = 'orjson'
+
+    def __init__(self):
+        import orjson
+        self._orjson = orjson
+        self._option = orjson.OPT_SERIALIZE_NUMPY
+
+    def dumps(self, obj: Any) -> bytes:
+        """
+        Encode an object as compact JSON
+
+        numpy scalars and arrays (e.g., from MarketRules.round_prices) are
+        encoded as plain numbers and lists, as with the json codec.
+
+        Args:
+            obj: Object to encode
+
+        Returns:
+            UTF-8 encoded JSON bytes
+        """
+        return self._orjson.dumps(obj, default=_default, option=self._option)
+
+    def loads(self, data: Union[bytes, str]) -> Any:
+        """
+        Decode JSON
+
+        Args:
+            data: JSON document as bytes or str
+
+        Returns:
+            Decoded object
+
+        Raises:
+            ValueError: If data is not valid JSON
+        """
+        return self._orjson.loads(data)
+
+
+def get_codec(codec: Union[str, JSONCodec] = 'auto') -> JSONCodec:
+    """
+    Resolve a codec name to a codec instance
+
+    Args:
+        codec: 'auto' (orjson if installed, else json), 'orjson', 'json',
+            or a JSONCodec instance
+
+    Returns:
+        JSONCodec instance
+
+    Raises:
+        ImportError: If 'orjson' is requested but not installed
+        ValueError: If the codec name is unknown
+    """
+    if isinstance(codec, JSONCodec):
+        return codec
+
+    if codec == 'auto':
+        try:
+            return OrjsonCodec()
+        except ImportError:
+            return JSONCodec()
+    if codec == 'orjson':
+        return OrjsonCodec()
+    if codec == 'json':
+        return JSONCodec()
+
+    raise ValueError(f"Unknown JSON codec: {codec!r}")
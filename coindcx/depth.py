@@ -0,0 +1,270 @@
+"""
+CoinDCX Local Order Book
+
+Keeps an OrderBook current from depth-snapshot and depth-update stream
+events, checking version and timestamp order and resyncing from the REST
+order book when updates are missed.
+"""
+
+import time
+from typing import Any, Callable, Dict, List, Optional
+
+from .endpoints.utils import then
+from .orderbook import OrderBook
+
+
+def decode_event(payload: Any, loads: Optional[Callable[[Any], Any]] = None) -> Any:
+    """
+    Unwrap a stream event payload
+
+    Socket.IO events carry the message either directly or as a JSON string
+    in a 'data' field.
+
+    Args:
+        payload: Event payload as received from the stream
+        loads (optional): JSON decoder for string messages. Default:
+            json.loads
+
+    Returns:
+        Message dictionary (or list, for events that carry one)
+    """
+    if isinstance(payload, dict) and 'data' in payload and not ('bids' in payload or 'asks' in payload):
+        payload = payload['data']
+    if isinstance(payload, (str, bytes, bytearray)):
+        if loads is None:
+            import json
+            loads = json.loads
+        payload = loads(payload)
+    return payload
+
+
+class LocalOrderBook:
+    """
+    Order book kept in sync from depth stream events
+
+    Start from a snapshot (a REST call via sync(), or a depth-snapshot event)
+    and feed every depth-update event to on_update(). Each update must carry
+    a newer version ('vs') and must not go back in time ('ts'); stale or
+    duplicate updates are dropped. With strict_sequence, a version jump
+    means updates were missed, and the book resyncs, at most once per
+    min_resync_interval. Updates received while unsynced are buffered and
+    replayed on top of the next snapshot, skipping those it already
+    includes (by 'vs', else 'ts'); a snapshot with neither discards them.
+
+    The book itself is a plain OrderBook, so reads (best bid/ask, top-N,
+    VWAP) never touch the network.
+
+    Args:
+        pair (str): Market or instrument pair (e.g., 'B-BTC_USDT')
+        client (Client, optional): Client used to fetch REST snapshots. If
+            None, the book waits for the next depth-snapshot event instead
+        futures (bool, optional): Track the futures instrument book.
+            Default: False
+        depth (int, optional): Book depth - 10, 20 or 50. Default: 20
+        strict_sequence (bool, optional): Treat any version jump larger than
+            1 as a gap. Disable if the feed's versions are not contiguous.
+            Default: True
+        max_buffer (int, optional): Updates kept while waiting for a
+            snapshot. Default: 1000
+        min_resync_interval (float, optional): Fewest seconds between REST
+            snapshot requests; a gap sooner than this waits, buffering
+            updates. Default: 1
+
+    Example:
+        >>> import socketio
+        >>> local = LocalOrderBook('B-BTC_USDT', client=Client())
+        >>> sio = socketio.Client()
+        >>> sio.on('depth-snapshot', local.on_snapshot)
+        >>> sio.on('depth-update', local.on_update)
+        >>> sio.connect(STREAM_URL, transports='websocket')
+        >>> sio.emit('join', {'channelName': local.channel})
+        >>> local.sync()
+        >>> local.book.best_bid
+    """
+
+    def __init__(
+        self,
+        pair: str,
+        client: Optional[Any] = None,
+        futures: bool = False,
+        depth: int = 20,
+        strict_sequence: bool = True,
+        max_buffer: int = 1000,
+        min_resync_interval: float = 1.0,
+    ):
+        self.pair = pair
+        self.client = client
+        self.futures = futures
+        self.depth = depth
+        self.strict_sequence = strict_sequence
+        self.max_buffer = max_buffer
+        self.min_resync_interval = min_resync_interval
+
+        self.book = OrderBook(pair=pair)
+        self.synced = False
+        self.updates = 0
+        self.dropped = 0
+        self.resyncs = 0
+        self._buffer: List[Dict[str, Any]] = []
+        self._last_sync: Optional[float] = None
+        self._sync_pending = False
+
+    @property
+    def channel(self) -> str:
+        """Stream channel name for this book"""
+        suffix = '-futures' if self.futures else ''
+        return f"{self.pair}@orderbook@{self.depth}{suffix}"
+
+    def sync(self) -> Any:
+        """
+        Load a fresh snapshot from the REST order book endpoint
+
+        Spot REST snapshots carry no version, so the first update after one
+        is accepted as the new baseline. Futures snapshots carry 'vs' and
+        'ts' and are checked like stream snapshots.
+
+        Returns:
+            None (an awaitable with an AsyncClient)
+
+        Raises:
+            ValueError: If the book has no client
+        """
+        if self.client is None:
+            raise ValueError("LocalOrderBook has no client; wait for a depth-snapshot event instead")
+
+        self._last_sync = time.monotonic()
+        self._sync_pending = False
+        if self.futures:
+            response = self.client.get_futures_orderbook(self.pair, self.depth)
+        else:
+            response = self.client.get_orderbook(self.pair)
+        return then(response, self.on_snapshot)
+
+    def on_snapshot(self, payload: Any):
+        """
+        Replace the book with a snapshot and replay buffered updates
+
+        Args:
+            payload: depth-snapshot event or REST order book response
+        """
+        message = decode_event(payload)
+        book = self.book
+        book.load(message.get('bids'), message.get('asks'))
+        book.version = message.get('vs')
+        book.timestamp = message.get('ts')
+        self.synced = True
+
+        buffered, self._buffer = self._buffer, []
+        if book.version is None and book.timestamp is None:
+            # Nothing to order them against; replaying could overwrite
+            # newer levels with stale quantities
+            self.dropped += len(buffered)
+            return
+        for update in buffered:
+            if book.version is not None and update.get('vs') is not None:
+                stale = update['vs'] <= book.version
+            else:
+                stale = book.timestamp is not None and (update.get('ts') or 0) <= book.timestamp
+            if stale:
+                self.dropped += 1
+                continue
+            self._apply(update)
+
+    def on_update(self, payload: Any) -> Any:
+        """
+        Apply a depth-update event
+
+        Args:
+            payload: depth-update event
+
+        Returns:
+            True if the update was applied, False if it was buffered or
+            dropped. When it reveals a gap, or a deferred resync comes due,
+            the result of the resync: None, or an awaitable with an
+            AsyncClient.
+        """
+        message = decode_event(payload)
+
+        if not self.synced:
+            self._buffer.append(message)
+            if len(self._buffer) > self.max_buffer:
+                del self._buffer[0]
+                self.dropped += 1
+            if self._sync_pending:
+                return self._throttled_sync()
+            return False
+
+        book = self.book
+        version = message.get('vs')
+        if book.version is not None and version is not None:
+            if version <= book.version:
+                self.dropped += 1
+                return False
+            if self.strict_sequence and version != book.version + 1:
+                self._buffer.append(message)
+                return self.resync()
+
+        timestamp = message.get('ts')
+        if book.timestamp is not None and timestamp is not None and timestamp < book.timestamp:
+            self.dropped += 1
+            return False
+
+        self._apply(message)
+        return True
+
+    def _apply(self, message: Dict[str, Any]):
+        """Apply an update's level changes and advance version/timestamp"""
+        book = self.book
+        book.update(message.get('bids'), message.get('asks'))
+        if message.get('vs') is not None:
+            book.version = message['vs']
+        if message.get('ts') is not None:
+            book.timestamp = message['ts']
+        self.updates += 1
+
+    def resync(self) -> Any:
+        """
+        Mark the book stale and reload it
+
+        Updates keep being buffered until the snapshot arrives. Without a
+        client the book waits for the next depth-snapshot event. Within
+        min_resync_interval of the last snapshot request, the request is
+        deferred to the first update after the interval.
+
+        Returns:
+            None (an awaitable with an AsyncClient)
+        """
+        self.synced = False
+        self.resyncs += 1
+        if self.client is None:
+            return None
+        return self._throttled_sync()
+
+    def _throttled_sync(self) -> Any:
+        """Request a snapshot now, or defer it until min_resync_interval has passed"""
+        last = self._last_sync
+        if last is not None and time.monotonic() - last < self.min_resync_interval:
+            self._sync_pending = True
+            return None
+        return self.sync()
+
+    def handle(self, event: str, payload: Any) -> Any:
+        """
+        Dispatch a stream event by name
+
+        Args:
+            event: 'depth-snapshot' or 'depth-update'; others are ignored
+            payload: Event payload
+
+        Returns:
+            Result of on_update for updates, otherwise None
+        """
+        if event == 'depth-snapshot':
+            return self.on_snapshot(payload)
+        if event == 'depth-update':
+            return self.on_update(payload)
+        return None
+
+    def __repr__(self):
+        state = 'synced' if self.synced else 'stale'
+        return f"LocalOrderBook({self.channel} {state} version={self.book.version} {self.book!r})"
@@ -4,7 +4,9 @@ CoinDCX Futures Trading Endpoints
 Endpoints for futures trading operations.
 """
 
-from typing import Callable, Optional, Union
+from functools import partial
+from typing import Any, Callable, Optional, Union
+from ..candles import candles_to_arrays
 from ..enums import (
     OrderSide,
     FuturesOrderType,
@@ -14,6 +16,8 @@ from ..enums import (
     PositionMarginType,
 )
 from ..exceptions import CoinDCXInvalidOrderException
+from ..orderbook import OrderBook
+from .utils import then
 
 
 class FuturesEndpoints:
@@ -32,16 +36,24 @@ class FuturesEndpoints:
     - Get futures order history (authenticated)
     """
 
-    def __init__(self, get_handler: Callable, post_handler: Callable):
+    def __init__(
+        self,
+        get_handler: Callable,
+        post_handler: Callable,
+        signed_get_handler: Optional[Callable] = None,
+    ):
         """
         Initialize futures trading endpoints
 
         Args:
             get_handler: Function to make public HTTP GET requests (typically client._get)
             post_handler: Function to make authenticated HTTP POST requests (typically client._post)
+            signed_get_handler: Function to make authenticated HTTP GET requests
+                               (typically client._signed_get)
         """
         self._get = get_handler
         self._post = post_handler
+        self._signed_get = signed_get_handler
 
     def get_futures_candles(
         self,
@@ -49,7 +61,8 @@ class FuturesEndpoints:
         from_time: int,
         to_time: int,
         resolution: str,
-    ) -> dict:
+        as_arrays: Union[bool, str] = False,
+    ) -> Any:
         """
         Get candlestick data for a futures instrument
 
@@ -58,11 +71,15 @@ class FuturesEndpoints:
             from_time: Start timestamp in seconds (EPOCH)
             to_time: End timestamp in seconds (EPOCH)
             resolution: Candle resolution - '1' (1min), '5' (5min), '60' (1hour), '1D' (1day)
+            as_arrays: Return the candles as NumPy arrays instead of the
+                response dict (requires numpy). True for a dict of columns,
+                'structured' for a structured array. Default: False
 
         Returns:
             Dictionary with candlestick data containing:
                 - s: status ("ok" if successful)
                 - data: List of candle objects with open, high, low, close, volume, time
+            or arrays as described for as_arrays
 
         Example:
             >>> client = Client()
@@ -88,7 +105,44 @@ class FuturesEndpoints:
             'pcode': 'f',  # Static value 'f' denotes futures product
         }
 
-        return self._get('/market_data/candlesticks', params=params, use_public_url=True)
+        response = self._get('/market_data/candlesticks', params=params, use_public_url=True)
+        if as_arrays:
+            return then(response, partial(candles_to_arrays, structured=as_arrays == 'structured'))
+        return response
+
+    def get_orderbook(self, pair: str, depth: int = 50, as_book: bool = False) -> Any:
+        """
+        Get order book depth for a futures instrument
+
+        Args:
+            pair: Futures pair (e.g., 'B-BTC_USDT')
+            depth: Number of levels per side - 10, 20 or 50 (default: 50)
+            as_book: Return a sorted OrderBook instead of the raw response.
+                Default: False
+
+        Returns:
+            Dictionary containing:
+                - ts: Epoch timestamp in milliseconds
+                - vs: Version
+                - bids: Price string -> quantity string
+                - asks: Price string -> quantity string
+            or an OrderBook if as_book is True
+
+        Example:
+            >>> client = Client()
+            >>> book = client.get_futures_orderbook('B-BTC_USDT', depth=20)
+            >>> print(book['asks'])
+
+        Note:
+            - This is a public endpoint, no authentication required
+        """
+        response = self._get(
+            f'/market_data/v3/orderbook/{pair}-futures/{depth}',
+            use_public_url=True,
+        )
+        if as_book:
+            return then(response, partial(OrderBook.from_response, pair=pair))
+        return response
 
     def get_active_instruments(self, margin_currency_short_name: Optional[list] = None) -> list:
         """
@@ -355,11 +409,7 @@ class FuturesEndpoints:
         # Make request (timestamp added automatically by _post)
         response = self._post('/exchange/v1/derivatives/futures/orders/create', data=data)
 
-        # Extract first order from array response
-        if isinstance(response, list) and len(response) > 0:
-            return response[0]
-
-        return response
+        return then(response, _extract_first_order)
 
     def list_orders(
         self,
@@ -479,6 +529,29 @@ class FuturesEndpoints:
             use_public_url=False
         )
 
+    def get_wallets(self) -> list:
+        """
+        Get futures wallet balances
+
+        These are the balances that balance-update events on the private
+        stream refer to; spot balances come from get_balances().
+
+        Returns:
+            List of wallet dictionaries containing:
+                - id: Wallet ID
+                - currency_short_name: Margin currency (e.g., 'USDT', 'INR')
+                - balance: Wallet balance
+                - locked_balance: Balance locked in orders and positions
+                - cross_order_margin: Margin locked in cross margin orders
+                - cross_user_margin: Margin used by cross margin positions
+
+        Example:
+            >>> client = Client(api_key='...', api_secret='...')
+            >>> for wallet in client.get_futures_wallets():
+            ...     print(wallet['currency_short_name'], wallet['balance'])
+        """
+        return self._signed_get('/exchange/v1/derivatives/futures/wallets')
+
     def list_positions(
         self,
         page: int = 1,
@@ -664,3 +737,11 @@ class FuturesEndpoints:
     # - update_leverage()
     # - get_futures_transactions()
     # - get_futures_order_history()
+
+
+def _extract_first_order(response):
+    """Extract the first order from an array create order response"""
+    if isinstance(response, list) and len(response) > 0:
+        return response[0]
+
+    return response
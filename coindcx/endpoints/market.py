@@ -4,7 +4,13 @@ CoinDCX Market Data Endpoints
 Public endpoints for market data including ticker, trades, orderbook, and candles.
 """
 
-from typing import Optional, Any, Dict, Callable
+from functools import partial
+from typing import Optional, Any, Dict, Callable, Union
+
+from ..candles import candles_to_arrays
+from ..markets import MarketIndex
+from ..orderbook import OrderBook
+from .utils import then
 
 
 class MarketEndpoints:
@@ -55,18 +61,26 @@ class MarketEndpoints:
         """
         return self._get('/exchange/v1/markets')
 
-    def get_markets_details(self) -> list:
+    def get_markets_details(self, as_index: bool = False) -> Any:
         """
         Get detailed information about all markets
 
+        Args:
+            as_index: Return a MarketIndex keyed by symbol and pair, with
+                per-market rounding and order checks. Default: False
+
         Returns:
-            List of market details including precision, limits, etc.
+            List of market details including precision, limits, etc., or a
+            MarketIndex if as_index is True
 
         Example:
             >>> client = Client()
             >>> details = client.get_markets_details()
         """
-        return self._get('/exchange/v1/markets_details')
+        response = self._get('/exchange/v1/markets_details')
+        if not as_index:
+            return response
+        return then(response, MarketIndex.from_response)
 
     def get_trades(self, pair: str, limit: int = 30) -> list:
         """
@@ -86,15 +100,18 @@ class MarketEndpoints:
         params = {'pair': pair, 'limit': limit}
         return self._get('/market_data/trade_history', params=params, use_public_url=True)
 
-    def get_orderbook(self, pair: str) -> dict:
+    def get_orderbook(self, pair: str, as_book: bool = False) -> Any:
         """
         Get order book for a market pair
 
         Args:
             pair: Market pair (e.g., 'KC-BTC_USDT')
+            as_book: Return a sorted OrderBook instead of the raw response.
+                Default: False
 
         Returns:
-            Order book with bids and asks
+            Order book with bids and asks (price string -> quantity string),
+            or an OrderBook if as_book is True
 
         Example:
             >>> client = Client()
@@ -102,7 +119,10 @@ class MarketEndpoints:
             >>> print(orderbook['bids'])
         """
         params = {'pair': pair}
-        return self._get('/market_data/orderbook', params=params, use_public_url=True)
+        response = self._get('/market_data/orderbook', params=params, use_public_url=True)
+        if as_book:
+            return then(response, partial(OrderBook.from_response, pair=pair))
+        return response
 
     def get_candles(
         self,
@@ -111,7 +131,8 @@ class MarketEndpoints:
         start_time: Optional[int] = None,
         end_time: Optional[int] = None,
         limit: int = 500,
-    ) -> list:
+        as_arrays: Union[bool, str] = False,
+    ) -> Any:
         """
         Get candlestick data for a market pair
 
@@ -121,9 +142,13 @@ class MarketEndpoints:
             start_time: Start timestamp in milliseconds (optional)
             end_time: End timestamp in milliseconds (optional)
             limit: Number of candles (default: 500, max: 1000)
+            as_arrays: Return NumPy arrays instead of dicts (requires numpy).
+                True for a dict of columns, 'structured' for a structured
+                array; rows are ordered by time ascending. Default: False
 
         Returns:
-            List of candlestick data
+            List of candlestick data (newest first), or arrays as described
+            for as_arrays
 
         Example:
             >>> client = Client()
@@ -135,9 +160,12 @@ class MarketEndpoints:
             'limit': limit,
         }
 
-        if start_time:
+        if start_time is not None:
             params['startTime'] = start_time
-        if end_time:
+        if end_time is not None:
             params['endTime'] = end_time
 
-        return self._get('/market_data/candles', params=params, use_public_url=True)
+        response = self._get('/market_data/candles', params=params, use_public_url=True)
+        if as_arrays:
+            return then(response, partial(candles_to_arrays, structured=as_arrays == 'structured'))
+        return response
@@ -7,6 +7,7 @@ Endpoints for spot trading, account balances, and order management.
 from typing import Callable, Union, Optional
 from ..enums import OrderSide, OrderType
 from ..exceptions import CoinDCXInvalidOrderException
+from .utils import then
 
 
 class SpotEndpoints:
@@ -152,8 +153,12 @@ class SpotEndpoints:
         # Make request (timestamp added automatically by _post)
         response = self._post('/exchange/v1/orders/create', data=data)
 
-        # Extract order from response
-        if isinstance(response, dict) and 'orders' in response:
-            return response['orders'][0] if response['orders'] else response
+        return then(response, _extract_order)
 
-        return response
+
+def _extract_order(response):
+    """Extract the created order from a create order response"""
+    if isinstance(response, dict) and 'orders' in response:
+        return response['orders'][0] if response['orders'] else response
+
+    return response
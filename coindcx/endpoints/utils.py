@@ -0,0 +1,37 @@
+"""
+CoinDCX Endpoint Helpers
+
+Small utilities shared by the endpoint modules.
+"""
+
+from typing import Any, Callable
+
+
+def then(result: Any, callback: Callable[[Any], Any]) -> Any:
+    """
+    Apply a post-processing callback to a request handler result
+
+    Endpoint classes are shared between Client and AsyncClient. With the
+    sync client the handler returns the parsed response directly; with the
+    async client it returns an awaitable. This helper applies the callback
+    in either case, so endpoint methods keep a single code path. If the
+    callback itself returns an awaitable (a follow-up request), it is
+    awaited too, so callbacks can chain further requests.
+
+    Args:
+        result: Value or awaitable returned by a request handler
+        callback: Function applied to the parsed response
+
+    Returns:
+        Callback result, or an awaitable resolving to it
+    """
+    # Checked by attribute rather than inspect.isawaitable to keep imports light
+    if hasattr(result, '__await__'):
+        async def _apply():
+            value = callback(await result)
+            if hasattr(value, '__await__'):
+                value = await value
+            return value
+        return _apply()
+
+    return callback(result)
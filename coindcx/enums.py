@@ -134,6 +134,20 @@ class FuturesResolution(str, Enum):
     ONE_DAY = "1D"
 
 
+class StreamEvent(str, Enum):
+    """Socket.IO event names on the CoinDCX stream"""
+    DEPTH_SNAPSHOT = "depth-snapshot"
+    DEPTH_UPDATE = "depth-update"
+    NEW_TRADE = "new-trade"
+    CANDLESTICK = "candlestick"
+    CURRENT_PRICES = "currentPrices@spot#update"
+    PRICE_STATS = "priceStats@spot#update"
+    PRICE_CHANGE = "price-change"
+    DF_POSITION_UPDATE = "df-position-update"
+    DF_ORDER_UPDATE = "df-order-update"
+    BALANCE_UPDATE = "balance-update"
+
+
 # API Base URLs
 API_BASE_URL = "https://api.coindcx.com"
 PUBLIC_BASE_URL = "https://public.coindcx.com"
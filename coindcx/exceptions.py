@@ -35,7 +35,10 @@ class CoinDCXAuthenticationException(CoinDCXException):
 
 class CoinDCXRateLimitException(CoinDCXException):
     """Exception for rate limit errors"""
-    pass
+
+    def __init__(self, message, status_code=None, response=None, retry_after=None):
+        super().__init__(message, status_code=status_code, response=response)
+        self.retry_after = retry_after
 
 
 class CoinDCXOrderException(CoinDCXException):
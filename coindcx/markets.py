@@ -0,0 +1,505 @@
+"""
+CoinDCX Market Rules
+
+Index of get_markets_details() keyed by symbol, pair and CoinDCX name,
+with per-market price and quantity rounding and order checks that run
+locally before an order is sent.
+"""
+
+import math
+from decimal import Decimal
+from typing import Any, Dict, Iterator, List, Optional, Tuple
+
+from .exceptions import CoinDCXInvalidOrderException
+
+
+# Slack for float noise when flooring/ceiling to a tick (0.29 / 0.01 = 28.999999999999996)
+_EPSILON = 1e-9
+
+_LIMIT_ORDER_TYPES = frozenset(('limit_order', 'stop_limit', 'take_profit'))
+
+
+def _decimals(value: float) -> int:
+    """Number of decimal places needed to write value exactly"""
+    exponent = Decimal(repr(float(value))).normalize().as_tuple().exponent
+    return max(0, -exponent)
+
+
+def _value(value: Any) -> Any:
+    """Get the plain string value of an enum member"""
+    return getattr(value, 'value', value)
+
+
+def _number(details: Dict[str, Any], key: str) -> Optional[float]:
+    """Get a numeric field of the market details as a float, or None"""
+    value = details.get(key)
+    return None if value is None else float(value)
+
+
+class MarketRules:
+    """
+    Trading rules of one market
+
+    Tick sizes and decimal places are worked out once from the market
+    details, so rounding and checking an order is a few float operations.
+
+    Prices are rounded to base_currency_precision decimals. Quantities are
+    rounded down to a multiple of step, but never to more than
+    target_currency_precision decimals: the coarser of the two wins, and
+    the smallest quantity accepted is at least one unit of that precision.
+
+    Args:
+        details (dict): One entry of get_markets_details()
+
+    Example:
+        >>> rules = MarketIndex.from_response(client.get_markets_details())['BTCUSDT']
+        >>> rules.round_price(50123.456789, 'buy')
+        >>> rules.round_quantity(0.123456789)
+        >>> rules.check(0.001, 50000)
+    """
+
+    def __init__(self, details: Dict[str, Any]):
+        self.details = details
+        self.symbol: Optional[str] = details.get('symbol')
+        self.pair: Optional[str] = details.get('pair')
+        self.coindcx_name: Optional[str] = details.get('coindcx_name')
+        self.status: Optional[str] = details.get('status')
+        self.order_types = frozenset(details.get('order_types') or ())
+
+        self.min_quantity = _number(details, 'min_quantity')
+        self.max_quantity = _number(details, 'max_quantity')
+        self.min_price = _number(details, 'min_price')
+        self.max_price = _number(details, 'max_price')
+        self.min_notional = _number(details, 'min_notional')
+
+        self.price_precision = int(details.get('base_currency_precision') or 0)
+        self.quantity_precision = int(details.get('target_currency_precision') or 0)
+        self.price_tick = 10.0 ** -self.price_precision
+
+        step = _number(details, 'step')
+        has_precision = details.get('target_currency_precision') is not None
+        precision_step = 10.0 ** -self.quantity_precision
+        if not step:
+            step = precision_step
+        elif has_precision:
+            step = max(step, precision_step)
+        self.quantity_step = step
+        self._quantity_decimals = _decimals(step)
+        if has_precision:
+            self._quantity_decimals = min(self._quantity_decimals, self.quantity_precision)
+        # Smallest quantity the exchange accepts, given the precision
+        self._min_quantity = self.min_quantity
+        if has_precision:
+            self._min_quantity = max(self.min_quantity or 0.0, precision_step)
+        self._price_scale = 10.0 ** self.price_precision
+
+    @property
+    def active(self) -> bool:
+        """Whether the market is open for trading"""
+        return self.status is None or self.status == 'active'
+
+    def round_price(self, price: float, side: Any = None) -> float:
+        """
+        Round a price to the market's tick
+
+        Args:
+            price: Price per unit
+            side (optional): 'buy' rounds down and 'sell' rounds up, so the
+                rounded limit is never more aggressive than requested.
+                Default: round to nearest
+
+        Returns:
+            Rounded price
+        """
+        scaled = price * self._price_scale
+        side = _value(side)
+        if side == 'buy':
+            scaled = math.floor(scaled + _EPSILON)
+        elif side == 'sell':
+            scaled = math.ceil(scaled - _EPSILON)
+        else:
+            scaled = round(scaled)
+        return round(scaled / self._price_scale, self.price_precision)
+
+    def round_quantity(self, quantity: float) -> float:
+        """
+        Round a quantity down to a multiple of the market's step
+
+        Args:
+            quantity: Order quantity
+
+        Returns:
+            Rounded quantity
+        """
+        units = math.floor(quantity / self.quantity_step + _EPSILON)
+        return round(units * self.quantity_step, self._quantity_decimals)
+
+    def _off_tick(self, value: float, tick: float) -> bool:
+        """Whether value is not a whole multiple of tick, allowing for float noise"""
+        units = value / tick
+        return abs(units - round(units)) > _EPSILON * max(1.0, abs(units))
+
+    def check(
+        self,
+        quantity: float,
+        price: Optional[float] = None,
+        order_type: Any = 'limit_order',
+    ):
+        """
+        Check an order against the market's rules
+
+        Args:
+            quantity: Order quantity
+            price (optional): Price per unit; required for limit orders. For
+                market orders, pass a reference price to check min_notional
+            order_type (optional): Order type. Default: 'limit_order'
+
+        Raises:
+            CoinDCXInvalidOrderException: If the exchange would reject the
+                order
+        """
+        order_type = _value(order_type)
+        name = self.symbol or self.pair
+
+        if not self.active:
+            raise CoinDCXInvalidOrderException(f"{name} is not active (status: {self.status})")
+        if self.order_types and order_type not in self.order_types:
+            raise CoinDCXInvalidOrderException(f"{name} does not accept {order_type} orders")
+
+        if not quantity > 0:
+            raise CoinDCXInvalidOrderException(f"quantity must be positive, got {quantity}")
+        if self._min_quantity is not None and quantity < self._min_quantity - _EPSILON * self._min_quantity:
+            raise CoinDCXInvalidOrderException(
+                f"quantity {quantity} is below the {name} minimum of {self._min_quantity}"
+            )
+        if self.max_quantity is not None and quantity > self.max_quantity:
+            raise CoinDCXInvalidOrderException(
+                f"quantity {quantity} is above the {name} maximum of {self.max_quantity}"
+            )
+        if self._off_tick(quantity, self.quantity_step):
+            raise CoinDCXInvalidOrderException(
+                f"quantity {quantity} is not a multiple of the {name} step {self.quantity_step}"
+            )
+
+        if price is None:
+            if order_type in _LIMIT_ORDER_TYPES:
+                raise CoinDCXInvalidOrderException("price_per_unit is required for limit orders")
+            return
+
+        if order_type in _LIMIT_ORDER_TYPES:
+            if self.min_price is not None and price < self.min_price:
+                raise CoinDCXInvalidOrderException(
+                    f"price {price} is below the {name} minimum of {self.min_price}"
+                )
+            if self.max_price is not None and price > self.max_price:
+                raise CoinDCXInvalidOrderException(
+                    f"price {price} is above the {name} maximum of {self.max_price}"
+                )
+            if self._off_tick(price, self.price_tick):
+                raise CoinDCXInvalidOrderException(
+                    f"price {price} has more than {self.price_precision} decimals for {name}"
+                )
+        if self.min_notional is not None and price * quantity < self.min_notional:
+            raise CoinDCXInvalidOrderException(
+                f"order value {price * quantity} is below the {name} minimum of {self.min_notional}"
+            )
+
+    def prepare(
+        self,
+        quantity: float,
+        price: Optional[float] = None,
+        side: Any = None,
+        order_type: Any = 'limit_order',
+    ) -> Tuple[float, Optional[float]]:
+        """
+        Round an order's quantity and price, then check it
+
+        Args:
+            quantity: Order quantity (rounded down to the step)
+            price (optional): Price per unit (rounded away from the market
+                for the given side, see round_price)
+            side (optional): 'buy' or 'sell'
+            order_type (optional): Order type. Default: 'limit_order'
+
+        Returns:
+            Tuple of (quantity, price) ready to send
+
+        Raises:
+            CoinDCXInvalidOrderException: If the rounded order would be
+                rejected
+        """
+        quantity = self.round_quantity(quantity)
+        if price is not None and _value(order_type) in _LIMIT_ORDER_TYPES:
+            price = self.round_price(price, side)
+        self.check(quantity, price, order_type)
+        return quantity, price
+
+    def round_prices(self, prices: Any, side: Any = None) -> Any:
+        """
+        Vectorized round_price
+
+        Args:
+            prices: Array of prices
+            side (optional): 'buy', 'sell' or None, as for round_price
+
+        Returns:
+            float64 array of rounded prices. Requires numpy.
+        """
+        from .candles import _import_numpy
+
+        np = _import_numpy()
+        scaled = np.asarray(prices, dtype=np.float64) * self._price_scale
+        side = _value(side)
+        if side == 'buy':
+            scaled = np.floor(scaled + _EPSILON)
+        elif side == 'sell':
+            scaled = np.ceil(scaled - _EPSILON)
+        else:
+            scaled = np.round(scaled)
+        return np.round(scaled / self._price_scale, self.price_precision)
+
+    def round_quantities(self, quantities: Any) -> Any:
+        """
+        Vectorized round_quantity
+
+        Args:
+            quantities: Array of quantities
+
+        Returns:
+            float64 array of quantities rounded down to the step. Requires
+            numpy.
+        """
+        from .candles import _import_numpy
+
+        np = _import_numpy()
+        units = np.floor(np.asarray(quantities, dtype=np.float64) / self.quantity_step + _EPSILON)
+        return np.round(units * self.quantity_step, self._quantity_decimals)
+
+    def valid(self, quantities: Any, prices: Any = None, order_type: Any = 'limit_order') -> Any:
+        """
+        Vectorized check, for slicing a parent order into child orders
+
+        Market status and order type apply to every order, so a failure
+        there raises rather than masking everything.
+
+        Args:
+            quantities: Array of quantities
+            prices (optional): Array of prices, or one price for all orders
+            order_type (optional): Order type. Default: 'limit_order'
+
+        Returns:
+            Boolean array, True where the order passes every check. Requires
+            numpy.
+
+        Raises:
+            CoinDCXInvalidOrderException: If the market is inactive, does
+                not accept the order type, or a limit order has no prices
+
+        Example:
+            >>> sizes = rules.round_quantities(np.full(20, parent / 20))
+            >>> prices = rules.round_prices(np.linspace(low, high, 20), 'buy')
+            >>> ok = rules.valid(sizes, prices)
+        """
+        from .candles import _import_numpy
+
+        np = _import_numpy()
+        order_type = _value(order_type)
+        name = self.symbol or self.pair
+        if not self.active:
+            raise CoinDCXInvalidOrderException(f"{name} is not active (status: {self.status})")
+        if self.order_types and order_type not in self.order_types:
+            raise CoinDCXInvalidOrderException(f"{name} does not accept {order_type} orders")
+
+        quantities = np.asarray(quantities, dtype=np.float64)
+        units = quantities / self.quantity_step
+        ok = (quantities > 0) & (
+            np.abs(units - np.round(units)) <= _EPSILON * np.maximum(1.0, np.abs(units))
+        )
+        if self._min_quantity is not None:
+            ok &= quantities >= self._min_quantity - _EPSILON * self._min_quantity
+        if self.max_quantity is not None:
+            ok &= quantities <= self.max_quantity
+
+        if prices is None:
+            if order_type in _LIMIT_ORDER_TYPES:
+                raise CoinDCXInvalidOrderException("price_per_unit is required for limit orders")
+            return ok
+
+        prices = np.broadcast_to(np.asarray(prices, dtype=np.float64), quantities.shape)
+        if order_type in _LIMIT_ORDER_TYPES:
+            ticks = prices * self._price_scale
+            ok &= np.abs(ticks - np.round(ticks)) <= _EPSILON * np.maximum(1.0, np.abs(ticks))
+            if self.min_price is not None:
+                ok &= prices >= self.min_price
+            if self.max_price is not None:
+                ok &= prices <= self.max_price
+        if self.min_notional is not None:
+            ok &= prices * quantities >= self.min_notional
+        return ok
+
+    def __repr__(self):
+        return (
+            f"MarketRules({self.symbol} pair={self.pair} price_tick={self.price_tick:g} "
+            f"step={self.quantity_step:g} status={self.status})"
+        )
+
+
+class MarketIndex:
+    """
+    Market rules indexed by symbol, pair and CoinDCX name
+
+    Built once from get_markets_details(); lookups are dict hits instead
+    of scans over the list.
+
+    Args:
+        details (list, optional): get_markets_details() response
+        client (Client, optional): Client used by refresh(). Default: a new
+            public Client
+
+    Example:
+        >>> markets = client.get_markets_details(as_index=True)
+        >>> rules = markets['B-BTC_USDT']          # or markets['BTCUSDT']
+        >>> order = markets.prepare_order('BTCUSDT', 'buy', 'limit_order', 0.0012345, 50000.123)
+        >>> client.create_spot_order(**order)
+    """
+
+    def __init__(self, details: Optional[List[Dict[str, Any]]] = None, client: Optional[Any] = None):
+        self._client = client
+        self._rules: List[MarketRules] = []
+        self._index: Dict[str, MarketRules] = {}
+        if details is not None:
+            self.update(details)
+
+    @classmethod
+    def from_response(cls, details: List[Dict[str, Any]]) -> 'MarketIndex':
+        """
+        Build an index from a get_markets_details() response
+
+        Args:
+            details: List of market details
+
+        Returns:
+            MarketIndex instance
+        """
+        return cls(details)
+
+    @property
+    def client(self) -> Any:
+        """Client used by refresh(), created on first access"""
+        if self._client is None:
+            from .client import Client
+            self._client = Client()
+        return self._client
+
+    def update(self, details: List[Dict[str, Any]]) -> 'MarketIndex':
+        """
+        Replace the index with a new markets details response
+
+        Args:
+            details: List of market details
+
+        Returns:
+            The index itself
+        """
+        rules = [MarketRules(market) for market in details]
+        index: Dict[str, MarketRules] = {}
+        for market in rules:
+            for key in (market.coindcx_name, market.pair, market.symbol):
+                if key:
+                    index[key] = market
+        self._rules = rules
+        self._index = index
+        return self
+
+    def refresh(self) -> Any:
+        """
+        Fetch the markets details and rebuild the index
+
+        Returns:
+            The index (an awaitable resolving to it with an AsyncClient)
+        """
+        # Imported here: the market endpoints import this module
+        from .endpoints.utils import then
+
+        return then(self.client.get_markets_details(), self.update)
+
+    def __getitem__(self, market: str) -> MarketRules:
+        return self._index[market]
+
+    def __contains__(self, market: str) -> bool:
+        return market in self._index
+
+    def __iter__(self) -> Iterator[MarketRules]:
+        return iter(self._rules)
+
+    def __len__(self) -> int:
+        return len(self._rules)
+
+    def get(self, market: str, default: Any = None) -> Any:
+        """Get the rules for a symbol, pair or CoinDCX name, or default if unknown"""
+        return self._index.get(market, default)
+
+    def rules(self, market: str) -> MarketRules:
+        """
+        Get the rules for a market, for use before placing an order
+
+        Args:
+            market: Symbol (e.g., 'BTCUSDT'), pair (e.g., 'B-BTC_USDT') or
+                CoinDCX name
+
+        Returns:
+            MarketRules instance
+
+        Raises:
+            CoinDCXInvalidOrderException: If the market is unknown
+        """
+        rules = self._index.get(market)
+        if rules is None:
+            raise CoinDCXInvalidOrderException(f"Unknown market: {market}")
+        return rules
+
+    def prepare_order(
+        self,
+        market: str,
+        side: Any,
+        order_type: Any,
+        total_quantity: float,
+        price_per_unit: Optional[float] = None,
+        **kwargs: Any,
+    ) -> Dict[str, Any]:
+        """
+        Round and check a spot order, returning create_spot_order arguments
+
+        Args:
+            market: Symbol, pair or CoinDCX name
+            side: 'buy' or 'sell' (or OrderSide)
+            order_type: Order type (or OrderType)
+            total_quantity: Quantity, rounded down to the market's step
+            price_per_unit (optional): Limit price, rounded to the market's
+                tick away from the market for the side. For market orders,
+                a reference price used only for the min_notional check
+            **kwargs: Passed through (e.g., client_order_id)
+
+        Returns:
+            Keyword arguments for client.create_spot_order, with market set
+            to the market's symbol
+
+        Raises:
+            CoinDCXInvalidOrderException: If the market is unknown or the
+                exchange would reject the order
+        """
+        rules = self.rules(market)
+        quantity, price = rules.prepare(total_quantity, price_per_unit, side, order_type)
+        order = {
+            'market': rules.symbol or market,
+            'side': side,
+            'order_type': order_type,
+            'total_quantity': quantity,
+        }
+        if price is not None and _value(order_type) in _LIMIT_ORDER_TYPES:
+            order['price_per_unit'] = price
+        order.update(kwargs)
+        return order
+
+    def __repr__(self):
+        return f"MarketIndex({len(self._rules)} markets)"
@@ -0,0 +1,243 @@
+"""
+CoinDCX Request Metrics
+
+Per-endpoint request counters and latency histograms, plus the RequestInfo
+record passed to pre- and post-request hooks.
+"""
+
+import math
+import threading
+from bisect import bisect_left
+from typing import Any, Dict, List, Optional
+
+
+class RequestInfo:
+    """
+    Details of a single HTTP request attempt, passed to request hooks
+
+    Pre-request hooks see the fields known before sending (method, endpoint,
+    url, authenticated, params, bytes_out, sign_time). Post-request hooks
+    additionally see the status code, response size, timings and error.
+
+    Attributes:
+        method: HTTP method
+        endpoint: API endpoint path
+        url: Full request URL
+        authenticated: Whether the request was signed
+        params: URL parameters
+        status_code: HTTP status code, None if no response was received
+        bytes_out: Size of the request body in bytes
+        bytes_in: Size of the response body in bytes
+        sign_time: Seconds spent encoding and signing the body
+        network_time: Seconds spent waiting for the HTTP response
+        decode_time: Seconds spent parsing the response
+        error: Exception raised by the request, if any
+    """
+
+    __slots__ = (
+        'method', 'endpoint', 'url', 'authenticated', 'params', 'status_code',
+        'bytes_out', 'bytes_in', 'sign_time', 'network_time', 'decode_time', 'error',
+    )
+
+    def __init__(
+        self,
+        method: str,
+        endpoint: str,
+        authenticated: bool = False,
+        params: Optional[Dict[str, Any]] = None,
+    ):
+        self.method = method
+        self.endpoint = endpoint
+        self.url = None
+        self.authenticated = authenticated
+        self.params = params
+        self.status_code = None
+        self.bytes_out = 0
+        self.bytes_in = 0
+        self.sign_time = 0.0
+        self.network_time = 0.0
+        self.decode_time = 0.0
+        self.error = None
+
+    @property
+    def total_time(self) -> float:
+        """Seconds spent signing, on the network and decoding"""
+        return self.sign_time + self.network_time + self.decode_time
+
+    def __repr__(self):
+        return (
+            f"RequestInfo({self.method} {self.endpoint} status={self.status_code} "
+            f"total={self.total_time * 1000:.2f}ms)"
+        )
+
+
+class LatencyHistogram:
+    """
+    Log-bucketed latency histogram
+
+    Buckets grow geometrically, so percentiles are accurate to within the
+    growth factor (10% by default) across microseconds to minutes, using a
+    fixed amount of memory.
+
+    Args:
+        min_value (float, optional): Upper bound of the first bucket in seconds. Default: 1e-5
+        max_value (float, optional): Largest tracked value in seconds. Default: 300
+        growth (float, optional): Ratio between consecutive bucket bounds. Default: 1.1
+    """
+
+    def __init__(self, min_value: float = 1e-5, max_value: float = 300.0, growth: float = 1.1):
+        steps = int(math.ceil(math.log(max_value / min_value) / math.log(growth)))
+        self.bounds: List[float] = [min_value * growth ** i for i in range(steps + 1)]
+        self.counts: List[int] = [0] * (len(self.bounds) + 1)
+        self.count = 0
+        self.total = 0.0
+        self.min = math.inf
+        self.max = 0.0
+
+    def record(self, value: float):
+        """
+        Add a sample
+
+        Args:
+            value: Latency in seconds
+        """
+        self.counts[bisect_left(self.bounds, value)] += 1
+        self.count += 1
+        self.total += value
+        if value < self.min:
+            self.min = value
+        if value > self.max:
+            self.max = value
+
+    def percentile(self, p: float) -> float:
+        """
+        Get an approximate percentile
+
+        Args:
+            p: Percentile between 0 and 100
+
+        Returns:
+            Upper bound of the bucket holding the percentile, in seconds
+            (capped at the largest sample), or 0.0 if empty
+        """
+        if self.count == 0:
+            return 0.0
+
+        rank = max(1, int(math.ceil(self.count * p / 100.0)))
+        seen = 0
+        for index, bucket_count in enumerate(self.counts):
+            seen += bucket_count
+            if seen >= rank:
+                if index >= len(self.bounds):
+                    return self.max
+                return min(self.bounds[index], self.max)
+        return self.max
+
+    def summary(self) -> Dict[str, float]:
+        """
+        Get count, mean, min, max and p50/p95/p99
+
+        Returns:
+            Dictionary of statistics, latencies in seconds
+        """
+        return {
+            'count': self.count,
+            'mean': self.total / self.count if self.count else 0.0,
+            'min': self.min if self.count else 0.0,
+            'max': self.max,
+            'p50': self.percentile(50),
+            'p95': self.percentile(95),
+            'p99': self.percentile(99),
+        }
+
+
+class EndpointStats:
+    """Counters and histograms for one (method, endpoint) pair"""
+
+    def __init__(self):
+        self.count = 0
+        self.errors = 0
+        self.status_codes: Dict[Any, int] = {}
+        self.bytes_in = 0
+        self.bytes_out = 0
+        self.latency = LatencyHistogram()
+        self.sign = LatencyHistogram()
+        self.network = LatencyHistogram()
+        self.decode = LatencyHistogram()
+
+    def record(self, info: RequestInfo):
+        """Add a completed request attempt"""
+        self.count += 1
+        if info.error is not None:
+            self.errors += 1
+        self.status_codes[info.status_code] = self.status_codes.get(info.status_code, 0) + 1
+        self.bytes_in += info.bytes_in
+        self.bytes_out += info.bytes_out
+        self.latency.record(info.total_time)
+        self.sign.record(info.sign_time)
+        self.network.record(info.network_time)
+        self.decode.record(info.decode_time)
+
+    def summary(self) -> Dict[str, Any]:
+        """Get a plain-dict view of the counters and histograms"""
+        return {
+            'count': self.count,
+            'errors': self.errors,
+            'status_codes': dict(self.status_codes),
+            'bytes_in': self.bytes_in,
+            'bytes_out': self.bytes_out,
+            'latency': self.latency.summary(),
+            'sign': self.sign.summary(),
+            'network': self.network.summary(),
+            'decode': self.decode.summary(),
+        }
+
+
+class RequestMetrics:
+    """
+    Thread-safe per-endpoint request metrics
+
+    Records one entry per HTTP attempt (retries count separately), keyed by
+    HTTP method and endpoint path.
+
+    Example:
+        >>> client = Client(metrics=True)
+        >>> client.get_ticker()
+        >>> stats = client.metrics.snapshot()['GET /exchange/ticker']
+        >>> stats['latency']['p99'], stats['decode']['mean']
+    """
+
+    def __init__(self):
+        self._stats: Dict[str, EndpointStats] = {}
+        self._lock = threading.Lock()
+
+    def record(self, info: RequestInfo):
+        """
+        Add a completed request attempt
+
+        Args:
+            info: RequestInfo with timings, sizes and status filled in
+        """
+        key = f"{info.method} {info.endpoint}"
+        with self._lock:
+            stats = self._stats.get(key)
+            if stats is None:
+                stats = self._stats[key] = EndpointStats()
+            stats.record(info)
+
+    def snapshot(self) -> Dict[str, Dict[str, Any]]:
+        """
+        Get all metrics as plain dictionaries
+
+        Returns:
+            Dictionary mapping 'METHOD /endpoint' to its counters, status
+            codes, byte totals and latency summaries (total, sign, network,
+            decode) in seconds
+        """
+        with self._lock:
+            return {key: stats.summary() for key, stats in self._stats.items()}
+
+    def reset(self):
+        """Drop all recorded metrics"""
+        with self._lock:
+            self._stats.clear()
@@ -0,0 +1,305 @@
+"""
+CoinDCX Order Book
+
+Sorted, numeric order book built from get_orderbook or
+get_futures_orderbook responses, with constant-time best bid/ask and
+vectorized depth and VWAP queries.
+"""
+
+from bisect import bisect_left, insort
+from typing import Any, Dict, Iterable, List, Mapping, Optional, Tuple, Union
+
+from .candles import _import_numpy
+
+
+Level = Tuple[float, float]
+
+SIDES = ('bids', 'asks')
+
+
+def _levels(levels: Union[Mapping[Any, Any], Iterable[Any], None]) -> Iterable[Level]:
+    """Iterate (price, quantity) floats from a price->quantity map or pairs"""
+    if not levels:
+        return ()
+    items = levels.items() if isinstance(levels, Mapping) else levels
+    return ((float(price), float(quantity)) for price, quantity in items)
+
+
+class OrderBook:
+    """
+    Sorted order book with numeric price levels
+
+    Each side keeps a price -> quantity dict plus a sorted price list, so
+    best bid/ask are O(1), top-N slices are O(N) and applying a level change
+    is O(log n) to find plus a list insert. NumPy views for depth and VWAP
+    queries are built on demand and cached until the book changes.
+
+    Args:
+        bids: Bid levels as a price -> quantity mapping (strings or numbers,
+            as in API responses) or (price, quantity) pairs
+        asks: Ask levels, same formats as bids
+        pair (str, optional): Market or instrument pair
+        timestamp (int, optional): Snapshot time in milliseconds
+        version (int, optional): Snapshot version or sequence number
+
+    Example:
+        >>> book = client.get_orderbook('B-BTC_USDT', as_book=True)
+        >>> book.best_bid, book.best_ask, book.spread
+        >>> book.top('asks', 5)
+        >>> book.vwap('asks', [0.1, 1.0, 5.0])   # cost of buying each size
+    """
+
+    def __init__(
+        self,
+        bids: Union[Mapping[Any, Any], Iterable[Any], None] = None,
+        asks: Union[Mapping[Any, Any], Iterable[Any], None] = None,
+        pair: Optional[str] = None,
+        timestamp: Optional[int] = None,
+        version: Optional[int] = None,
+    ):
+        self.pair = pair
+        self.timestamp = timestamp
+        self.version = version
+        self._sizes: Dict[str, Dict[float, float]] = {'bids': {}, 'asks': {}}
+        # Prices ascending on both sides: best bid is last, best ask is first
+        self._prices: Dict[str, List[float]] = {'bids': [], 'asks': []}
+        self._arrays: Dict[str, Any] = {}
+        self.load(bids, asks)
+
+    @classmethod
+    def from_response(cls, response: Dict[str, Any], pair: Optional[str] = None) -> 'OrderBook':
+        """
+        Build a book from a spot or futures order book response
+
+        Args:
+            response: get_orderbook() response ({'bids': {...}, 'asks': {...}})
+                or get_futures_orderbook() response (also 'ts' and 'vs')
+            pair (optional): Pair the response is for
+
+        Returns:
+            OrderBook instance
+        """
+        return cls(
+            response.get('bids'),
+            response.get('asks'),
+            pair=pair,
+            timestamp=response.get('ts', response.get('timestamp')),
+            version=response.get('vs'),
+        )
+
+    def load(
+        self,
+        bids: Union[Mapping[Any, Any], Iterable[Any], None],
+        asks: Union[Mapping[Any, Any], Iterable[Any], None],
+    ):
+        """
+        Replace every level with a new snapshot
+
+        Args:
+            bids: Bid levels (mapping or pairs); zero quantities are skipped
+            asks: Ask levels (mapping or pairs); zero quantities are skipped
+        """
+        for side, levels in (('bids', bids), ('asks', asks)):
+            sizes = {price: quantity for price, quantity in _levels(levels) if quantity > 0}
+            self._sizes[side] = sizes
+            self._prices[side] = sorted(sizes)
+        self._arrays.clear()
+
+    def update(
+        self,
+        bids: Union[Mapping[Any, Any], Iterable[Any], None] = None,
+        asks: Union[Mapping[Any, Any], Iterable[Any], None] = None,
+    ):
+        """
+        Apply level changes; a quantity of 0 removes the level
+
+        Args:
+            bids: Changed bid levels (mapping or pairs)
+            asks: Changed ask levels (mapping or pairs)
+        """
+        for side, levels in (('bids', bids), ('asks', asks)):
+            sizes = self._sizes[side]
+            prices = self._prices[side]
+            for price, quantity in _levels(levels):
+                if quantity > 0:
+                    if price not in sizes:
+                        insort(prices, price)
+                    sizes[price] = quantity
+                elif price in sizes:
+                    del sizes[price]
+                    del prices[bisect_left(prices, price)]
+            self._arrays.pop(side, None)
+
+    @property
+    def best_bid(self) -> Optional[Level]:
+        """Highest bid as (price, quantity), or None if there are no bids"""
+        prices = self._prices['bids']
+        if not prices:
+            return None
+        price = prices[-1]
+        return price, self._sizes['bids'][price]
+
+    @property
+    def best_ask(self) -> Optional[Level]:
+        """Lowest ask as (price, quantity), or None if there are no asks"""
+        prices = self._prices['asks']
+        if not prices:
+            return None
+        price = prices[0]
+        return price, self._sizes['asks'][price]
+
+    @property
+    def mid(self) -> Optional[float]:
+        """Midpoint of best bid and ask, or None if a side is empty"""
+        if not self._prices['bids'] or not self._prices['asks']:
+            return None
+        return (self._prices['bids'][-1] + self._prices['asks'][0]) / 2
+
+    @property
+    def spread(self) -> Optional[float]:
+        """Best ask minus best bid, or None if a side is empty"""
+        if not self._prices['bids'] or not self._prices['asks']:
+            return None
+        return self._prices['asks'][0] - self._prices['bids'][-1]
+
+    def _check_side(self, side: str):
+        """Raise ValueError unless side is 'bids' or 'asks'"""
+        if side not in SIDES:
+            raise ValueError(f"side must be 'bids' or 'asks', got {side!r}")
+
+    def top(self, side: str, n: Optional[int] = None) -> List[Level]:
+        """
+        Get the best levels of one side
+
+        Args:
+            side: 'bids' or 'asks'
+            n: Number of levels (default: all)
+
+        Returns:
+            List of (price, quantity), best first
+        """
+        self._check_side(side)
+        prices = self._prices[side]
+        sizes = self._sizes[side]
+        if side == 'bids':
+            chosen = prices[::-1] if n is None else prices[:-n - 1:-1] if n > 0 else []
+        else:
+            chosen = prices if n is None else prices[:max(n, 0)]
+        return [(price, sizes[price]) for price in chosen]
+
+    def levels(self, side: str) -> int:
+        """Number of price levels on one side"""
+        self._check_side(side)
+        return len(self._prices[side])
+
+    def arrays(self, side: str) -> Tuple[Any, Any]:
+        """
+        Get one side as NumPy arrays, best level first
+
+        Args:
+            side: 'bids' or 'asks'
+
+        Returns:
+            Tuple of read-only float64 arrays (prices, quantities). Cached
+            until the side changes. Requires numpy.
+        """
+        return self._side_arrays(side)[:2]
+
+    def _side_arrays(self, side: str) -> Tuple[Any, Any, Any, Any]:
+        """
+        Get (prices, quantities, cumulative quantity, cumulative notional)
+
+        The cumulative arrays start with 0, so entry k covers the best k levels.
+        """
+        self._check_side(side)
+        cached = self._arrays.get(side)
+        if cached is not None:
+            return cached
+
+        np = _import_numpy()
+        ordered = self._prices[side][::-1] if side == 'bids' else self._prices[side]
+        sizes = self._sizes[side]
+        prices = np.fromiter(ordered, dtype=np.float64, count=len(ordered))
+        quantities = np.fromiter(map(sizes.__getitem__, ordered), dtype=np.float64, count=len(ordered))
+        cumulative = np.concatenate([[0.0], np.cumsum(quantities)])
+        notional = np.concatenate([[0.0], np.cumsum(prices * quantities)])
+        for array in (prices, quantities, cumulative, notional):
+            array.flags.writeable = False
+
+        cached = self._arrays[side] = (prices, quantities, cumulative, notional)
+        return cached
+
+    def depth(self, side: str, price: Any) -> Any:
+        """
+        Get the quantity available at or better than a price
+
+        Args:
+            side: 'bids' (quantity at prices >= price) or 'asks' (quantity at
+                prices <= price)
+            price: Price limit, or an array of limits
+
+        Returns:
+            Total quantity as a float, or an array matching price
+        """
+        np = _import_numpy()
+        prices, _, cumulative, _ = self._side_arrays(side)
+        limits = np.asarray(price, dtype=np.float64)
+
+        if side == 'bids':
+            count = np.searchsorted(-prices, -limits, side='right')
+        else:
+            count = np.searchsorted(prices, limits, side='right')
+        result = cumulative[count]
+        return float(result) if result.ndim == 0 else result
+
+    def vwap(self, side: str, quantity: Any) -> Any:
+        """
+        Get the average fill price for taking a quantity from one side
+
+        Use 'asks' for the cost of a market buy and 'bids' for the proceeds
+        of a market sell.
+
+        Args:
+            side: 'bids' or 'asks'
+            quantity: Quantity to fill, or an array of quantities
+
+        Returns:
+            Volume-weighted average price as a float, or an array matching
+            quantity. NaN where the side does not hold enough quantity.
+        """
+        np = _import_numpy()
+        prices, _, cumulative, notional = self._side_arrays(side)
+        wanted = np.asarray(quantity, dtype=np.float64)
+
+        if len(prices) == 0:
+            result = np.full(wanted.shape, np.nan)
+        else:
+            # Level where each fill completes; the levels before it are taken whole
+            index = np.maximum(np.searchsorted(cumulative, wanted, side='left') - 1, 0)
+            enough = wanted <= cumulative[-1]
+            index = np.minimum(index, len(prices) - 1)
+            cost = notional[index] + (wanted - cumulative[index]) * prices[index]
+            with np.errstate(invalid='ignore', divide='ignore'):
+                result = np.where(enough, cost / wanted, np.nan)
+            result = np.where(wanted == 0, prices[0], result)
+
+        return float(result) if result.ndim == 0 else result
+
+    def to_dict(self) -> Dict[str, Any]:
+        """
+        Get the book in the API response shape
+
+        Returns:
+            Dictionary with 'bids' and 'asks' mapping price strings to
+            quantity strings, best level first
+        """
+        return {
+            side: {repr(price): repr(quantity) for price, quantity in self.top(side)}
+            for side in SIDES
+        }
+
+    def __repr__(self):
+        return (
+            f"OrderBook({self.pair or ''} bid={self.best_bid} ask={self.best_ask} "
+            f"levels={self.levels('bids')}/{self.levels('asks')})"
+        )
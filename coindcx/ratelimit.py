@@ -0,0 +1,291 @@
+"""
+CoinDCX Client-Side Rate Limiting
+
+Token buckets keyed by endpoint path, pre-loaded with the published CoinDCX
+budgets, so calls are paced before they go out instead of failing with 429.
+"""
+
+import threading
+import time
+from typing import Dict, List, Optional, Tuple
+
+from .exceptions import CoinDCXRateLimitException
+
+
+# Published per-endpoint budgets: endpoint path -> (requests, period in seconds)
+DEFAULT_RATE_LIMITS: Dict[str, Tuple[int, float]] = {
+    '/exchange/v1/orders/create_multiple': (2000, 60),
+    '/exchange/v1/orders/create': (2000, 60),
+    '/exchange/v1/orders/cancel_all': (30, 60),
+    '/exchange/v1/orders/status_multiple': (2000, 60),
+    '/exchange/v1/orders/status': (2000, 60),
+    '/exchange/v1/orders/cancel_by_ids': (300, 60),
+    '/exchange/v1/orders/cancel': (2000, 60),
+    '/exchange/v1/orders/active_orders': (300, 60),
+    '/exchange/v1/orders/edit': (2000, 60),
+    '/exchange/v1/derivatives/futures/orders/create': (2000, 60),
+}
+
+# General account-wide budget from the CoinDCX FAQ (16/sec, 960/min)
+GENERAL_RATE_LIMITS: List[Tuple[int, float]] = [(16, 1), (960, 60)]
+
+
+class TokenBucket:
+    """
+    Thread-safe token bucket
+
+    The bucket starts full and refills continuously at capacity/period
+    tokens per second, so a full budget can be spent in a burst and then
+    recovers linearly.
+
+    Args:
+        capacity (int): Maximum number of tokens (requests per period)
+        period (float): Period in seconds over which capacity refills
+    """
+
+    def __init__(self, capacity: int, period: float):
+        if capacity <= 0 or period <= 0:
+            raise ValueError("capacity and period must be positive")
+
+        self.capacity = float(capacity)
+        self.period = float(period)
+        self.rate = self.capacity / self.period
+        self._tokens = self.capacity
+        self._updated = time.monotonic()
+        self._lock = threading.Lock()
+
+    def _refill(self, now: float):
+        """Add tokens accrued since the last update (caller holds the lock)"""
+        elapsed = now - self._updated
+        if elapsed > 0:
+            self._tokens = min(self.capacity, self._tokens + elapsed * self.rate)
+            self._updated = now
+
+    def _wait_time(self, tokens: float) -> float:
+        """Seconds until `tokens` are available (caller holds the lock)"""
+        if self._tokens >= tokens:
+            return 0.0
+        return (tokens - self._tokens) / self.rate
+
+    @property
+    def tokens(self) -> float:
+        """Number of tokens currently available"""
+        with self._lock:
+            self._refill(time.monotonic())
+            return self._tokens
+
+    def wait_time(self, tokens: float = 1) -> float:
+        """
+        Get the time until the given number of tokens will be available
+
+        Args:
+            tokens: Number of tokens needed (default: 1)
+
+        Returns:
+            Seconds to wait, 0.0 if tokens are available now
+        """
+        with self._lock:
+            self._refill(time.monotonic())
+            return self._wait_time(tokens)
+
+    def try_acquire(self, tokens: float = 1) -> bool:
+        """
+        Take tokens if they are available, without waiting
+
+        Args:
+            tokens: Number of tokens to take (default: 1)
+
+        Returns:
+            True if the tokens were taken, False otherwise
+        """
+        with self._lock:
+            self._refill(time.monotonic())
+            if self._tokens >= tokens:
+                self._tokens -= tokens
+                return True
+            return False
+
+
+class RateLimiter:
+    """
+    Client-side rate limiter keyed by endpoint path
+
+    Each endpoint with a known budget gets its own TokenBucket. Optional
+    global limits apply to every request on top of the per-endpoint ones.
+    Endpoints without a budget and with no global limits are never delayed.
+
+    Args:
+        limits (dict, optional): Endpoint path -> (requests, period seconds).
+            Default: DEFAULT_RATE_LIMITS
+        global_limits (list, optional): List of (requests, period seconds)
+            applied to all requests, e.g. GENERAL_RATE_LIMITS. Default: None
+        blocking (bool, optional): Wait for tokens when a bucket is empty.
+            If False, raise CoinDCXRateLimitException instead. Default: True
+        max_wait (float, optional): In blocking mode, raise instead of
+            waiting longer than this many seconds. Default: None (no cap)
+
+    Example:
+        >>> limiter = RateLimiter(blocking=False)
+        >>> client = Client(api_key='...', api_secret='...', rate_limiter=limiter)
+        >>> limiter.remaining('/exchange/v1/orders/cancel_all')
+        30.0
+    """
+
+    def __init__(
+        self,
+        limits: Optional[Dict[str, Tuple[int, float]]] = None,
+        global_limits: Optional[List[Tuple[int, float]]] = None,
+        blocking: bool = True,
+        max_wait: Optional[float] = None,
+    ):
+        if limits is None:
+            limits = DEFAULT_RATE_LIMITS
+
+        self.blocking = blocking
+        self.max_wait = max_wait
+        self.buckets: Dict[str, TokenBucket] = {
+            endpoint: TokenBucket(capacity, period)
+            for endpoint, (capacity, period) in limits.items()
+        }
+        self.global_buckets: List[TokenBucket] = [
+            TokenBucket(capacity, period) for capacity, period in (global_limits or [])
+        ]
+        self._lock = threading.Lock()
+
+    def set_limit(self, endpoint: str, capacity: int, period: float):
+        """
+        Set or replace the budget for an endpoint
+
+        Args:
+            endpoint: Endpoint path (e.g., '/exchange/v1/orders/create')
+            capacity: Requests allowed per period
+            period: Period in seconds
+        """
+        with self._lock:
+            self.buckets[endpoint] = TokenBucket(capacity, period)
+
+    def _buckets_for(self, endpoint: str) -> List[TokenBucket]:
+        """Get every bucket a request to endpoint draws from"""
+        bucket = self.buckets.get(endpoint)
+        if bucket is None:
+            return self.global_buckets
+        return [bucket] + self.global_buckets
+
+    def _reserve(self, endpoint: str) -> float:
+        """
+        Take one token from every applicable bucket, or none at all
+
+        Returns:
+            0.0 if the request may proceed, otherwise seconds to wait
+        """
+        buckets = self._buckets_for(endpoint)
+        if not buckets:
+            return 0.0
+
+        now = time.monotonic()
+        with self._lock:
+            for bucket in buckets:
+                bucket._lock.acquire()
+            try:
+                wait = 0.0
+                for bucket in buckets:
+                    bucket._refill(now)
+                    wait = max(wait, bucket._wait_time(1))
+                if wait == 0.0:
+                    for bucket in buckets:
+                        bucket._tokens -= 1
+                return wait
+            finally:
+                for bucket in buckets:
+                    bucket._lock.release()
+
+    def _check_wait(self, endpoint: str, wait: float, blocking: bool):
+        """Raise if the caller must not wait `wait` seconds"""
+        if not blocking or (self.max_wait is not None and wait > self.max_wait):
+            raise CoinDCXRateLimitException(
+                f"Client-side rate limit reached for {endpoint}, retry in {wait:.3f}s",
+                retry_after=wait,
+            )
+
+    def acquire(self, endpoint: str, blocking: Optional[bool] = None):
+        """
+        Take a token for a request to endpoint, waiting if needed
+
+        Args:
+            endpoint: Endpoint path
+            blocking: Override the limiter's blocking mode for this call
+
+        Raises:
+            CoinDCXRateLimitException: If no token is available and the call
+                may not wait (non-blocking mode or wait longer than max_wait)
+        """
+        if blocking is None:
+            blocking = self.blocking
+
+        while True:
+            wait = self._reserve(endpoint)
+            if wait == 0.0:
+                return
+            self._check_wait(endpoint, wait, blocking)
+            time.sleep(wait)
+
+    async def acquire_async(self, endpoint: str, blocking: Optional[bool] = None):
+        """
+        Coroutine version of acquire that sleeps without blocking the event loop
+
+        Args:
+            endpoint: Endpoint path
+            blocking: Override the limiter's blocking mode for this call
+
+        Raises:
+            CoinDCXRateLimitException: If no token is available and the call may not wait
+        """
+        import asyncio
+
+        if blocking is None:
+            blocking = self.blocking
+
+        while True:
+            wait = self._reserve(endpoint)
+            if wait == 0.0:
+                return
+            self._check_wait(endpoint, wait, blocking)
+            await asyncio.sleep(wait)
+
+    def remaining(self, endpoint: str) -> Optional[float]:
+        """
+        Get the tokens left for an endpoint
+
+        Args:
+            endpoint: Endpoint path
+
+        Returns:
+            Tokens available now across the endpoint and global buckets (the
+            smallest of them), or None if the endpoint is not limited
+        """
+        buckets = self._buckets_for(endpoint)
+        if not buckets:
+            return None
+        return min(bucket.tokens for bucket in buckets)
+
+    def wait_time(self, endpoint: str) -> float:
+        """
+        Get the time until a request to endpoint could go out
+
+        Args:
+            endpoint: Endpoint path
+
+        Returns:
+            Seconds to wait, 0.0 if a request may be sent now
+        """
+        buckets = self._buckets_for(endpoint)
+        return max((bucket.wait_time(1) for bucket in buckets), default=0.0)
+
+    def snapshot(self) -> Dict[str, float]:
+        """
+        Get the tokens left in every per-endpoint bucket
+
+        Returns:
+            Dictionary mapping endpoint path to available tokens
+        """
+        return {endpoint: bucket.tokens for endpoint, bucket in self.buckets.items()}
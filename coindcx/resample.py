@@ -0,0 +1,274 @@
+"""
+CoinDCX Candle Resampling
+
+Build higher-interval candles from lower-interval ones with vectorized
+NumPy reductions, so one 1m feed can serve every coarser interval.
+"""
+
+from typing import Any, Dict, Optional
+
+from .candles import (
+    CANDLE_FIELDS,
+    CANDLE_INTERVAL_MS,
+    DAY_MS,
+    FUTURES_RESOLUTION_SECONDS,
+    _import_numpy,
+    candle_dtype,
+    candles_to_arrays,
+)
+
+# Weekly candles open on Monday 00:00 UTC; the epoch fell on a Thursday
+_WEEK_OFFSET_MS = 4 * DAY_MS
+
+
+def _interval_key(interval: Any) -> str:
+    """Get the plain string value of an interval or resolution enum"""
+    return str(getattr(interval, 'value', interval))
+
+
+def bucket_ms(interval: Any) -> Optional[int]:
+    """
+    Get the fixed bucket length of a spot interval or futures resolution
+
+    Args:
+        interval: Spot interval ('5m', '1h', ...) or futures resolution
+            ('5', '60', '1D')
+
+    Returns:
+        Bucket length in milliseconds, or None for '1M' (calendar months)
+
+    Raises:
+        ValueError: If the interval is not supported
+    """
+    key = _interval_key(interval)
+    if key == '1M':
+        return None
+    if key in CANDLE_INTERVAL_MS:
+        return CANDLE_INTERVAL_MS[key]
+    if key in FUTURES_RESOLUTION_SECONDS:
+        return FUTURES_RESOLUTION_SECONDS[key] * 1000
+    raise ValueError(f"Unsupported candle interval: {interval!r}")
+
+
+def bucket_starts(times: Any, interval: Any) -> Any:
+    """
+    Get the open time of the bucket each timestamp falls in
+
+    Buckets are aligned to UTC: days at midnight, weeks on Monday and
+    months on the first of the month.
+
+    Args:
+        times: int64 array of open times in milliseconds
+        interval: Target spot interval or futures resolution
+
+    Returns:
+        int64 array of bucket open times in milliseconds
+    """
+    np = _import_numpy()
+    times = np.asarray(times, dtype=np.int64)
+
+    step = bucket_ms(interval)
+    if step is None:
+        months = times.astype('datetime64[ms]').astype('datetime64[M]')
+        return months.astype('datetime64[ms]').astype(np.int64)
+    if step == 7 * DAY_MS:
+        return (times - _WEEK_OFFSET_MS) // step * step + _WEEK_OFFSET_MS
+    return times // step * step
+
+
+def _to_columns(candles: Any) -> Dict[str, Any]:
+    """Get a dict of time-ordered columns from any candle container"""
+    np = _import_numpy()
+    if isinstance(candles, np.ndarray) and candles.dtype.names:
+        return {name: candles[name] for name in CANDLE_FIELDS}
+    if isinstance(candles, dict) and 'time' in candles:
+        return candles
+    return candles_to_arrays(candles)
+
+
+def _from_columns(columns: Dict[str, Any], structured: bool) -> Any:
+    """Return columns as-is or packed into a structured array"""
+    if not structured:
+        return columns
+    np = _import_numpy()
+    records = np.empty(len(columns['time']), dtype=candle_dtype())
+    for name in CANDLE_FIELDS:
+        records[name] = columns[name]
+    return records
+
+
+def _aggregate(columns: Dict[str, Any], interval: Any) -> Dict[str, Any]:
+    """Reduce time-ordered columns into one row per bucket"""
+    np = _import_numpy()
+
+    times = np.asarray(columns['time'], dtype=np.int64)
+    if len(times) == 0:
+        return {
+            name: np.empty(0, dtype=np.int64 if name == 'time' else np.float64)
+            for name in CANDLE_FIELDS
+        }
+
+    keys = bucket_starts(times, interval)
+    starts = np.flatnonzero(np.r_[True, keys[1:] != keys[:-1]])
+    ends = np.r_[starts[1:], len(keys)] - 1
+
+    def _column(name):
+        return np.asarray(columns[name], dtype=np.float64)
+
+    return {
+        'time': keys[starts],
+        'open': _column('open')[starts],
+        'high': np.maximum.reduceat(_column('high'), starts),
+        'low': np.minimum.reduceat(_column('low'), starts),
+        'close': _column('close')[ends],
+        'volume': np.add.reduceat(_column('volume'), starts),
+    }
+
+
+def resample_candles(candles: Any, interval: Any) -> Any:
+    """
+    Aggregate candles into a higher interval
+
+    Open is the first open in each bucket, high the maximum, low the
+    minimum, close the last close and volume the sum. The last bucket is
+    returned even if it is still incomplete; use CandleResampler to carry
+    it across updates.
+
+    Args:
+        candles: Source candles, oldest first - a structured array, dict of
+            columns, or list of candle dicts (any order)
+        interval: Target spot interval ('5m', '1h', '1d', ...) or futures
+            resolution ('5', '60', '1D')
+
+    Returns:
+        Resampled candles: a structured array if candles was one, otherwise
+        a dict of columns
+
+    Raises:
+        ImportError: If numpy is not installed
+        ValueError: If the interval is not supported
+
+    Example:
+        >>> minute = client.get_candles_range('B-BTC_USDT', '1m', start, end, as_arrays=True)
+        >>> hourly = resample_candles(minute, '1h')
+        >>> daily = resample_candles(minute, CandleInterval.ONE_DAY)
+    """
+    np = _import_numpy()
+    structured = isinstance(candles, np.ndarray) and bool(candles.dtype.names)
+    return _from_columns(_aggregate(_to_columns(candles), interval), structured)
+
+
+class CandleResampler:
+    """
+    Incremental resampler that carries the partial trailing bucket
+
+    Feed it source candles as they arrive (e.g. from each CandleStore.sync
+    or poll of get_candles); it returns only buckets that are complete and
+    keeps the source candles of the still-open bucket for the next update.
+    Updates may repeat or revise the newest source candles; rows at or after
+    the first time in an update replace the carried ones.
+
+    A bucket is complete once a candle from a later bucket is seen, since
+    until then its last source candle may still be in progress. Source
+    candles that fall in an already completed bucket are ignored.
+
+    Args:
+        interval: Target spot interval or futures resolution
+        source_interval (optional): Interval of the source candles, checked
+            to evenly divide interval
+
+    Raises:
+        ValueError: If source_interval does not evenly divide interval
+
+    Example:
+        >>> resampler = CandleResampler('15m', source_interval='1m')
+        >>> done = resampler.update(client.get_candles('B-BTC_USDT', '1m', as_arrays=True))
+        >>> resampler.partial   # the 15m candle still being built
+    """
+
+    def __init__(self, interval: Any, source_interval: Any = None):
+        self.interval = _interval_key(interval)
+        self.source_interval = (
+            None if source_interval is None else _interval_key(source_interval)
+        )
+        if self.source_interval is not None:
+            source_step = bucket_ms(self.source_interval)
+            step = bucket_ms(self.interval)
+            if step is not None and (source_step is None or step % source_step):
+                raise ValueError(
+                    f"Cannot build {self.interval} candles from {self.source_interval} candles"
+                )
+        self._carry: Optional[Dict[str, Any]] = None
+        self._last_done: Optional[int] = None
+
+    def update(self, candles: Any) -> Dict[str, Any]:
+        """
+        Add source candles and get the buckets they complete
+
+        Args:
+            candles: New source candles (structured array, dict of columns
+                or list of candle dicts)
+
+        Returns:
+            Dict of columns holding every newly completed bucket, oldest first
+        """
+        np = _import_numpy()
+        columns = _to_columns(candles)
+
+        if self._carry is not None and len(self._carry['time']):
+            first = columns['time'][0] if len(columns['time']) else None
+            carry = self._carry
+            if first is not None:
+                keep = np.asarray(carry['time']) < first
+                carry = {name: np.asarray(carry[name])[keep] for name in CANDLE_FIELDS}
+            columns = {
+                name: np.concatenate([np.asarray(carry[name]), np.asarray(columns[name])])
+                for name in CANDLE_FIELDS
+            }
+
+        columns = {name: np.asarray(columns[name]) for name in CANDLE_FIELDS}
+        keys = bucket_starts(columns['time'], self.interval)
+        if self._last_done is not None:
+            fresh = keys > self._last_done
+            if not fresh.all():
+                columns = {name: column[fresh] for name, column in columns.items()}
+                keys = keys[fresh]
+
+        if len(keys) == 0:
+            self._carry = None
+            return _aggregate(columns, self.interval)
+
+        split = int(np.searchsorted(keys, keys[-1], side='left'))
+        if split:
+            self._last_done = int(keys[split - 1])
+
+        self._carry = {name: column[split:] for name, column in columns.items()}
+        done = {name: column[:split] for name, column in columns.items()}
+        return _aggregate(done, self.interval)
+
+    @property
+    def partial(self) -> Optional[Dict[str, Any]]:
+        """
+        The incomplete trailing bucket built from the carried candles
+
+        Returns:
+            Dict of one-element columns, or None if nothing is carried
+        """
+        if self._carry is None or len(self._carry['time']) == 0:
+            return None
+        return _aggregate(self._carry, self.interval)
+
+    def flush(self) -> Dict[str, Any]:
+        """
+        Emit the carried partial bucket as if it were complete and reset
+
+        Returns:
+            Dict of columns with zero or one bucket
+        """
+        np = _import_numpy()
+        carry = self._carry or {name: np.empty(0) for name in CANDLE_FIELDS}
+        self._carry = None
+        result = _aggregate(carry, self.interval)
+        if len(result['time']):
+            self._last_done = int(result['time'][-1])
+        return result
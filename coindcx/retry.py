@@ -0,0 +1,172 @@
+"""
+CoinDCX Retry Policy
+
+Exponential backoff with jitter for transient failures, aware of which
+requests are safe to send twice.
+"""
+
+import random
+from typing import Any, Dict, Iterable, Optional
+
+from .exceptions import (
+    CoinDCXException,
+    CoinDCXAPIException,
+    CoinDCXRequestException,
+    CoinDCXRateLimitException,
+)
+
+
+# Authenticated POST endpoints that only read state and can be repeated freely
+IDEMPOTENT_ENDPOINTS = frozenset({
+    '/exchange/v1/users/balances',
+    '/exchange/v1/users/info',
+    '/exchange/v1/orders/status',
+    '/exchange/v1/orders/status_multiple',
+    '/exchange/v1/orders/active_orders',
+    '/exchange/v1/orders/active_orders_count',
+    '/exchange/v1/orders/trade_history',
+    '/exchange/v1/derivatives/futures/orders',
+    '/exchange/v1/derivatives/futures/positions',
+    '/exchange/v1/derivatives/futures/positions/transactions',
+    '/exchange/v1/derivatives/futures/positions/cross_margin_details',
+    '/exchange/v1/derivatives/futures/trades',
+})
+
+# Request body keys that let the exchange deduplicate a repeated write
+IDEMPOTENCY_KEYS = ('client_order_id',)
+
+
+class RetryPolicy:
+    """
+    Retry policy with exponential backoff and full jitter
+
+    A failed request is retried when the failure is transient (connection
+    error or one of retry_statuses) and the request is safe to repeat:
+    GET requests and read-only POST endpoints always are; other POSTs such
+    as order creation or exit_position only when the body carries an
+    idempotency key like client_order_id.
+
+    Args:
+        max_retries (int, optional): Maximum retries after the first attempt. Default: 3
+        backoff_base (float, optional): Backoff ceiling for the first retry in seconds. Default: 0.5
+        backoff_max (float, optional): Maximum backoff in seconds. Default: 10
+        retry_statuses (iterable, optional): HTTP statuses to retry. Default: (429, 500, 503)
+        retry_connection_errors (bool, optional): Retry network errors. Default: True
+        idempotent_endpoints (iterable, optional): POST endpoints safe to repeat.
+            Default: IDEMPOTENT_ENDPOINTS
+        idempotency_keys (iterable, optional): Body keys that make a write safe to repeat.
+            Default: IDEMPOTENCY_KEYS
+
+    Example:
+        >>> client = Client(api_key='...', api_secret='...', retry_policy=RetryPolicy(max_retries=5))
+    """
+
+    def __init__(
+        self,
+        max_retries: int = 3,
+        backoff_base: float = 0.5,
+        backoff_max: float = 10.0,
+        retry_statuses: Iterable[int] = (429, 500, 503),
+        retry_connection_errors: bool = True,
+        idempotent_endpoints: Iterable[str] = IDEMPOTENT_ENDPOINTS,
+        idempotency_keys: Iterable[str] = IDEMPOTENCY_KEYS,
+    ):
+        self.max_retries = max_retries
+        self.backoff_base = backoff_base
+        self.backoff_max = backoff_max
+        self.retry_statuses = frozenset(retry_statuses)
+        self.retry_connection_errors = retry_connection_errors
+        self.idempotent_endpoints = frozenset(idempotent_endpoints)
+        self.idempotency_keys = tuple(idempotency_keys)
+
+    def is_idempotent(self, method: str, endpoint: str, data: Optional[Dict[str, Any]] = None) -> bool:
+        """
+        Check whether a request can be sent more than once safely
+
+        Args:
+            method: HTTP method
+            endpoint: API endpoint path
+            data: Request body
+
+        Returns:
+            True if repeating the request cannot duplicate a side effect
+        """
+        if method.upper() == 'GET' or endpoint in self.idempotent_endpoints:
+            return True
+        return self._has_idempotency_key(data)
+
+    def _has_idempotency_key(self, data: Any) -> bool:
+        """Look for an idempotency key at the top level or in a nested order body"""
+        if isinstance(data, dict):
+            if any(data.get(key) for key in self.idempotency_keys):
+                return True
+            return any(
+                self._has_idempotency_key(value)
+                for value in data.values()
+                if isinstance(value, (dict, list))
+            )
+        if isinstance(data, list):
+            return bool(data) and all(self._has_idempotency_key(item) for item in data)
+        return False
+
+    def is_retryable(self, error: CoinDCXException) -> bool:
+        """
+        Check whether an error is transient
+
+        Args:
+            error: Exception raised by the request
+
+        Returns:
+            True for connection errors and retryable HTTP statuses
+        """
+        if isinstance(error, CoinDCXRequestException):
+            return self.retry_connection_errors
+        if isinstance(error, (CoinDCXRateLimitException, CoinDCXAPIException)):
+            # Client-side rate limiter errors have no status code and are not retried
+            return error.status_code in self.retry_statuses
+        return False
+
+    def backoff(self, attempt: int) -> float:
+        """
+        Get the delay before a retry
+
+        Args:
+            attempt: Zero-based index of the retry
+
+        Returns:
+            Random delay between 0 and the exponential ceiling, in seconds
+        """
+        ceiling = min(self.backoff_max, self.backoff_base * (2 ** attempt))
+        return random.uniform(0, ceiling)
+
+    def get_delay(
+        self,
+        error: CoinDCXException,
+        attempt: int,
+        method: str,
+        endpoint: str,
+        data: Optional[Dict[str, Any]] = None,
+    ) -> Optional[float]:
+        """
+        Decide whether to retry a failed request
+
+        Args:
+            error: Exception raised by the request
+            attempt: Zero-based index of the retry about to be made
+            method: HTTP method
+            endpoint: API endpoint path
+            data: Request body
+
+        Returns:
+            Seconds to wait before retrying, or None to re-raise the error
+        """
+        if attempt >= self.max_retries:
+            return None
+        if not self.is_retryable(error) or not self.is_idempotent(method, endpoint, data):
+            return None
+
+        delay = self.backoff(attempt)
+        retry_after = getattr(error, 'retry_after', None)
+        if retry_after is not None:
+            delay = max(delay, retry_after)
+        return delay
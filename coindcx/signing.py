@@ -0,0 +1,72 @@
+"""
+CoinDCX Request Signing
+
+HMAC-SHA256 signer that keys the HMAC once and copies the keyed state for
+each request, instead of re-deriving the key on every call.
+"""
+
+import hashlib
+import hmac
+from typing import Iterable, List, Union
+
+
+class Signer:
+    """
+    Precomputed HMAC-SHA256 signer
+
+    The secret is processed into an HMAC object once at construction.
+    Each signature starts from a copy of that keyed state, so per-request
+    work is only hashing the payload. Safe to share between threads.
+
+    Args:
+        secret (str): API secret
+
+    Example:
+        >>> signer = Signer('your_secret')
+        >>> signer.sign(b'{"timestamp":1700000000000}')
+        '5f0c...'
+    """
+
+    __slots__ = ('secret', '_keyed')
+
+    def __init__(self, secret: str):
+        self.secret = secret
+        self._keyed = hmac.new(secret.encode('utf-8'), digestmod=hashlib.sha256)
+
+    def sign(self, payload: Union[bytes, str]) -> str:
+        """
+        Sign a request body
+
+        Args:
+            payload: Body bytes exactly as sent on the wire. A str is
+                UTF-8 encoded first.
+
+        Returns:
+            Hexadecimal signature string
+        """
+        if isinstance(payload, str):
+            payload = payload.encode('utf-8')
+
+        mac = self._keyed.copy()
+        mac.update(payload)
+        return mac.hexdigest()
+
+    def sign_many(self, payloads: Iterable[Union[bytes, str]]) -> List[str]:
+        """
+        Sign many request bodies at once, e.g. for bulk order placement
+
+        Args:
+            payloads: Iterable of body bytes
+
+        Returns:
+            List of hexadecimal signatures, in input order
+        """
+        keyed_copy = self._keyed.copy
+        signatures = []
+        for payload in payloads:
+            if isinstance(payload, str):
+                payload = payload.encode('utf-8')
+            mac = keyed_copy()
+            mac.update(payload)
+            signatures.append(mac.hexdigest())
+        return signatures
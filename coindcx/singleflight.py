@@ -0,0 +1,119 @@
+"""
+CoinDCX Request Coalescing
+
+Single-flight execution: concurrent identical calls share the one that is
+already in flight instead of each sending its own request.
+"""
+
+import threading
+from typing import Any, Awaitable, Callable, Dict, Hashable
+
+
+class _Call:
+    """An in-flight call shared by a leader thread and its followers"""
+
+    __slots__ = ('event', 'result', 'error')
+
+    def __init__(self):
+        self.event = threading.Event()
+        self.result = None
+        self.error = None
+
+
+class SingleFlight:
+    """
+    Coalesce concurrent calls that share a key
+
+    The first caller for a key (the leader) runs the function; callers that
+    arrive while it is running wait for it and receive the same result or
+    exception. Once the call completes the key is released, so later calls
+    run again. Shared results must be treated as read-only.
+
+    Example:
+        >>> flight = SingleFlight()
+        >>> flight.do(('ticker',), fetch_ticker)  # concurrent callers share one fetch
+    """
+
+    def __init__(self):
+        self._calls: Dict[Hashable, _Call] = {}
+        self._async_calls: Dict[Hashable, Any] = {}
+        self._lock = threading.Lock()
+        self.shared = 0
+
+    def do(self, key: Hashable, fn: Callable[[], Any]) -> Any:
+        """
+        Run fn, or wait for an identical call already in flight
+
+        Args:
+            key: Hashable identity of the call
+            fn: Zero-argument function to run
+
+        Returns:
+            Result of fn, shared with concurrent callers
+
+        Raises:
+            Exception: Whatever fn raised, re-raised in every waiting caller
+        """
+        with self._lock:
+            call = self._calls.get(key)
+            if call is not None:
+                self.shared += 1
+                leader = False
+            else:
+                call = _Call()
+                self._calls[key] = call
+                leader = True
+
+        if not leader:
+            call.event.wait()
+            if call.error is not None:
+                raise call.error
+            return call.result
+
+        try:
+            call.result = fn()
+        except BaseException as e:
+            call.error = e
+            raise
+        finally:
+            with self._lock:
+                del self._calls[key]
+            call.event.set()
+
+        return call.result
+
+    async def do_async(self, key: Hashable, fn: Callable[[], Awaitable[Any]]) -> Any:
+        """
+        Coroutine version of do for use within a single event loop
+
+        Args:
+            key: Hashable identity of the call
+            fn: Zero-argument function returning an awaitable
+
+        Returns:
+            Result of the awaitable, shared with concurrent callers
+        """
+        import asyncio
+
+        future = self._async_calls.get(key)
+        if future is not None:
+            self.shared += 1
+            # Shield so one cancelled follower does not cancel the shared call
+            return await asyncio.shield(future)
+
+        future = asyncio.ensure_future(fn())
+        self._async_calls[key] = future
+        try:
+            return await asyncio.shield(future)
+        finally:
+            if self._async_calls.get(key) is future:
+                del self._async_calls[key]
+
+    def in_flight(self) -> int:
+        """
+        Get the number of calls currently in flight
+
+        Returns:
+            Number of distinct keys being executed
+        """
+        return len(self._calls) + len(self._async_calls)
@@ -0,0 +1,1246 @@
+"""
+CoinDCX Streams
+
+Socket.IO client for the CoinDCX stream: joins public channels and the
+signed private account channel over one connection and delivers their
+events to callbacks or iterators, re-joining every channel after an
+automatic reconnect.
+"""
+
+import asyncio
+import inspect
+import queue
+import threading
+from typing import Any, Callable, Dict, Hashable, Iterable, List, Optional, Tuple, Union
+
+from .account import ACCOUNT_EVENTS, PRIVATE_CHANNEL, FuturesAccount, parse_account_event
+from .backpressure import DEFAULT_QUEUE_SIZE, DROP_OLDEST, AsyncEventQueue, EventQueue, event_key
+from .codec import JSONCodec, get_codec
+from .depth import LocalOrderBook, decode_event
+from .enums import STREAM_URL, StreamEvent
+from .exceptions import CoinDCXAuthenticationException
+
+
+# Message fields holding one entry per pair (current prices, price stats)
+_PAIR_MAPPINGS = ('prices', 'stats')
+
+# Marks a queued action (a tracker's sync) rather than an event
+_CONTROL = object()
+
+# Public spot channels that are not tied to one pair
+CURRENT_PRICES_CHANNEL = 'currentPrices@spot@10s'
+PRICE_STATS_CHANNEL = 'priceStats@spot@60s'
+
+
+def _import_socketio():
+    """Import python-socketio, with an install hint if it is missing"""
+    try:
+        import socketio
+    except ImportError:
+        raise ImportError(
+            "Streaming requires python-socketio. Install it with: pip install coindcx[stream]"
+        ) from None
+    return socketio
+
+
+def _value(value: Any) -> Any:
+    """Get the plain string value of an enum member"""
+    return getattr(value, 'value', value)
+
+
+def _symbol(pair: str) -> str:
+    """Normalize a pair ('B-BTC_USDT') or symbol ('BTCUSDT') for matching"""
+    return pair.split('-', 1)[-1].replace('_', '').upper()
+
+
+def depth_channel(pair: str, depth: int = 20, futures: bool = False) -> str:
+    """
+    Get the order book channel of a pair
+
+    Args:
+        pair: Market pair (e.g., 'B-BTC_USDT')
+        depth: Book depth - 10, 20 or 50. Default: 20
+        futures: Futures instrument channel. Default: False
+
+    Returns:
+        Channel name (e.g., 'B-BTC_USDT@orderbook@20')
+    """
+    suffix = '-futures' if futures else ''
+    return f"{pair}@orderbook@{depth}{suffix}"
+
+
+def trades_channel(pair: str, futures: bool = False) -> str:
+    """
+    Get the new-trade channel of a pair
+
+    Args:
+        pair: Market pair (e.g., 'B-BTC_USDT')
+        futures: Futures instrument channel. Default: False
+
+    Returns:
+        Channel name (e.g., 'B-BTC_USDT@trades')
+    """
+    suffix = '-futures' if futures else ''
+    return f"{pair}@trades{suffix}"
+
+
+def candlestick_channel(pair: str, interval: Any = '1m', futures: bool = False) -> str:
+    """
+    Get the candlestick channel of a pair
+
+    Args:
+        pair: Market pair (e.g., 'B-BTC_USDT')
+        interval: Candle interval (e.g., '1m', '1h' or CandleInterval).
+            Default: '1m'
+        futures: Futures instrument channel. Default: False
+
+    Returns:
+        Channel name (e.g., 'B-BTC_USDT_1m')
+    """
+    suffix = '-futures' if futures else ''
+    return f"{pair}_{_value(interval)}{suffix}"
+
+
+def prices_channel(pair: str) -> str:
+    """
+    Get the last traded price (LTP) channel of a pair
+
+    Args:
+        pair: Market pair (e.g., 'B-BTC_USDT')
+
+    Returns:
+        Channel name (e.g., 'B-BTC_USDT@prices')
+    """
+    return f"{pair}@prices"
+
+
+class Subscription:
+    """
+    Events of one channel, delivered to a callback or an iterator
+
+    Created by Stream.subscribe(). Each subscriber is isolated from the
+    shared connection by its own bounded queue:
+
+    - Without a callback, events are queued and read by iterating the
+      subscription: a plain for loop on a Stream, async for on an
+      AsyncStream. Each item is an (event, message) tuple.
+    - With a callback, events are queued and a dedicated worker thread (or
+      task) runs the callback, so a slow callback only delays its own
+      events.
+    - With a callback and inline=True, the callback runs during dispatch
+      and holds up every other subscription until it returns. Use this
+      only for handlers that return at once.
+
+    When a queue is full, the policy decides: 'drop_oldest' (default)
+    discards the oldest waiting event, 'conflate' keeps only the newest
+    waiting event per key, and 'block' makes the connection wait for space,
+    which delays every other subscription too.
+
+    Socket.IO events carry an event name but not the channel, so events are
+    matched to subscriptions by name and then by the message's symbol ('s')
+    and candle interval ('i') fields. Messages without those fields (such as
+    price-change) reach every subscription to that event.
+
+    Attributes:
+        channel (str): Channel name
+        events (tuple): Event names delivered
+        pair (str): Pair used to match messages, or None for all
+        transform (callable): Applied as transform(event, message) before
+            delivery, or None
+        received (int): Events delivered so far
+        errors (int): Exceptions raised by the callback in the worker
+        error (Exception): The last such exception, or None
+    """
+
+    def __init__(
+        self,
+        stream: 'Stream',
+        channel: str,
+        events: Iterable[Any],
+        callback: Optional[Callable[[str, Any], Any]] = None,
+        pair: Optional[str] = None,
+        interval: Optional[Any] = None,
+        transform: Optional[Callable[[str, Any], Any]] = None,
+        maxsize: Optional[int] = None,
+        policy: Optional[str] = None,
+        key: Optional[Callable[[Tuple[str, Any]], Hashable]] = None,
+        inline: bool = False,
+    ):
+        self.stream = stream
+        self.channel = channel
+        self.events = tuple(_value(event) for event in events)
+        self.callback = callback
+        self.pair = pair
+        self.interval = None if interval is None else _value(interval)
+        self.transform = transform
+        self.received = 0
+        self.errors = 0
+        self.error: Optional[BaseException] = None
+        self.closed = False
+        self._symbol = None if pair is None else _symbol(pair)
+
+        self._queue = None
+        self._worker = None
+        self._setup(maxsize, policy, key, inline)
+
+    def _setup(
+        self,
+        maxsize: Optional[int],
+        policy: Optional[str],
+        key: Optional[Callable],
+        inline: bool,
+    ):
+        """Create the queue and worker, unless the callback runs inline"""
+        if inline:
+            if self.callback is None:
+                raise ValueError("inline delivery needs a callback")
+            if maxsize is not None or policy is not None or key is not None:
+                raise ValueError("an inline callback has no queue options")
+            return
+        self._queue = self.stream._new_queue(
+            maxsize or DEFAULT_QUEUE_SIZE,
+            policy or DROP_OLDEST,
+            key or event_key,
+        )
+        if self.callback is not None:
+            self.stream._start_worker(self)
+
+    @property
+    def queued(self) -> bool:
+        """Whether events pass through a queue rather than an inline callback"""
+        return self._queue is not None
+
+    def matches(self, message: Any) -> bool:
+        """
+        Check whether a message belongs to this subscription
+
+        Args:
+            message: Decoded event message
+
+        Returns:
+            False if the message names another channel, symbol or interval
+        """
+        if not isinstance(message, dict):
+            return True
+        channel = message.get('channel', message.get('channelName'))
+        if channel is not None:
+            return channel == self.channel
+        if self._symbol is not None:
+            symbol = message.get('s')
+            if isinstance(symbol, str) and _symbol(symbol) != self._symbol:
+                return False
+        if self.interval is not None:
+            interval = message.get('i')
+            if interval is not None and interval != self.interval:
+                return False
+        return True
+
+    def _deliver(self, event: str, message: Any) -> Any:
+        """Hand one event to the inline callback or the queue"""
+        self.received += 1
+        if self.transform is not None:
+            message = self.transform(event, message)
+        if self._queue is None:
+            return self.callback(event, message)
+        return self._queue.put((event, message))
+
+    def _call_soon(self, action: Callable[[], Any]) -> Any:
+        """
+        Run an action in order with this subscription's callbacks
+
+        Queued behind pending events and run by the worker, so a tracker's
+        sync never races its own event handler. Inline subscriptions run
+        it at once.
+        """
+        if self._queue is None:
+            return action()
+        return self._queue.put((_CONTROL, action))
+
+    def _work(self):
+        """Worker thread: run the callback for each queued event"""
+        while True:
+            try:
+                event, message = self._queue.get()
+            except queue.Empty:
+                return
+            try:
+                if event is _CONTROL:
+                    message()
+                else:
+                    self.callback(event, message)
+            except Exception as exc:
+                self.errors += 1
+                self.error = exc
+
+    async def _work_async(self):
+        """Worker task: run the callback for each queued event"""
+        while True:
+            try:
+                event, message = await self._queue.get()
+            except queue.Empty:
+                return
+            try:
+                if event is _CONTROL:
+                    result = message()
+                else:
+                    result = self.callback(event, message)
+                if inspect.isawaitable(result):
+                    await result
+            except Exception as exc:
+                self.errors += 1
+                self.error = exc
+
+    def get(self, timeout: Optional[float] = None) -> Tuple[str, Any]:
+        """
+        Wait for the next queued event (Stream subscriptions only)
+
+        Args:
+            timeout: Seconds to wait (default: forever)
+
+        Returns:
+            (event, message) tuple
+
+        Raises:
+            queue.Empty: If the timeout expires
+            StopIteration: If the subscription is closed
+        """
+        try:
+            return self._queue.get(timeout)
+        except queue.Empty:
+            if self._queue.closed:
+                raise StopIteration from None
+            raise
+
+    def __iter__(self):
+        if self._queue is None or self.callback is not None:
+            raise TypeError("Subscriptions with a callback cannot be iterated")
+        return self
+
+    def __next__(self) -> Tuple[str, Any]:
+        return self.get()
+
+    def __aiter__(self):
+        if self._queue is None or self.callback is not None:
+            raise TypeError("Subscriptions with a callback cannot be iterated")
+        return self
+
+    async def __anext__(self) -> Tuple[str, Any]:
+        try:
+            return await self._queue.get()
+        except queue.Empty:
+            raise StopAsyncIteration from None
+
+    def stats(self) -> Dict[str, Any]:
+        """
+        Get delivery counters, queue depth and lag
+
+        Returns:
+            Dictionary with channel, events, received and errors, plus the
+            queue's stats (policy, maxsize, depth, max_depth, dropped,
+            conflated, blocked, oldest_age and lag in seconds) when queued.
+            Inline callbacks report policy 'inline'.
+        """
+        stats = {'policy': 'inline'} if self._queue is None else self._queue.stats()
+        stats.update(
+            channel=self.channel,
+            events=list(self.events),
+            received=self.received,
+            errors=self.errors,
+        )
+        return stats
+
+    def _close(self):
+        """Mark closed and end any iterator or worker"""
+        if self.closed:
+            return
+        self.closed = True
+        if self._queue is not None:
+            self._queue.close()
+
+    def close(self) -> Any:
+        """
+        Stop receiving events; the channel is left once no subscription uses it
+
+        Returns:
+            None (an awaitable on an AsyncStream)
+        """
+        return self.stream.unsubscribe(self)
+
+    def __repr__(self):
+        mode = 'inline' if self._queue is None else f"{self._queue.policy} depth={self._queue.depth}"
+        return f"Subscription({self.channel} events={list(self.events)} {mode} received={self.received})"
+
+
+class LatestSubscription(Subscription):
+    """
+    Latest value per pair of a channel, read on demand
+
+    Created by Stream.subscribe(..., latest=True). Nothing is queued: each
+    event overwrites its pair's slot in place, and the consumer reads the
+    newest state whenever it is ready, so memory and work stay bounded
+    however fast the feed is. Meant for current-prices, price-stats,
+    price-change (LTP) and candlestick channels.
+
+    Slots are keyed by pair. Messages with a per-pair mapping - 'prices'
+    (current prices) or 'stats' (price stats) - fill one slot per pair in
+    it with that pair's entry. Other messages fill the slot of their 's'
+    symbol, or else the subscription's pair, with the whole message.
+    price-change messages name no pair, so Stream.subscribe_prices()
+    refuses a latest-value subscription alongside another pair's LTP
+    subscription. Pairs may be looked up as 'B-BTC_USDT' or 'BTCUSDT'.
+
+    Attributes:
+        updates (int): Slot writes so far
+        overwritten (int): Writes that replaced a value never read with
+            changed()
+    """
+
+    def _setup(
+        self,
+        maxsize: Optional[int],
+        policy: Optional[str],
+        key: Optional[Callable],
+        inline: bool,
+    ):
+        """Create the slots; latest-value subscriptions have no callback or queue"""
+        if self.callback is not None or inline:
+            raise ValueError("A latest-value subscription is read with latest(), not a callback")
+        if maxsize is not None or policy is not None or key is not None:
+            raise ValueError("A latest-value subscription has no queue options")
+        self._lock = threading.Lock()
+        # Normalized symbol -> (pair as received, value)
+        self._slots: Dict[str, Tuple[str, Any]] = {}
+        self._changed: set = set()
+        self.updates = 0
+        self.overwritten = 0
+
+    def _slot_values(self, message: Any) -> Iterable[Tuple[str, Any]]:
+        """Split a message into (pair, value) slot writes"""
+        if isinstance(message, dict):
+            for field in _PAIR_MAPPINGS:
+                entries = message.get(field)
+                if isinstance(entries, dict):
+                    return entries.items()
+            pair = message.get('s') or self.pair
+        else:
+            pair = self.pair
+        return ((pair or self.channel, message),)
+
+    def _deliver(self, event: str, message: Any):
+        self.received += 1
+        if self.transform is not None:
+            message = self.transform(event, message)
+        with self._lock:
+            for pair, value in self._slot_values(message):
+                slot = _symbol(pair)
+                if slot in self._changed:
+                    self.overwritten += 1
+                self._slots[slot] = (pair, value)
+                self._changed.add(slot)
+                self.updates += 1
+
+    def latest(self, pair: Optional[str] = None) -> Any:
+        """
+        Get the newest value of a pair
+
+        Args:
+            pair (optional): Pair or symbol. Default: the subscription's
+                pair, or the only slot
+
+        Returns:
+            Newest message (or 'prices' entry), or None before the first
+        """
+        if pair is None:
+            pair = self.pair
+        if pair is None:
+            if len(self._slots) != 1:
+                return None
+            return next(iter(self._slots.values()))[1]
+        slot = self._slots.get(_symbol(pair))
+        return None if slot is None else slot[1]
+
+    def snapshot(self) -> Dict[str, Any]:
+        """
+        Get the newest value of every pair
+
+        Returns:
+            Dictionary of pair to value
+        """
+        with self._lock:
+            return dict(self._slots.values())
+
+    def changed(self) -> Dict[str, Any]:
+        """
+        Get the pairs updated since the previous call, with their newest value
+
+        Returns:
+            Dictionary of pair to value; empty if nothing changed
+        """
+        with self._lock:
+            changed, self._changed = self._changed, set()
+            return dict(self._slots[slot] for slot in changed)
+
+    def __iter__(self):
+        raise TypeError("Read a latest-value subscription with latest(), snapshot() or changed()")
+
+    def __aiter__(self):
+        raise TypeError("Read a latest-value subscription with latest(), snapshot() or changed()")
+
+    def stats(self) -> Dict[str, Any]:
+        """
+        Get delivery counters and slot usage
+
+        Returns:
+            Dictionary with policy 'latest', channel, events, received,
+            errors, slots, pending (slots changed since the last changed()),
+            updates and overwritten
+        """
+        return {
+            'policy': 'latest',
+            'channel': self.channel,
+            'events': list(self.events),
+            'received': self.received,
+            'errors': self.errors,
+            'slots': len(self._slots),
+            'pending': len(self._changed),
+            'updates': self.updates,
+            'overwritten': self.overwritten,
+        }
+
+    def __repr__(self):
+        return f"LatestSubscription({self.channel} slots={len(self._slots)} received={self.received})"
+
+
+class Stream:
+    """
+    CoinDCX stream client
+
+    One Socket.IO connection to stream.coindcx.com carries every joined
+    channel. The threaded python-socketio client runs the handler of each
+    incoming packet on its own short-lived thread, so handlers may overlap
+    and need not finish in arrival order. The stream serializes dispatch
+    with a lock: subscriptions see one event at a time, and order books and
+    accounts rely on their version and updated_at checks for ordering.
+    Events go to callbacks or to per-subscription queues read with a for
+    loop. When the connection drops, python-socketio reconnects with
+    backoff and every channel is joined again; tracked order books and
+    accounts resync, since updates were missed while disconnected.
+
+    The private 'coindcx' channel is joined with an HMAC-SHA256 signature of
+    {"channel":"coindcx"} made with the API secret, the same signing used
+    for REST requests.
+
+    Requires the optional python-socketio dependency:
+    pip install coindcx[stream]
+
+    Args:
+        api_key (str, optional): API key, for the private channel
+        api_secret (str, optional): API secret, for the private channel
+        url (str, optional): Stream URL. Default: STREAM_URL
+        client (Client, optional): REST client. Credentials and the JSON
+            codec are taken from it unless given here, and order books and
+            accounts fetch their snapshots through it
+        json_codec (str or JSONCodec, optional): Decoder for event
+            messages. Default: the client's codec, or 'auto' (orjson if
+            installed)
+        reconnection (bool, optional): Reconnect automatically. Default: True
+        reconnection_delay (float, optional): First reconnect delay in
+            seconds. Default: 1
+        reconnection_delay_max (float, optional): Longest reconnect delay in
+            seconds. Default: 30
+
+    Example:
+        >>> stream = Stream()
+        >>> stream.subscribe_trades('B-BTC_USDT', lambda event, trade: print(trade['p']))
+        >>> prices = stream.subscribe_current_prices()
+        >>> stream.connect()
+        >>> for event, message in prices:
+        ...     print(message['prices'])
+    """
+
+    def __init__(
+        self,
+        api_key: Optional[str] = None,
+        api_secret: Optional[str] = None,
+        url: str = STREAM_URL,
+        client: Optional[Any] = None,
+        json_codec: Union[str, JSONCodec, None] = None,
+        reconnection: bool = True,
+        reconnection_delay: float = 1.0,
+        reconnection_delay_max: float = 30.0,
+    ):
+        self.client = client
+        self.api_key = api_key if api_key is not None else getattr(client, 'api_key', None)
+        self.api_secret = api_secret if api_secret is not None else getattr(client, 'api_secret', None)
+        self.url = url
+        if json_codec is None:
+            self.json_codec = getattr(client, 'json_codec', None) or get_codec('auto')
+        else:
+            self.json_codec = get_codec(json_codec)
+        self.reconnection = reconnection
+        self.reconnection_delay = reconnection_delay
+        self.reconnection_delay_max = reconnection_delay_max
+
+        self.connects = 0
+        self._sio = None
+        self._signer = None
+        self._lock = threading.Lock()
+        # Packet handlers may run on several socket threads at once
+        self._dispatch_lock = threading.Lock()
+        # Copy-on-write, so dispatch reads them without locking
+        self._subscriptions: Tuple[Subscription, ...] = ()
+        self._by_event: Dict[str, Tuple[Subscription, ...]] = {}
+        self._handled_events: set = set()
+        # Snapshot-backed state (order books, accounts) to sync on connect,
+        # with the subscription feeding each
+        self._trackers: List[Tuple[Any, Subscription]] = []
+
+    @property
+    def sio(self) -> Any:
+        """Socket.IO client, created on first access"""
+        if self._sio is None:
+            self._sio = self._create_socket()
+            self._sio.on('connect', self._on_connect)
+            for event in self._handled_events:
+                self._register(event)
+        return self._sio
+
+    def _create_socket(self) -> Any:
+        """Create the python-socketio client"""
+        socketio = _import_socketio()
+        return socketio.Client(
+            reconnection=self.reconnection,
+            reconnection_delay=self.reconnection_delay,
+            reconnection_delay_max=self.reconnection_delay_max,
+        )
+
+    @property
+    def connected(self) -> bool:
+        """Whether the socket is connected"""
+        return self._sio is not None and bool(self._sio.connected)
+
+    @property
+    def reconnects(self) -> int:
+        """Number of times the connection was re-established"""
+        return max(0, self.connects - 1)
+
+    @property
+    def channels(self) -> List[str]:
+        """Channels joined (or to be joined on connect)"""
+        return list(dict.fromkeys(sub.channel for sub in self._subscriptions))
+
+    def _new_queue(self, maxsize: int, policy: str, key: Callable[[Any], Hashable]) -> Any:
+        """Create a subscription's bounded queue"""
+        return EventQueue(maxsize, policy, key)
+
+    def _start_worker(self, subscription: Subscription):
+        """Run a queued subscription's callback on its own thread"""
+        thread = threading.Thread(
+            target=subscription._work,
+            name=f"coindcx-stream {subscription.channel}",
+            daemon=True,
+        )
+        subscription._worker = thread
+        thread.start()
+
+    def _register(self, event: str):
+        """Route a Socket.IO event name to _dispatch, one event at a time"""
+        def handler(payload=None):
+            with self._dispatch_lock:
+                self._dispatch(event, payload)
+
+        self._sio.on(event, handler)
+
+    def _sign(self, payload: bytes) -> str:
+        """Sign a payload with the API secret"""
+        if not self.api_secret:
+            raise CoinDCXAuthenticationException(
+                "API secret is required for the private stream channel"
+            )
+        signer = self._signer
+        if signer is None or signer.secret != self.api_secret:
+            from .signing import Signer
+            signer = self._signer = Signer(self.api_secret)
+        return signer.sign(payload)
+
+    def _join_payload(self, channel: str) -> Dict[str, Any]:
+        """
+        Body of the join and leave messages for a channel
+
+        Raises:
+            CoinDCXAuthenticationException: If the channel is private and
+                API credentials are missing
+        """
+        if channel != PRIVATE_CHANNEL:
+            return {'channelName': channel}
+        if not self.api_key:
+            raise CoinDCXAuthenticationException(
+                "API key is required for the private stream channel"
+            )
+        signature = self._sign(self.json_codec.dumps({'channel': channel}))
+        return {'channelName': channel, 'authSignature': signature, 'apiKey': self.api_key}
+
+    def _emit(self, event: str, data: Any) -> Any:
+        """Send a message over the socket"""
+        return self.sio.emit(event, data)
+
+    def _run(self, result: Any) -> Any:
+        """Run the result of a tracker's sync (nothing to do without asyncio)"""
+        return result
+
+    def _add(self, subscription: Subscription) -> bool:
+        """Register a subscription; True if its channel is new"""
+        with self._lock:
+            new_channel = subscription.channel not in self.channels
+            self._subscriptions += (subscription,)
+            for event in subscription.events:
+                self._by_event[event] = self._by_event.get(event, ()) + (subscription,)
+                if event not in self._handled_events:
+                    self._handled_events.add(event)
+                    if self._sio is not None:
+                        self._register(event)
+        return new_channel
+
+    def _remove(self, subscription: Subscription) -> bool:
+        """Unregister a subscription; True if its channel is now unused"""
+        with self._lock:
+            if subscription not in self._subscriptions:
+                return False
+            self._subscriptions = tuple(sub for sub in self._subscriptions if sub is not subscription)
+            for event in subscription.events:
+                self._by_event[event] = tuple(
+                    sub for sub in self._by_event.get(event, ()) if sub is not subscription
+                )
+            unused = subscription.channel not in self.channels
+            if unused:
+                self._trackers = [
+                    (tracker, sub) for tracker, sub in self._trackers if sub.channel != subscription.channel
+                ]
+            return unused
+
+    def _matching(self, event: str, payload: Any) -> Tuple[Any, List[Subscription]]:
+        """Decode a payload and find the subscriptions it belongs to"""
+        message = decode_event(payload, self.json_codec.loads)
+        subscriptions = self._by_event.get(event, ())
+        if len(subscriptions) > 1:
+            subscriptions = [sub for sub in subscriptions if sub.matches(message)]
+        return message, subscriptions
+
+    def _dispatch(self, event: str, payload: Any):
+        """Deliver one Socket.IO event to its subscriptions"""
+        message, subscriptions = self._matching(event, payload)
+        for subscription in subscriptions:
+            subscription._deliver(event, message)
+
+    def _tracker_action(self, tracker: Any) -> Optional[Callable[[], Any]]:
+        """Sync on the first connect, resync after a reconnect"""
+        if self.connects > 1:
+            return tracker.resync
+        if tracker.client is not None:
+            return tracker.sync
+        return None
+
+    def _on_connect(self):
+        """Join every channel and queue tracked state to be brought back in sync"""
+        self.connects += 1
+        for channel in self.channels:
+            self.sio.emit('join', self._join_payload(channel))
+        for tracker, subscription in list(self._trackers):
+            action = self._tracker_action(tracker)
+            if action is not None:
+                subscription._call_soon(action)
+
+    def connect(self) -> 'Stream':
+        """
+        Open the connection and join every subscribed channel
+
+        Returns:
+            The stream itself
+        """
+        self.sio.connect(self.url, transports=['websocket'])
+        return self
+
+    def subscribe(
+        self,
+        channel: str,
+        events: Union[str, Iterable[Any]],
+        callback: Optional[Callable[[str, Any], Any]] = None,
+        pair: Optional[str] = None,
+        interval: Optional[Any] = None,
+        transform: Optional[Callable[[str, Any], Any]] = None,
+        maxsize: Optional[int] = None,
+        policy: Optional[str] = None,
+        key: Optional[Callable[[Tuple[str, Any]], Hashable]] = None,
+        latest: bool = False,
+        inline: bool = False,
+    ) -> Subscription:
+        """
+        Join a channel and receive some of its events
+
+        May be called before or after connect(). Every subscription shares
+        the one connection; each callback runs on its own worker behind a
+        bounded queue, so it cannot hold up the others.
+
+        Args:
+            channel: Channel name (see depth_channel, trades_channel, ...)
+            events: Event name, or several (str or StreamEvent)
+            callback (optional): Called as callback(event, message). If
+                omitted, iterate the subscription instead
+            pair (optional): Only deliver messages for this pair, when
+                other subscriptions share the event name
+            interval (optional): Only deliver candles of this interval
+            transform (optional): Applied as transform(event, message)
+                before delivery
+            maxsize (int, optional): Most events waiting in the queue.
+                Default: 10000
+            policy (str, optional): What a full queue does - 'drop_oldest'
+                (default), 'conflate' or 'block'. 'block' stalls the whole
+                connection until the consumer catches up
+            key (callable, optional): Conflate key of an (event, message)
+                item. Default: event name, symbol and interval
+            latest (bool, optional): Keep only the newest value per pair,
+                read with latest(), snapshot() or changed(), instead of
+                delivering every event. Default: False
+            inline (bool, optional): Run the callback during dispatch, with
+                no queue. Every other subscription waits for it, so use it
+                only for handlers that return at once. Default: False
+
+        Returns:
+            Subscription (LatestSubscription with latest=True)
+
+        Raises:
+            CoinDCXAuthenticationException: If the channel is private and
+                API credentials are missing
+            ValueError: If the policy is unknown or maxsize is not positive,
+                latest=True is combined with a callback or queue options, or
+                inline=True is combined with queue options or no callback
+
+        Example:
+            >>> def on_trade(event, trade):
+            ...     save_to_database(trade)  # slow, runs on its own thread
+            >>> stream.subscribe(trades_channel('B-BTC_USDT'), 'new-trade',
+            ...                  on_trade, maxsize=1000, policy='drop_oldest')
+        """
+        if isinstance(events, (str, StreamEvent)):
+            events = (events,)
+        join = self._join_payload(channel)
+        kind = LatestSubscription if latest else Subscription
+        subscription = kind(
+            self, channel, events, callback, pair, interval, transform, maxsize, policy, key, inline
+        )
+        if self._add(subscription) and self.connected:
+            self._emit('join', join)
+        return subscription
+
+    def unsubscribe(self, subscription: Subscription) -> Any:
+        """
+        Stop a subscription, leaving its channel if nothing else uses it
+
+        Args:
+            subscription: Subscription returned by subscribe()
+        """
+        if self._remove(subscription) and self.connected:
+            self.sio.emit('leave', self._join_payload(subscription.channel))
+        subscription._close()
+
+    def subscribe_depth(
+        self,
+        pair: str,
+        callback: Optional[Callable[[str, Any], Any]] = None,
+        depth: int = 20,
+        **options: Any,
+    ) -> Subscription:
+        """
+        Subscribe to depth-snapshot and depth-update events of a pair
+
+        Args:
+            pair: Market pair (e.g., 'B-BTC_USDT')
+            callback (optional): Called as callback(event, message)
+            depth: Book depth - 10, 20 or 50. Default: 20
+            **options: Passed to subscribe() (maxsize, policy, key, inline)
+
+        Returns:
+            Subscription
+        """
+        return self.subscribe(
+            depth_channel(pair, depth),
+            (StreamEvent.DEPTH_SNAPSHOT, StreamEvent.DEPTH_UPDATE),
+            callback,
+            pair=pair,
+            **options,
+        )
+
+    def subscribe_trades(
+        self,
+        pair: str,
+        callback: Optional[Callable[[str, Any], Any]] = None,
+        **options: Any,
+    ) -> Subscription:
+        """
+        Subscribe to new-trade events of a pair
+
+        Args:
+            pair: Market pair (e.g., 'B-BTC_USDT')
+            callback (optional): Called as callback(event, trade)
+            **options: Passed to subscribe() (maxsize, policy, key, latest, inline)
+
+        Returns:
+            Subscription
+        """
+        return self.subscribe(trades_channel(pair), StreamEvent.NEW_TRADE, callback, pair=pair, **options)
+
+    def subscribe_candlesticks(
+        self,
+        pair: str,
+        interval: Any = '1m',
+        callback: Optional[Callable[[str, Any], Any]] = None,
+        **options: Any,
+    ) -> Subscription:
+        """
+        Subscribe to candlestick events of a pair
+
+        Args:
+            pair: Market pair (e.g., 'B-BTC_USDT')
+            interval: Candle interval. Default: '1m'
+            callback (optional): Called as callback(event, message)
+            **options: Passed to subscribe() (maxsize, policy, key, latest, inline)
+
+        Returns:
+            Subscription
+        """
+        return self.subscribe(
+            candlestick_channel(pair, interval),
+            StreamEvent.CANDLESTICK,
+            callback,
+            pair=pair,
+            interval=interval,
+            **options,
+        )
+
+    def subscribe_current_prices(
+        self,
+        callback: Optional[Callable[[str, Any], Any]] = None,
+        channel: str = CURRENT_PRICES_CHANNEL,
+        **options: Any,
+    ) -> Subscription:
+        """
+        Subscribe to current prices of every spot pair
+
+        Args:
+            callback (optional): Called as callback(event, message)
+            channel (optional): 'currentPrices@spot@10s' (default) or
+                'currentPrices@spot@1s'
+            **options: Passed to subscribe() (maxsize, policy, key, latest, inline)
+
+        Returns:
+            Subscription
+        """
+        return self.subscribe(channel, StreamEvent.CURRENT_PRICES, callback, **options)
+
+    def subscribe_price_stats(
+        self,
+        callback: Optional[Callable[[str, Any], Any]] = None,
+        **options: Any,
+    ) -> Subscription:
+        """
+        Subscribe to 24 hour price change and volume of every spot pair
+
+        Args:
+            callback (optional): Called as callback(event, message)
+            **options: Passed to subscribe() (maxsize, policy, key, latest, inline)
+
+        Returns:
+            Subscription
+        """
+        return self.subscribe(PRICE_STATS_CHANNEL, StreamEvent.PRICE_STATS, callback, **options)
+
+    def subscribe_prices(
+        self,
+        pair: str,
+        callback: Optional[Callable[[str, Any], Any]] = None,
+        **options: Any,
+    ) -> Subscription:
+        """
+        Subscribe to last traded price (LTP) changes of a pair
+
+        price-change messages do not name their pair, so with several of
+        these subscriptions each one receives every pair's changes. A
+        latest-value subscription (latest=True) could not tell the pairs
+        apart, so it must be the stream's only LTP channel.
+
+        Args:
+            pair: Market pair (e.g., 'B-BTC_USDT')
+            callback (optional): Called as callback(event, message)
+            **options: Passed to subscribe() (maxsize, policy, key, latest, inline)
+
+        Returns:
+            Subscription
+
+        Raises:
+            ValueError: If a latest-value subscription would share
+                price-change events with another pair's LTP channel
+        """
+        channel = prices_channel(pair)
+        event = StreamEvent.PRICE_CHANGE.value
+        for other in self._by_event.get(event, ()):
+            if other.channel != channel and (options.get('latest') or isinstance(other, LatestSubscription)):
+                raise ValueError(
+                    f"price-change messages do not name their pair; a latest-value LTP "
+                    f"subscription cannot share them with {other.channel}"
+                )
+        return self.subscribe(channel, StreamEvent.PRICE_CHANGE, callback, pair=pair, **options)
+
+    def orderbook(self, pair: str, depth: int = 20, **kwargs: Any) -> LocalOrderBook:
+        """
+        Track a LocalOrderBook from this stream's depth events
+
+        The book syncs from the REST order book through the stream's client
+        once connected (or waits for the depth-snapshot event without one),
+        and resyncs after every reconnect.
+
+        Args:
+            pair: Market pair (e.g., 'B-BTC_USDT')
+            depth: Book depth - 10, 20 or 50. Default: 20
+            **kwargs: Passed to LocalOrderBook (e.g., strict_sequence)
+
+        Returns:
+            LocalOrderBook, kept current while the stream runs
+
+        Example:
+            >>> stream = Stream(client=Client())
+            >>> local = stream.orderbook('B-BTC_USDT')
+            >>> stream.connect()
+            >>> local.book.best_bid
+        """
+        book = LocalOrderBook(pair, client=self.client, depth=depth, **kwargs)
+        subscription = self.subscribe_depth(pair, book.handle, depth)
+        return self._track(book, subscription)
+
+    def subscribe_futures_account(
+        self,
+        callback: Optional[Callable[[str, List[Dict[str, Any]]], Any]] = None,
+        **options: Any,
+    ) -> Subscription:
+        """
+        Subscribe to futures position, order and balance updates
+
+        Joins the private channel, signed with the API secret. Messages are
+        lists in the shape of the REST responses (see parse_account_event):
+        positions as in list_positions(), orders as in
+        list_futures_orders(), futures wallet balances as in
+        get_futures_wallets().
+
+        Args:
+            callback (optional): Called as callback(event, records)
+            **options: Passed to subscribe() (maxsize, policy, key, inline)
+
+        Returns:
+            Subscription
+
+        Raises:
+            CoinDCXAuthenticationException: If API credentials are missing
+
+        Example:
+            >>> stream = Stream(api_key='...', api_secret='...')
+            >>> def on_account(event, records):
+            ...     for record in records:
+            ...         print(event, record.get('pair'), record.get('status'))
+            >>> stream.subscribe_futures_account(on_account)
+            >>> stream.connect()
+        """
+        return self.subscribe(
+            PRIVATE_CHANNEL,
+            ACCOUNT_EVENTS,
+            callback,
+            transform=self._parse_account_event,
+            **options,
+        )
+
+    def _parse_account_event(self, event: str, message: Any) -> List[Dict[str, Any]]:
+        return parse_account_event(event, message, self.json_codec.loads)
+
+    def futures_account(self, **kwargs: Any) -> FuturesAccount:
+        """
+        Track futures positions, open orders and balances from the stream
+
+        The account loads a REST snapshot through the stream's client once
+        connected, applies every account event, and resyncs after every
+        reconnect.
+
+        Args:
+            **kwargs: Passed to FuturesAccount (e.g., margin_currencies,
+                on_change)
+
+        Returns:
+            FuturesAccount, kept current while the stream runs
+
+        Raises:
+            CoinDCXAuthenticationException: If API credentials are missing
+        """
+        account = FuturesAccount(client=self.client, **kwargs)
+        subscription = self.subscribe_futures_account(account.handle)
+        return self._track(account, subscription)
+
+    def _track(self, tracker: Any, subscription: Subscription) -> Any:
+        """Sync a snapshot-backed tracker now if connected, and on every connect"""
+        with self._lock:
+            self._trackers.append((tracker, subscription))
+        if self.connected and tracker.client is not None:
+            self._run(subscription._call_soon(tracker.sync))
+        return tracker
+
+    def stats(self) -> Dict[str, Dict[str, Any]]:
+        """
+        Get delivery and queue metrics of every subscription
+
+        Returns:
+            Dictionary of Subscription.stats() keyed by channel; further
+            subscriptions to the same channel are keyed 'channel#2', ...
+
+        Example:
+            >>> for channel, stats in stream.stats().items():
+            ...     print(channel, stats['policy'], stats.get('dropped'), stats.get('depth'))
+        """
+        stats: Dict[str, Dict[str, Any]] = {}
+        for subscription in self._subscriptions:
+            name, count = subscription.channel, 1
+            while name in stats:
+                count += 1
+                name = f"{subscription.channel}#{count}"
+            stats[name] = subscription.stats()
+        return stats
+
+    def wait(self):
+        """Block until the connection is closed"""
+        self.sio.wait()
+
+    def close(self):
+        """Disconnect and end every subscription's iterator"""
+        if self._sio is not None:
+            self._sio.disconnect()
+        for subscription in self._subscriptions:
+            subscription._close()
+
+    def __enter__(self):
+        """Context manager entry; connects the stream"""
+        return self.connect()
+
+    def __exit__(self, exc_type, exc_val, exc_tb):
+        """Context manager exit; closes the stream"""
+        self.close()
+
+    def __repr__(self):
+        state = 'connected' if self.connected else 'disconnected'
+        return f"{type(self).__name__}({self.url} {state} channels={len(self.channels)})"
+
+
+class AsyncStream(Stream):
+    """
+    asyncio variant of Stream
+
+    Same constructor and subscribe methods; connect(), wait() and close()
+    are coroutines, callbacks may be coroutine functions, and subscriptions
+    without a callback are read with async for. Pass an AsyncClient as
+    client for order book snapshots. Create the stream and its
+    subscriptions inside the running event loop.
+
+    Example:
+        >>> async with AsyncStream() as stream:
+        ...     async for event, trade in stream.subscribe_trades('B-BTC_USDT'):
+        ...         print(trade['p'], trade['q'])
+    """
+
+    def _create_socket(self) -> Any:
+        """Create the python-socketio asyncio client"""
+        socketio = _import_socketio()
+        return socketio.AsyncClient(
+            reconnection=self.reconnection,
+            reconnection_delay=self.reconnection_delay,
+            reconnection_delay_max=self.reconnection_delay_max,
+        )
+
+    def _new_queue(self, maxsize: int, policy: str, key: Callable[[Any], Hashable]) -> Any:
+        """Create a subscription's bounded asyncio queue"""
+        return AsyncEventQueue(maxsize, policy, key)
+
+    def _start_worker(self, subscription: Subscription):
+        """Run a queued subscription's callback in its own task"""
+        subscription._worker = asyncio.ensure_future(subscription._work_async())
+
+    def _register(self, event: str):
+        """Route a Socket.IO event name to _dispatch (handlers run on the event loop, one at a time)"""
+        async def handler(payload=None):
+            await self._dispatch(event, payload)
+
+        self._sio.on(event, handler)
+
+    async def _dispatch(self, event: str, payload: Any):
+        """Deliver one Socket.IO event to its subscriptions, awaiting async callbacks and queue puts"""
+        message, subscriptions = self._matching(event, payload)
+        for subscription in subscriptions:
+            result = subscription._deliver(event, message)
+            if inspect.isawaitable(result):
+                await result
+
+    async def _on_connect(self):
+        """Join every channel and bring tracked state back in sync (awaits snapshots)"""
+        self.connects += 1
+        for channel in self.channels:
+            await self.sio.emit('join', self._join_payload(channel))
+        for tracker, subscription in list(self._trackers):
+            action = self._tracker_action(tracker)
+            if action is None:
+                continue
+            result = subscription._call_soon(action)
+            if inspect.isawaitable(result):
+                await result
+
+    async def connect(self) -> 'AsyncStream':
+        """
+        Open the connection and join every subscribed channel (awaitable)
+
+        Returns:
+            The stream itself
+        """
+        await self.sio.connect(self.url, transports=['websocket'])
+        return self
+
+    def _emit(self, event: str, data: Any) -> Any:
+        """Schedule a message on the socket; returns the task"""
+        return asyncio.ensure_future(self.sio.emit(event, data))
+
+    def _run(self, result: Any) -> Any:
+        """Schedule the awaitable result of a tracker's sync as a task"""
+        if inspect.isawaitable(result):
+            return asyncio.ensure_future(result)
+        return result
+
+    async def unsubscribe(self, subscription: Subscription):
+        """
+        Stop a subscription, leaving its channel if nothing else uses it (awaitable)
+
+        Args:
+            subscription: Subscription returned by subscribe()
+        """
+        if self._remove(subscription) and self.connected:
+            await self.sio.emit('leave', self._join_payload(subscription.channel))
+        subscription._close()
+
+    async def wait(self):
+        """Wait until the connection is closed (awaitable)"""
+        await self.sio.wait()
+
+    async def close(self):
+        """Disconnect and end every subscription's iterator (awaitable)"""
+        if self._sio is not None:
+            await self._sio.disconnect()
+        for subscription in self._subscriptions:
+            subscription._close()
+
+    async def __aenter__(self):
+        """Async context manager entry; connects the stream"""
+        return await self.connect()
+
+    async def __aexit__(self, exc_type, exc_val, exc_tb):
+        """Async context manager exit; closes the stream"""
+        await self.close()
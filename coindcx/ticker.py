@@ -0,0 +1,211 @@
+"""
+CoinDCX Ticker Tracking
+
+Keeps the last ticker snapshot indexed by market and reports only the
+markets that changed on each refresh, with an optional columnar view for
+vectorized scans.
+"""
+
+from operator import itemgetter
+from typing import Any, Dict, Iterable, List, Optional, Sequence, Set
+
+from .endpoints.utils import then
+
+
+# Ticker fields compared to decide whether a market changed
+DEFAULT_TICKER_FIELDS = ('last_price', 'bid', 'ask', 'volume')
+
+# Numeric ticker fields exposed by TickerTracker.arrays()
+TICKER_ARRAY_FIELDS = (
+    'last_price', 'bid', 'ask', 'volume', 'high', 'low', 'change_24_hour', 'timestamp',
+)
+
+
+def _to_float(value: Any) -> float:
+    """Parse a ticker value, mapping missing or malformed values to NaN"""
+    try:
+        return float(value)
+    except (TypeError, ValueError):
+        return float('nan')
+
+
+class TickerTracker:
+    """
+    Change-only view of get_ticker()
+
+    Holds the latest ticker for every market. Each update compares the
+    tracked fields of the new tickers against the stored ones (as raw
+    values, without parsing) and returns just the markets that moved.
+
+    Args:
+        client (Client, optional): Client used by refresh(). Default: a new
+            public Client
+        fields (sequence, optional): Ticker fields that count as a change.
+            Default: DEFAULT_TICKER_FIELDS (last_price, bid, ask, volume)
+
+    Example:
+        >>> tracker = TickerTracker(client)
+        >>> tracker.refresh()                 # first call: every market
+        >>> changed = tracker.refresh()       # later calls: only movers
+        >>> for market, ticker in changed.items():
+        ...     print(market, ticker['last_price'])
+    """
+
+    def __init__(self, client: Optional[Any] = None, fields: Sequence[str] = DEFAULT_TICKER_FIELDS):
+        self._client = client
+        self.fields = tuple(fields)
+        self._key = itemgetter(*self.fields)
+        self._tickers: Dict[str, Dict[str, Any]] = {}
+        self._keys: Dict[str, Any] = {}
+        self.removed: Set[str] = set()
+
+        # Columnar view, built on first arrays() call and then patched in place
+        self._rows: Dict[str, int] = {}
+        self._columns: Optional[Dict[str, Any]] = None
+        self._dirty: Set[str] = set()
+
+    @property
+    def client(self) -> Any:
+        """Client used by refresh(), created on first access"""
+        if self._client is None:
+            from .client import Client
+            self._client = Client()
+        return self._client
+
+    def _ticker_key(self, ticker: Dict[str, Any]) -> Any:
+        """Get the tracked field values of a ticker"""
+        try:
+            return self._key(ticker)
+        except KeyError:
+            return tuple(ticker.get(field) for field in self.fields)
+
+    def update(self, tickers: Iterable[Dict[str, Any]]) -> Dict[str, Dict[str, Any]]:
+        """
+        Apply a full ticker snapshot
+
+        Args:
+            tickers: List of ticker dicts as returned by get_ticker()
+
+        Returns:
+            Dictionary mapping market to its new ticker, for markets that are
+            new or whose tracked fields changed. Markets missing from the
+            snapshot are dropped and listed in the removed attribute.
+        """
+        previous = self._keys
+        stored = self._tickers
+        keys: Dict[str, Any] = {}
+        changed: Dict[str, Dict[str, Any]] = {}
+        ticker_key = self._ticker_key
+
+        for ticker in tickers:
+            market = ticker['market']
+            key = ticker_key(ticker)
+            keys[market] = key
+            if previous.get(market) != key:
+                changed[market] = ticker
+            stored[market] = ticker
+
+        # Same size and nothing new or changed means the same set of markets
+        if len(keys) != len(previous) or changed:
+            self.removed = previous.keys() - keys.keys()
+        else:
+            self.removed = set()
+        for market in self.removed:
+            del stored[market]
+
+        self._keys = keys
+        if self._columns is not None:
+            self._dirty.update(changed)
+            if self.removed:
+                # Rows are positional; rebuild the view on next access
+                self._columns = None
+        return changed
+
+    def refresh(self) -> Any:
+        """
+        Fetch the ticker and apply it
+
+        Returns:
+            Changed markets, as for update() (an awaitable resolving to them
+            with an AsyncClient)
+        """
+        return then(self.client.get_ticker(), self.update)
+
+    def __getitem__(self, market: str) -> Dict[str, Any]:
+        return self._tickers[market]
+
+    def __contains__(self, market: str) -> bool:
+        return market in self._tickers
+
+    def get(self, market: str, default: Any = None) -> Any:
+        """Get the latest ticker for a market, or default if unknown"""
+        return self._tickers.get(market, default)
+
+    @property
+    def markets(self) -> List[str]:
+        """Markets in the latest snapshot"""
+        return list(self._tickers)
+
+    @property
+    def tickers(self) -> Dict[str, Dict[str, Any]]:
+        """Latest ticker for every market (do not modify)"""
+        return self._tickers
+
+    def arrays(self) -> Dict[str, Any]:
+        """
+        Get the latest snapshot as NumPy columns
+
+        The view is built once and afterwards only the rows of changed
+        markets are rewritten in place, so calling this every tick is cheap
+        and previously returned arrays stay current until a market is added
+        or removed. Requires numpy.
+
+        Returns:
+            Dictionary with 'market' (object array of market names) and
+            float64 arrays for each of TICKER_ARRAY_FIELDS; missing values
+            are NaN. The arrays are read-only.
+
+        Example:
+            >>> view = tracker.arrays()
+            >>> spread = (view['ask'] - view['bid']) / view['bid']
+            >>> view['market'][spread > 0.01]
+        """
+        from .candles import _import_numpy
+
+        np = _import_numpy()
+
+        if self._columns is None:
+            markets = list(self._tickers)
+            self._rows = {market: row for row, market in enumerate(markets)}
+            columns = {'market': np.array(markets, dtype=object)}
+            for field in TICKER_ARRAY_FIELDS:
+                columns[field] = np.fromiter(
+                    (_to_float(self._tickers[market].get(field)) for market in markets),
+                    dtype=np.float64,
+                    count=len(markets),
+                )
+            self._columns = columns
+            self._dirty.clear()
+
+        elif self._dirty:
+            columns = self._columns
+            new = [market for market in self._dirty if market not in self._rows]
+            if new:
+                start = len(columns['market'])
+                for offset, market in enumerate(new):
+                    self._rows[market] = start + offset
+                columns['market'] = np.concatenate([columns['market'], np.array(new, dtype=object)])
+                for field in TICKER_ARRAY_FIELDS:
+                    columns[field] = np.concatenate([columns[field], np.empty(len(new))])
+
+            dirty = list(self._dirty)
+            rows = np.fromiter((self._rows[market] for market in dirty), dtype=np.intp)
+            for field in TICKER_ARRAY_FIELDS:
+                column = columns[field]
+                column.flags.writeable = True
+                column[rows] = [_to_float(self._tickers[market].get(field)) for market in dirty]
+            self._dirty.clear()
+
+        for column in self._columns.values():
+            column.flags.writeable = False
+        return dict(self._columns)
@@ -0,0 +1,283 @@
+"""
+CoinDCX Trade Tape
+
+Fixed-size ring buffer of recent trades for one pair, filled by polling
+get_trades or get_futures_trade_history with overlap removal and an
+adaptive poll interval.
+"""
+
+import time
+from collections import Counter
+from typing import Any, Callable, Dict, Iterable, List, Optional, Tuple
+
+from .candles import _import_numpy
+from .endpoints.utils import then
+
+
+# Field names of spot (/market_data/trade_history) and futures trade records
+_SPOT_FIELDS = ('T', 'p', 'q', 'm')
+_FUTURES_FIELDS = ('timestamp', 'price', 'quantity', 'is_maker')
+
+
+def trade_dtype() -> Any:
+    """
+    Get the NumPy structured dtype for one trade
+
+    Returns:
+        numpy.dtype with int64 'time' (ms), float64 'price' and 'quantity',
+        and bool 'maker' fields
+    """
+    np = _import_numpy()
+    return np.dtype([
+        ('time', np.int64), ('price', np.float64), ('quantity', np.float64), ('maker', np.bool_),
+    ])
+
+
+def _normalize(trades: Iterable[Dict[str, Any]]) -> List[Tuple[int, float, float, bool]]:
+    """Turn spot or futures trade dicts into (time, price, quantity, maker) tuples"""
+    rows = []
+    for trade in trades:
+        fields = _SPOT_FIELDS if 'T' in trade else _FUTURES_FIELDS
+        rows.append((
+            int(trade[fields[0]]),
+            float(trade[fields[1]]),
+            float(trade[fields[2]]),
+            bool(trade.get(fields[3], False)),
+        ))
+    return rows
+
+
+class TradeTape:
+    """
+    Recent trades for one pair in a fixed-size ring buffer
+
+    Each poll returns an overlapping window of the latest trades. Trades
+    older than the newest one already stored are skipped, and trades at
+    that same millisecond are matched against the ones already stored there,
+    so repeats are dropped without keeping any history in Python objects.
+
+    The poll interval adapts: it halves (down to min_interval) when a poll
+    returns only new trades, meaning the window may have missed some, and
+    grows by half (up to max_interval) when nothing new arrived.
+    Requires numpy.
+
+    Args:
+        pair (str): Market or instrument pair (e.g., 'B-BTC_USDT')
+        client (Client, optional): Client used by poll(). Default: a new
+            public Client
+        futures (bool, optional): Poll get_futures_trade_history instead of
+            get_trades. Default: False
+        capacity (int, optional): Trades kept in the ring. Default: 100000
+        limit (int, optional): Trades requested per spot poll (max 500).
+            Default: 100
+        min_interval (float, optional): Shortest poll interval in seconds.
+            Default: 0.2
+        max_interval (float, optional): Longest poll interval in seconds.
+            Default: 10
+
+    Example:
+        >>> tape = TradeTape('B-BTC_USDT', client=Client())
+        >>> tape.poll()                       # number of new trades
+        >>> recent = tape.last(500)           # structured array, oldest first
+        >>> recent['price'].mean(), recent['quantity'].sum()
+    """
+
+    def __init__(
+        self,
+        pair: str,
+        client: Optional[Any] = None,
+        futures: bool = False,
+        capacity: int = 100000,
+        limit: int = 100,
+        min_interval: float = 0.2,
+        max_interval: float = 10.0,
+    ):
+        if capacity <= 0:
+            raise ValueError("capacity must be positive")
+
+        np = _import_numpy()
+        self.pair = pair
+        self._client = client
+        self.futures = futures
+        self.capacity = capacity
+        self.limit = limit
+        self.min_interval = min_interval
+        self.max_interval = max_interval
+        self.interval = min_interval
+
+        self._ring = np.zeros(capacity, dtype=trade_dtype())
+        self._next = 0
+        self.size = 0
+        self.total = 0
+        self.duplicates = 0
+        self._last_time: Optional[int] = None
+        # Trades stored at _last_time, to recognise repeats at that millisecond
+        self._at_last_time: Counter = Counter()
+
+    @property
+    def client(self) -> Any:
+        """Client used by poll(), created on first access"""
+        if self._client is None:
+            from .client import Client
+            self._client = Client()
+        return self._client
+
+    def extend(self, trades: Iterable[Dict[str, Any]]) -> int:
+        """
+        Add trades from a poll response, skipping ones already stored
+
+        Args:
+            trades: Spot (p, q, T, m) or futures (price, quantity, timestamp,
+                is_maker) trade dicts, in any order
+
+        Returns:
+            Number of new trades stored
+        """
+        np = _import_numpy()
+        rows = sorted(_normalize(trades))
+        last_time = self._last_time
+
+        if last_time is not None:
+            seen = self._at_last_time.copy()
+            fresh = []
+            for row in rows:
+                if row[0] > last_time:
+                    fresh.append(row)
+                elif row[0] == last_time and seen[row[1:]] == 0:
+                    fresh.append(row)
+                elif row[0] == last_time:
+                    seen[row[1:]] -= 1
+            self.duplicates += len(rows) - len(fresh)
+            rows = fresh
+
+        if not rows:
+            return 0
+
+        newest = rows[-1][0]
+        if newest != last_time:
+            self._at_last_time = Counter()
+        self._at_last_time.update(row[1:] for row in rows if row[0] == newest)
+        self._last_time = newest
+
+        new = np.array(rows, dtype=self._ring.dtype)
+        count = len(new)
+        if count >= self.capacity:
+            self._ring[:] = new[-self.capacity:]
+            self._next = 0
+        else:
+            positions = (self._next + np.arange(count)) % self.capacity
+            self._ring[positions] = new
+            self._next = (self._next + count) % self.capacity
+
+        self.size = min(self.capacity, self.size + count)
+        self.total += count
+        return count
+
+    def _adapt(self, received: int, new: int):
+        """Adjust the poll interval from the last poll's overlap"""
+        if received and new >= received:
+            self.interval = max(self.min_interval, self.interval / 2)
+        elif new == 0:
+            self.interval = min(self.max_interval, self.interval * 1.5)
+
+    def _on_response(self, trades: List[Dict[str, Any]]) -> int:
+        """Add a polled batch of trades and adapt the poll interval; returns the new count"""
+        new = self.extend(trades or [])
+        self._adapt(len(trades or []), new)
+        return new
+
+    def poll(self) -> Any:
+        """
+        Fetch the latest trades once and store the new ones
+
+        Returns:
+            Number of new trades (an awaitable resolving to it with an
+            AsyncClient). Also updates interval.
+        """
+        if self.futures:
+            response = self.client.get_futures_trade_history(self.pair)
+        else:
+            response = self.client.get_trades(self.pair, self.limit)
+        return then(response, self._on_response)
+
+    def run(
+        self,
+        on_trades: Optional[Callable[[Any], Any]] = None,
+        stop: Optional[Any] = None,
+        duration: Optional[float] = None,
+    ):
+        """
+        Poll in a loop, sleeping the adaptive interval between polls
+
+        Args:
+            on_trades: Called with a structured array of the new trades
+                after each poll that found some
+            stop: threading.Event that ends the loop when set
+            duration: Stop after this many seconds
+        """
+        deadline = None if duration is None else time.monotonic() + duration
+        while not (stop is not None and stop.is_set()):
+            new = self.poll()
+            if new and on_trades is not None:
+                on_trades(self.last(new))
+            if deadline is not None and time.monotonic() >= deadline:
+                return
+            if stop is not None:
+                stop.wait(self.interval)
+            else:
+                time.sleep(self.interval)
+
+    async def run_async(
+        self,
+        on_trades: Optional[Callable[[Any], Any]] = None,
+        duration: Optional[float] = None,
+    ):
+        """
+        Coroutine version of run() for use with AsyncClient
+
+        Cancel the task to stop it.
+
+        Args:
+            on_trades: Called with a structured array of the new trades
+            duration: Stop after this many seconds
+        """
+        import asyncio
+
+        deadline = None if duration is None else time.monotonic() + duration
+        while True:
+            new = await self.poll()
+            if new and on_trades is not None:
+                on_trades(self.last(new))
+            if deadline is not None and time.monotonic() >= deadline:
+                return
+            await asyncio.sleep(self.interval)
+
+    def last(self, n: Optional[int] = None) -> Any:
+        """
+        Get the most recent trades, oldest first
+
+        Args:
+            n: Number of trades (default: all stored)
+
+        Returns:
+            Structured array with time, price, quantity and maker fields.
+            A read-only view of the ring when the trades are contiguous in
+            it, otherwise a copy.
+        """
+        np = _import_numpy()
+        n = self.size if n is None else max(0, min(n, self.size))
+        start = (self._next - n) % self.capacity
+
+        if n == 0:
+            return self._ring[:0]
+        if start + n <= self.capacity:
+            view = self._ring[start:start + n]
+            view.flags.writeable = False
+            return view
+        return np.concatenate([self._ring[start:], self._ring[:self._next]])
+
+    def __repr__(self):
+        return (
+            f"TradeTape({self.pair} size={self.size}/{self.capacity} "
+            f"last_time={self._last_time} interval={self.interval:.2f}s)"
+        )
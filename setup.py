@@ -37,6 +37,12 @@ setup(
     ],
     python_requires=">=3.7",
     install_requires=requirements,
+    extras_require={
+        "async": ["aiohttp>=3.8"],
+        "fast": ["orjson>=3.6"],
+        "numpy": ["numpy>=1.17"],
+        "stream": ["python-socketio[client]>=4.6,<5"],
+    },
     keywords="coindcx api trading cryptocurrency bitcoin ethereum futures spot margin",
     project_urls={
         "Bug Reports": "https://github.com/svamja/coindcx-python/issues",